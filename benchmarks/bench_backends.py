@@ -0,0 +1,62 @@
+"""Benchmark the board storage backends against each other.
+
+Times, for the byte-buffer `Board` and the big-integer `BitBoard`:
+neighbor counting, the first click (mine placement, counts and the
+opening flood fill) and a run of random clicks on the same layout.
+
+Usage:
+    python benchmarks/bench_backends.py [--clicks N]
+"""
+
+import argparse
+import random
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+from common import BOARD_SIZES, bestOf, repeatsFor, formatSeconds, printTable
+
+from core.board import BOARD_BACKENDS, createBoard
+
+# Besides the shared sizes, a sparse board where the first click opens most of it
+SIZES = BOARD_SIZES + [("1000x1000 sparse", 1000, 1000, 2_000)]
+
+
+def firstClick(backend, rows, cols, mines):
+    board = createBoard(rows, cols, mines, seed=0, backend=backend)
+    board.revealTile(rows // 2, cols // 2)
+    return board
+
+
+def randomClicks(backend, rows, cols, mines, clicks):
+    board = firstClick(backend, rows, cols, mines)
+    rng = random.Random(1)
+    for _ in range(clicks):
+        row, col = rng.randrange(rows), rng.randrange(cols)
+        if rng.random() < 0.2:
+            board.toggleFlag(row, col)
+        elif board.getTile(row, col).isMine:
+            board.toggleFlag(row, col)
+        else:
+            board.revealTile(row, col)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clicks", type=int, default=200, help="random clicks after the first one")
+    args = parser.parse_args()
+
+    results = []
+    for label, rows, cols, mines in SIZES:
+        repeats = max(1, repeatsFor(rows * cols) // 10)
+        for backend in BOARD_BACKENDS:
+            board = firstClick(backend, rows, cols, mines)
+            counts = bestOf(board.calculateAllNeighbors, repeats)
+            opening = bestOf(lambda: firstClick(backend, rows, cols, mines), repeats)
+            clicks = bestOf(lambda: randomClicks(backend, rows, cols, mines, args.clicks), 1) - opening
+            results.append((label, backend, formatSeconds(counts), formatSeconds(opening),
+                            formatSeconds(max(0.0, clicks) / args.clicks)))
+
+    printTable(("Board", "Backend", "Neighbor counts", "First click", "Per click"), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Benchmark bulk layout generation against building one Board per layout.
+
+Usage:
+    python benchmarks/bench_batch.py [--count N]
+"""
+
+import argparse
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+from common import BOARD_SIZES, bestOf, formatSeconds, printTable
+
+from core.batch import generateLayouts
+from core.board import Board
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10_000, help="layouts per board size")
+    args = parser.parse_args()
+
+    results = []
+    for label, rows, cols, mines in BOARD_SIZES[:2]:
+        firstRow, firstCol = rows // 2, cols // 2
+
+        def perBoard():
+            for seed in range(args.count):
+                board = Board(rows, cols, mines, seed=seed)
+                board.placeMines(firstRow, firstCol)
+
+        def batched():
+            generateLayouts(rows, cols, mines, firstRow, firstCol, args.count, seed=0)
+
+        boardTime = bestOf(perBoard, 1)
+        batchTime = bestOf(batched, 3)
+        results.append((label, f"{args.count:,}", formatSeconds(boardTime), formatSeconds(batchTime),
+                        f"{args.count / boardTime:,.0f}", f"{args.count / batchTime:,.0f}"))
+
+    printTable(("Board", "Layouts", "Board each", "Batch", "Boards/s", "Batch layouts/s"), results)
+
+
+if __name__ == "__main__":
+    main()
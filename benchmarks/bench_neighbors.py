@@ -0,0 +1,80 @@
+"""Benchmark neighbor-count computation for whole boards.
+
+Compares the original per-cell loop (nine `isValid` checks per cell) with
+the single-pass implementations behind `Board.calculateAllNeighbors`.
+
+Usage:
+    python benchmarks/bench_neighbors.py [--skip-loop-above CELLS]
+"""
+
+import argparse
+import random
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+from common import BOARD_SIZES, bestOf, repeatsFor, formatSeconds, printTable
+
+import core.board as boardModule
+from core.board import Board
+
+
+def loopNeighborCounts(board):
+    """The original calculateAllNeighbors: countNeighbors via isValid per cell."""
+    mines = board.mines
+    cols = board.cols
+    counts = board.neighborCounts
+    for r in range(board.rows):
+        for c in range(cols):
+            if mines[r * cols + c]:
+                continue
+            count = 0
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    if dr == 0 and dc == 0:
+                        continue
+                    nr, nc = r + dr, c + dc
+                    if board.isValid(nr, nc) and mines[nr * cols + nc]:
+                        count += 1
+            counts[r * cols + c] = count
+
+
+def randomBoard(rows, cols, mines, seed=0):
+    """Board with a random mine mask and no first-click handling."""
+    board = Board(rows, cols, mines)
+    rng = random.Random(seed)
+    for i in rng.sample(range(rows * cols), mines):
+        board.mines[i] = 1
+    return board
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skip-loop-above", type=int, default=None, metavar="CELLS",
+                        help="skip the per-cell loop on boards larger than this")
+    args = parser.parse_args()
+
+    results = []
+    for label, rows, cols, mines in BOARD_SIZES:
+        board = randomBoard(rows, cols, mines)
+        cells = rows * cols
+        repeats = repeatsFor(cells)
+        out = bytearray(cells)
+
+        shifted = bestOf(lambda: boardModule._neighborCountsShifted(board.mines, rows, cols, out), repeats)
+        vectorized = None
+        if boardModule.np is not None:
+            vectorized = bestOf(lambda: boardModule._neighborCountsNumpy(board.mines, rows, cols, out), repeats)
+
+        loop = None
+        if args.skip_loop_above is None or cells <= args.skip_loop_above:
+            loop = bestOf(lambda: loopNeighborCounts(board), max(1, repeats // 10))
+
+        fastest = min(t for t in (shifted, vectorized) if t is not None)
+        speedup = f"{loop / fastest:.0f}x" if loop else "-"
+        results.append((label, f"{cells:,}", formatSeconds(loop), formatSeconds(shifted),
+                        formatSeconds(vectorized), speedup))
+
+    printTable(("Board", "Cells", "Loop", "Shifted (Python)", "NumPy", "Speedup"), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark mine placement time and peak memory.
+
+Compares the original approach (a list of every free `(row, col)` tuple
+fed to `random.sample`) with `placeMineMask`, which works on flat indices.
+
+Usage:
+    python benchmarks/bench_placement.py
+"""
+
+import random
+import tracemalloc
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+from common import BOARD_SIZES, bestOf, repeatsFor, formatSeconds, printTable
+
+from core.board import placeMineMask
+
+
+# Extra cases that exercise the dense (Fisher-Yates) placement paths
+PLACEMENT_SIZES = BOARD_SIZES + [
+    ("500x500 50%", 500, 500, 125_000),
+    ("500x500 90%", 500, 500, 225_000),
+]
+
+
+def legacyPlacement(mines, rows, cols, mineCount, excludeRow, excludeCol):
+    """The original placeMines: enumerate free tuples, then random.sample."""
+    safePositions = set()
+    for dr in (-1, 0, 1):
+        for dc in (-1, 0, 1):
+            r, c = excludeRow + dr, excludeCol + dc
+            if 0 <= r < rows and 0 <= c < cols:
+                safePositions.add((r, c))
+
+    availablePositions = []
+    for r in range(rows):
+        for c in range(cols):
+            if (r, c) not in safePositions:
+                availablePositions.append((r, c))
+
+    for r, c in random.sample(availablePositions, mineCount):
+        mines[r * cols + c] = 1
+
+
+def peakMemory(func):
+    """Peak bytes allocated by one call to `func`, as seen by tracemalloc."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def formatBytes(count):
+    if count < 1024 * 1024:
+        return f"{count / 1024:.1f} KiB"
+    return f"{count / (1024 * 1024):.1f} MiB"
+
+
+def main():
+    results = []
+    for label, rows, cols, mineCount in PLACEMENT_SIZES:
+        cells = rows * cols
+        repeats = repeatsFor(cells)
+        clickRow, clickCol = rows // 2, cols // 2
+
+        def runLegacy():
+            legacyPlacement(bytearray(cells), rows, cols, mineCount, clickRow, clickCol)
+
+        def runLinear():
+            placeMineMask(bytearray(cells), rows, cols, mineCount, clickRow, clickCol)
+
+        legacyTime = bestOf(runLegacy, max(1, repeats // 4))
+        linearTime = bestOf(runLinear, repeats)
+        # The mask itself is the same for both; report what each adds on top
+        legacyPeak = peakMemory(runLegacy) - cells
+        linearPeak = peakMemory(runLinear) - cells
+
+        results.append((label, f"{mineCount:,}", formatSeconds(legacyTime), formatSeconds(linearTime),
+                        f"{legacyTime / linearTime:.1f}x", formatBytes(legacyPeak), formatBytes(linearPeak)))
+
+    printTable(("Board", "Mines", "Legacy", "Linear", "Speedup", "Legacy peak", "Linear peak"), results)
+
+
+if __name__ == "__main__":
+    main()
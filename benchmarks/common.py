@@ -0,0 +1,57 @@
+"""Shared helpers for the benchmark scripts.
+
+Importing this module puts the repository root on `sys.path` so the
+scripts can be run directly, e.g. `python benchmarks/bench_neighbors.py`.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+# Board shapes used across benchmarks: (label, rows, cols, mines)
+BOARD_SIZES = [
+    ("Easy", 9, 9, 10),
+    ("Hard", 16, 30, 99),
+    ("500x500", 500, 500, 50_000),
+    ("2000x2000", 2000, 2000, 800_000),
+]
+
+
+def bestOf(func, repeats):
+    """Run `func` `repeats` times and return the fastest wall time in seconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def repeatsFor(cells, budget=2_000_000):
+    """Pick a repeat count so small boards are timed over several runs."""
+    return max(1, min(200, budget // max(1, cells)))
+
+
+def formatSeconds(seconds):
+    """Format a duration with a unit that keeps 3 significant digits."""
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def printTable(headers, rows):
+    """Print rows as a left-aligned plain-text table."""
+    widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *rows)]
+    line = "  ".join(f"{{:<{w}}}" for w in widths)
+    print(line.format(*headers))
+    print(line.format(*("-" * w for w in widths)))
+    for row in rows:
+        print(line.format(*row))
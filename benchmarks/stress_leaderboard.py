@@ -0,0 +1,109 @@
+"""Stress the leaderboard backends with concurrent writer processes.
+
+Starts several processes that each add scores to one shared leaderboard
+while one more process keeps reading it, then checks that every score was
+stored exactly once. The processes all start on an empty directory, so
+they also race to create the files. The JSON storage runs with a small compaction
+interval, so compactions keep racing with other writers' appends, and
+with `maxEntries` large enough to keep every score.
+
+Usage:
+    python benchmarks/stress_leaderboard.py [--processes N] [--scores N]
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+from common import formatSeconds, printTable
+
+from utils.leaderboard_storage import LEADERBOARD_BACKENDS, LeaderboardStorage
+
+
+def openStorage(backend, directory, maxEntries):
+    if backend == "json":
+        # Check the files on every read, so the reader sees each change
+        return LeaderboardStorage(Path(directory) / "leaderboard.json", statIntervalMs=0,
+                                  maxEntries=maxEntries, compactEvery=16)
+    from utils.leaderboard_sqlite import SQLiteLeaderboardStorage
+    return SQLiteLeaderboardStorage(Path(directory) / "leaderboard.db", jsonPath=Path(directory) / "none.json")
+
+
+def writer(backend, directory, maxEntries, worker, scores, start):
+    storage = openStorage(backend, directory, maxEntries)
+    start.wait()
+    for i in range(scores):
+        storage.addScore({
+            "score": worker * scores + i,
+            "difficulty": "Easy",
+            "time_elapsed": i,
+            "entry_id": f"{worker}-{i}",
+        })
+
+
+def reader(backend, directory, maxEntries, start, stop, reads):
+    storage = openStorage(backend, directory, maxEntries)
+    start.wait()
+    count = 0
+    while not stop.is_set():
+        storage.getTopScores()
+        count += 1
+    reads.value = count
+
+
+def stress(backend, processes, scores):
+    """Run one stress round; return (elapsed seconds, stored entry ids, reads)."""
+    total = processes * scores
+    with tempfile.TemporaryDirectory() as directory:
+        start = multiprocessing.Event()
+        stop = multiprocessing.Event()
+        reads = multiprocessing.Value("i", 0)
+        writers = [
+            multiprocessing.Process(target=writer, args=(backend, directory, total, worker, scores, start))
+            for worker in range(processes)
+        ]
+        readerProcess = multiprocessing.Process(target=reader, args=(backend, directory, total, start, stop, reads))
+        for process in writers + [readerProcess]:
+            process.start()
+
+        began = time.perf_counter()
+        start.set()
+        for process in writers:
+            process.join()
+        elapsed = time.perf_counter() - began
+        stop.set()
+        readerProcess.join()
+
+        storage = openStorage(backend, directory, total)
+        entryIds = [entry.get("entry_id") for entry in storage.load()]
+    return elapsed, entryIds, reads.value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=8, help="concurrent writer processes")
+    parser.add_argument("--scores", type=int, default=200, help="scores added by each writer")
+    args = parser.parse_args()
+
+    expected = {f"{worker}-{i}" for worker in range(args.processes) for i in range(args.scores)}
+    results = []
+    failed = False
+    for backend in LEADERBOARD_BACKENDS:
+        elapsed, entryIds, reads = stress(backend, args.processes, args.scores)
+        lost = len(expected - set(entryIds))
+        duplicated = len(entryIds) - len(set(entryIds))
+        failed = failed or lost or duplicated
+        results.append((backend, len(expected), lost, duplicated,
+                        f"{len(expected) / elapsed:,.0f}/s", formatSeconds(elapsed / len(expected)),
+                        f"{reads / elapsed:,.0f}/s"))
+
+    printTable(("Backend", "Scores", "Lost", "Duplicated", "Writes", "Per write", "Reads"), results)
+    if failed:
+        raise SystemExit("FAILED: scores were lost or duplicated")
+
+
+if __name__ == "__main__":
+    main()
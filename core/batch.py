@@ -0,0 +1,132 @@
+"""Bulk generation of mine layouts for simulation and benchmarking.
+
+`generateLayouts` produces many layouts for one board shape and first
+click. Mine masks and neighbor counts come back as stacked arrays, and any
+single layout can be turned into a playable `Board` with
+`LayoutBatch.toBoard`.
+"""
+
+import random
+
+from .board import Board, boxNeighborCounts, computeNeighborCounts, placeMineMask, np, _seedSource
+
+# Upper bound on random keys drawn per NumPy chunk (keeps memory flat)
+CHUNK_KEYS = 4_000_000
+
+
+class LayoutBatch:
+    """A stack of mine layouts sharing the same shape and first click.
+
+    With NumPy installed, `mines` and `neighborCounts` are uint8 arrays of
+    shape (count, rows, cols). Without it, they are flat bytearrays holding
+    `count` row-major layouts back to back.
+    """
+
+    def __init__(self, rows, cols, mineCount, firstRow, firstCol, seed, mines, neighborCounts):
+        self.rows = rows
+        self.cols = cols
+        self.mineCount = mineCount
+        self.firstRow = firstRow
+        self.firstCol = firstCol
+        self.seed = seed
+        self.mines = mines
+        self.neighborCounts = neighborCounts
+
+    def __len__(self):
+        cells = self.rows * self.cols
+        return len(self.mines) if np is not None else len(self.mines) // max(1, cells)
+
+    def layoutMines(self, index):
+        """Return the row-major mine mask of one layout as a bytes-like object."""
+        return self._layout(self.mines, index)
+
+    def layoutCounts(self, index):
+        """Return the row-major neighbor counts of one layout."""
+        return self._layout(self.neighborCounts, index)
+
+    def _layout(self, data, index):
+        if np is not None:
+            return data[index].tobytes()
+        cells = self.rows * self.cols
+        return memoryview(data)[index * cells:(index + 1) * cells]
+
+    def toBoard(self, index):
+        """Return a playable `Board` holding layout `index`.
+
+        The board already has its mines, so reveal `(firstRow, firstCol)`
+        first to get the safe opening the layout was generated for.
+        """
+        return Board.fromLayout(self.rows, self.cols, self.mineCount,
+                                self.layoutMines(index), self.layoutCounts(index))
+
+
+def generateLayouts(rows, cols, mineCount, firstRow, firstCol, count, seed=None):
+    """Generate `count` layouts with a safe 3x3 zone around the first click.
+
+    The result is deterministic for a given seed. The NumPy and pure-Python
+    paths use different generators, so the same seed gives different
+    layouts on each.
+
+    Args:
+        rows: Number of board rows.
+        cols: Number of board columns.
+        mineCount: Mines per layout.
+        firstRow: Row of the first click.
+        firstCol: Column of the first click.
+        count: Number of layouts to generate.
+        seed: Optional integer seed; a random one is drawn when omitted.
+
+    Returns:
+        LayoutBatch with the layouts.
+
+    Raises:
+        ValueError: If the mines do not fit outside the safe zone.
+    """
+    if seed is None:
+        seed = _seedSource.getrandbits(32)
+    if np is not None:
+        mines, counts = _generateNumpy(rows, cols, mineCount, firstRow, firstCol, count, seed)
+    else:
+        mines, counts = _generatePython(rows, cols, mineCount, firstRow, firstCol, count, seed)
+    return LayoutBatch(rows, cols, mineCount, firstRow, firstCol, seed, mines, counts)
+
+
+def _generateNumpy(rows, cols, mineCount, firstRow, firstCol, count, seed):
+    """Pick mines for a chunk of layouts at once via argpartition of random keys."""
+    cells = rows * cols
+    free = np.ones((rows, cols), dtype=bool)
+    free[max(0, firstRow - 1):firstRow + 2, max(0, firstCol - 1):firstCol + 2] = False
+    freeIndices = np.flatnonzero(free)
+    if len(freeIndices) < mineCount:
+        raise ValueError(f"Cannot place {mineCount} mines on {rows}x{cols} board with safe zone")
+
+    generator = np.random.default_rng(seed)
+    mines = np.zeros((count, cells), dtype=np.uint8)
+    if mineCount == len(freeIndices):
+        mines[:, freeIndices] = 1
+    elif mineCount:
+        chunk = max(1, CHUNK_KEYS // len(freeIndices))
+        for start in range(0, count, chunk):
+            stop = min(count, start + chunk)
+            keys = generator.random((stop - start, len(freeIndices)), dtype=np.float32)
+            picks = np.argpartition(keys, mineCount - 1, axis=1)[:, :mineCount]
+            mines[np.arange(start, stop)[:, None], freeIndices[picks]] = 1
+
+    mines = mines.reshape(count, rows, cols)
+    return mines, boxNeighborCounts(mines)
+
+
+def _generatePython(rows, cols, mineCount, firstRow, firstCol, count, seed):
+    """Place and count each layout in turn straight into shared buffers."""
+    cells = rows * cols
+    rng = random.Random(seed)
+    mines = bytearray(count * cells)
+    counts = bytearray(count * cells)
+    for i in range(count):
+        mask = bytearray(cells)
+        placeMineMask(mask, rows, cols, mineCount, firstRow, firstCol, rng)
+        mines[i * cells:(i + 1) * cells] = mask
+        out = bytearray(cells)
+        computeNeighborCounts(mask, rows, cols, out)
+        counts[i * cells:(i + 1) * cells] = out
+    return mines, counts
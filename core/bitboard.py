@@ -0,0 +1,390 @@
+"""Board backend storing cell state as Python big-integer bitmasks.
+
+`BitBoard` keeps the mine, revealed and flagged state of every cell as one
+bit of an arbitrary-precision integer each. Bit `row * stride + col` holds
+cell (row, col), with `stride = cols + 1`: the extra guard column is always
+zero, so shifting a mask sideways can never wrap a cell into the next row.
+
+Neighbor counts, flood fills and reveal bookkeeping then become a handful
+of whole-board shifts, ANDs and ORs that run in C, with no extra
+dependencies. The public interface matches `Board`, so `createBoard` can
+hand out either backend.
+"""
+
+import random
+import re
+
+from .board import BoardBase, placeMineMask
+from .tile import TileGrid
+from .state import GameState, TileState
+
+# Maps a 0/1 byte mask to ASCII digits for int(..., 2)
+_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+# A run of set bits in a mask written out as a binary string
+_SET_RUN = re.compile("1+")
+
+
+def _popcount(mask):
+    return bin(mask).count("1")
+
+
+class BitTileView:
+    """Lightweight view of one cell of a `BitBoard`, with the `Tile` API."""
+
+    __slots__ = ("board", "bit", "row", "col")
+
+    def __init__(self, board, row, col):
+        self.board = board
+        self.row = row
+        self.col = col
+        self.bit = 1 << (row * board.stride + col)
+
+    @property
+    def isMine(self):
+        return bool(self.board.mines & self.bit)
+
+    @isMine.setter
+    def isMine(self, value):
+        self.board.mines = self.board.mines | self.bit if value else self.board.mines & ~self.bit
+
+    @property
+    def isRevealed(self):
+        return bool(self.board.revealed & self.bit)
+
+    @isRevealed.setter
+    def isRevealed(self, value):
+        self.board.revealed = self.board.revealed | self.bit if value else self.board.revealed & ~self.bit
+
+    @property
+    def isFlagged(self):
+        return bool(self.board.flagged & self.bit)
+
+    @isFlagged.setter
+    def isFlagged(self, value):
+        self.board.flagged = self.board.flagged | self.bit if value else self.board.flagged & ~self.bit
+
+    @property
+    def neighborCount(self):
+        return self.board.neighborCountAt(self.row, self.col)
+
+    def reveal(self):
+        """Reveal the tile.
+
+        Returns True if the tile was a mine (exploded), False otherwise.
+        """
+        board = self.board
+        if (board.revealed | board.flagged) & self.bit:
+            return False
+        board.revealed |= self.bit
+        return bool(board.mines & self.bit)
+
+    def toggleFlag(self):
+        """Toggle flag state and return the new flag value."""
+        board = self.board
+        if not board.revealed & self.bit:
+            board.flagged ^= self.bit
+        return bool(board.flagged & self.bit)
+
+    def __eq__(self, other):
+        if not isinstance(other, BitTileView):
+            return NotImplemented
+        return self.board is other.board and self.bit == other.bit
+
+    def __hash__(self):
+        return hash((id(self.board), self.row, self.col))
+
+    def __repr__(self):
+        return (
+            f"Tile(r={self.row},c={self.col},mine={self.isMine},"
+            f"rev={self.isRevealed},flag={self.isFlagged},n={self.neighborCount})"
+        )
+
+
+class BitBoard(BoardBase):
+    """Game board backed by big-integer bitmasks; a drop-in for `Board`.
+
+    Construction, seeding and the counter-based win checks come from
+    `BoardBase`, as for `Board`.
+
+    Attributes:
+        mines, revealed, flagged: Cell masks, bit `row * stride + col`.
+        countPlanes: Neighbor counts as four bit planes (bit k of each count).
+        stride: Bits per row, `cols + 1` including the guard column.
+        valid: Mask with every real cell set and every guard bit clear.
+    """
+
+    @classmethod
+    def fromLayout(cls, rows, cols, mineCount, mines, neighborCounts=None, seed=None):
+        """Build a board around an existing row-major mine mask, like `Board.fromLayout`.
+
+        `neighborCounts` is accepted for compatibility; counts are always
+        recomputed from the mask since that is a few big-int operations.
+        """
+        board = cls(rows, cols, mineCount, rng=random.Random(seed), seed=seed)
+        board.mines = board.maskFromBytes(mines)
+        board.calculateAllNeighbors()
+        board.firstClick = False
+        return board
+
+    def initTiles(self):
+        """Clear every mask and the bookkeeping counters."""
+        rows, cols = self.rows, self.cols
+        self.stride = cols + 1
+        # One bit at the start of every row; times a row pattern, it tiles it
+        rowStarts = ((1 << (self.stride * rows)) - 1) // ((1 << self.stride) - 1)
+        self.valid = ((1 << cols) - 1) * rowStarts
+        self.mines = 0
+        self.revealed = 0
+        self.flagged = 0
+        self.countPlanes = [0, 0, 0, 0]
+        self.empty = self.valid
+        self.tiles = TileGrid(self)
+        self.explodedIndex = None
+        self.safeRevealed = 0
+        self.revealedCount = 0
+        self.minesFlagged = 0
+        self.wrongFlags = 0
+
+    def index(self, row, col):
+        """Return the flat row-major index of a cell, as `Board.index` does."""
+        return row * self.cols + col
+
+    def bitOf(self, row, col):
+        """Return the single-bit mask of a cell."""
+        return 1 << (row * self.stride + col)
+
+    def maskFromBytes(self, cells):
+        """Pack a row-major 0/1 byte mask into a bitmask with guard columns."""
+        cols = self.cols
+        if not self.rows or not cols:
+            return 0
+        digits = bytes(cells).translate(_TO_DIGITS)
+        # Rows joined by a guard digit, reversed so row 0 ends up in the low bits
+        padded = b"0".join(digits[r * cols:(r + 1) * cols] for r in range(self.rows))
+        return int(padded[::-1], 2)
+
+    def bytesFromMask(self, mask):
+        """Unpack a bitmask into a row-major 0/1 `bytearray`."""
+        cols, stride = self.cols, self.stride
+        bits = format(mask, "b")[::-1].ljust(self.rows * stride, "0").encode()
+        out = bytearray(self.rows * cols)
+        for r in range(self.rows):
+            out[r * cols:(r + 1) * cols] = bits[r * stride:r * stride + cols]
+        return out.translate(_FROM_DIGITS)
+
+    def placeMines(self, excludeRow, excludeCol):
+        """Randomly place mines avoiding the first clicked tile and its neighbors.
+
+        Draws exactly the layout `Board` would for the same seed and click.
+        """
+        layout = bytearray(self.rows * self.cols)
+        placeMineMask(layout, self.rows, self.cols, self.mineCount, excludeRow, excludeCol, self.rng)
+        self.mines = self.maskFromBytes(layout)
+
+        # Flags placed before the first click were counted against an empty
+        # minefield; re-split them now that the mines exist
+        self.minesFlagged = _popcount(self.mines & self.flagged)
+        self.wrongFlags = self.flagCount - self.minesFlagged
+
+        self.calculateAllNeighbors()
+
+    def calculateAllNeighbors(self):
+        """Count every cell's adjacent mines into four bit planes at once.
+
+        The eight shifted copies of the mine mask are summed with a
+        bit-sliced ripple adder: plane k holds bit k of every cell's count.
+        Mine cells get a count of 0, as on `Board`.
+        """
+        mines, stride, valid = self.mines, self.stride, self.valid
+        shifted = (
+            mines << 1, mines >> 1,
+            mines << stride, mines >> stride,
+            mines << (stride + 1), mines >> (stride + 1),
+            mines << (stride - 1), mines >> (stride - 1),
+        )
+        planes = [0, 0, 0, 0]
+        for addend in shifted:
+            carry = addend & valid
+            for k in range(4):
+                if not carry:
+                    break
+                planes[k], carry = planes[k] ^ carry, planes[k] & carry
+
+        safe = valid & ~mines
+        self.countPlanes = [plane & safe for plane in planes]
+        # Cells a flood fill spreads through: safe with no adjacent mines
+        self.empty = safe & ~(planes[0] | planes[1] | planes[2] | planes[3])
+
+    def neighborCountAt(self, row, col):
+        """Return the precomputed adjacent mine count of a cell."""
+        shift = row * self.stride + col
+        return sum(((plane >> shift) & 1) << k for k, plane in enumerate(self.countPlanes))
+
+    def countNeighbors(self, row, col):
+        """Count mines in 8 adjacent cells."""
+        bit = self.bitOf(row, col)
+        return _popcount(self.mines & self._dilate(bit) & ~bit)
+
+    def isValid(self, row, col):
+        """Check if coordinates are within board boundaries."""
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def _dilate(self, mask):
+        """Return `mask` grown by one cell in all eight directions."""
+        stride = self.stride
+        horizontal = mask | (mask << 1) | (mask >> 1)
+        return (horizontal | (horizontal << stride) | (horizontal >> stride)) & self.valid
+
+    def _spread(self, region, spreadable):
+        """Grow `region` through `spreadable` along rows and columns.
+
+        Occluded fill: each step doubles the distance covered, so a straight
+        stretch of n cells takes log2(n) steps instead of n dilations.
+        """
+        for step, span in ((1, self.cols), (self.stride, self.rows * self.stride)):
+            for up in (True, False):
+                gate = spreadable
+                shift = step
+                while gate and shift < span:
+                    if up:
+                        region |= gate & (region << shift)
+                        gate &= gate << shift
+                    else:
+                        region |= gate & (region >> shift)
+                        gate &= gate >> shift
+                    shift <<= 1
+        return region
+
+    def _ranges(self, mask):
+        """Convert a mask of cells into `(start, stop)` row-major index ranges.
+
+        A set run never crosses a guard bit, so every run of the mask is one
+        contiguous range of flat indices.
+        """
+        cols, stride = self.cols, self.stride
+        changes = []
+        for match in _SET_RUN.finditer(format(mask, "b")[::-1]):
+            start, stop = match.span()
+            row, col = divmod(start, stride)
+            first = row * cols + col
+            changes.append((first, first + stop - start))
+        return changes
+
+    def revealTile(self, row, col):
+        """Reveal a tile and handle flood fill for empty cells.
+
+        Returns:
+            List of `(start, stop)` flat index ranges that were revealed,
+            including mines shown on a loss. Empty if nothing changed.
+        """
+        if not self.isValid(row, col):
+            return []
+
+        bit = self.bitOf(row, col)
+        if (self.revealed | self.flagged) & bit or self.gameState != GameState.PLAYING:
+            return []
+
+        if self.firstClick:
+            self.placeMines(row, col)
+            self.firstClick = False
+
+        self.revealed |= bit
+        self.revealedCount += 1
+        i = row * self.cols + col
+        changes = [(i, i + 1)]
+        if self.mines & bit:
+            self.gameState = GameState.GAME_OVER
+            self.explodedIndex = i
+            changes.extend(self.revealAllMines())
+            return changes
+        self.safeRevealed += 1
+
+        if self.empty & bit:
+            changes.extend(self.floodFill(row, col))
+
+        self.checkWinCondition()
+        return changes
+
+    def floodFill(self, row, col):
+        """Reveal the neighbors of a cell and spread through connected empty cells.
+
+        The empty region around the cell is grown by dilating it and masking
+        with the unflagged, not yet revealed empty cells until it stops
+        changing; one more dilation adds the numbered border. Each step is a
+        few whole-board big-int operations.
+
+        Returns:
+            List of `(start, stop)` flat index ranges newly revealed.
+        """
+        bit = self.bitOf(row, col)
+        # Like the cell-by-cell fill, spread only through cells revealed now
+        spreadable = self.empty & ~self.flagged & (~self.revealed | bit)
+        region = bit
+        if spreadable & bit:
+            while True:
+                grown = self._dilate(self._spread(region, spreadable)) & spreadable
+                if grown == region:
+                    break
+                region = grown
+
+        newly = self._dilate(region) & ~self.revealed & ~self.flagged
+        self.revealed |= newly
+        # Cells next to a zero are never mines
+        count = _popcount(newly)
+        self.safeRevealed += count
+        self.revealedCount += count
+        return self._ranges(newly)
+
+    def toggleFlag(self, row, col):
+        """Toggle flag state on a tile.
+
+        Returns:
+            `[(index, index + 1)]` for the toggled cell, or an empty list.
+        """
+        if not self.isValid(row, col):
+            return []
+
+        bit = self.bitOf(row, col)
+        if self.revealed & bit:
+            return []
+
+        delta = -1 if self.flagged & bit else 1
+        self.flagged ^= bit
+        self.flagCount += delta
+        if self.mines & bit:
+            self.minesFlagged += delta
+        else:
+            self.wrongFlags += delta
+        # After a flag change, check 'minefishing' win condition: all mines flagged
+        self.checkFlagWin()
+        i = row * self.cols + col
+        return [(i, i + 1)]
+
+    def revealAllMines(self):
+        """Show all mine locations on game over.
+
+        Returns:
+            List of `(start, stop)` ranges covering the mines newly shown.
+        """
+        newly = self.mines & ~self.revealed
+        self.revealed |= newly
+        self.revealedCount += _popcount(newly)
+        return self._ranges(newly)
+
+    def getTile(self, row, col):
+        """Return a view of the tile at specified coordinates."""
+        if self.isValid(row, col):
+            return BitTileView(self, row, col)
+        return None
+
+    def cellState(self, index):
+        """Return the `TileState` to draw for the cell at flat `index`."""
+        row, col = divmod(index, self.cols)
+        bit = self.bitOf(row, col)
+        if self.revealed & bit:
+            if self.mines & bit:
+                return TileState.EXPLODED if index == self.explodedIndex else TileState.MINE
+            return self.neighborCountAt(row, col)
+        return TileState.FLAGGED if self.flagged & bit else TileState.UNREVEALED
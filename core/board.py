@@ -1,196 +1,598 @@
-"""Manages the Minesweeper game board, mine placement, and game rules."""
+"""Manages the Minesweeper game board, mine placement, and game rules.
+
+Cell state lives in flat, row-major `bytearray` buffers (one byte per cell,
+index = row * cols + col) rather than in one object per cell. `getTile`
+and `tiles` hand out lightweight `TileView` objects over those buffers so
+callers keep the familiar tile API.
+"""
 
 
 import random
-from .tile import Tile
-from .state import GameState
+import re
+from array import array
+from bisect import bisect_right
+import settings
+from .tile import TileView, TileGrid
+from .neighbors import getNeighborTable
+from .state import GameState, TileState
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python paths cover everything
+    np = None
+
+# Below this many cells the big-int path beats NumPy's per-call overhead
+NUMPY_MIN_CELLS = 4096
+
+# Up to this fraction of free cells being mines, rejection sampling wins
+SPARSE_MAX_DENSITY = 0.25
+
+# A run of cells a flood fill can spread through (see Board.floodFill)
+_EMPTY_RUN = re.compile(rb"\x00+")
+
+# Seeds for boards created without one; independent of the global RNG state
+_seedSource = random.SystemRandom()
+
+
+def placeMineMask(mines, rows, cols, mineCount, excludeRow, excludeCol, rng=random):
+    """Set `mineCount` random cells of `mines`, keeping a 3x3 safe zone clear.
+
+    Works on flat indices and touches memory in proportion to the mine
+    count: sparse boards use rejection sampling against the mask itself,
+    dense ones a partial Fisher-Yates shuffle over a compact index buffer.
+    The safe zone around (excludeRow, excludeCol) is a clipped rectangle,
+    so it is tested arithmetically rather than stored.
+
+    Args:
+        mines: Zeroed row-major mine mask to fill, 1 byte per cell.
+        rows: Number of board rows.
+        cols: Number of board columns.
+        mineCount: Number of mines to place.
+        excludeRow: Row of the first click.
+        excludeCol: Column of the first click.
+        rng: Object providing `randrange`, e.g. a `random.Random`.
+
+    Raises:
+        ValueError: If the mines do not fit outside the safe zone.
+    """
+    rowLo, rowHi = max(0, excludeRow - 1), min(rows - 1, excludeRow + 1)
+    colLo, colHi = max(0, excludeCol - 1), min(cols - 1, excludeCol + 1)
+    safeCount = max(0, rowHi - rowLo + 1) * max(0, colHi - colLo + 1)
+    available = rows * cols - safeCount
+
+    # Validate that we have enough space for all mines
+    if available < mineCount:
+        raise ValueError(f"Cannot place {mineCount} mines on {rows}x{cols} board with safe zone")
+
+    if mineCount <= available * SPARSE_MAX_DENSITY:
+        _placeSparse(mines, cols, mineCount, rowLo, rowHi, colLo, colHi, rng)
+    elif mineCount <= available // 2:
+        for i in _shuffledPrefix(rows, cols, mineCount, rowLo, rowHi, colLo, colHi, rng):
+            mines[i] = 1
+    else:
+        # Mostly mines: fill every free cell, then shuffle out the few safe ones
+        mines[:] = b"\x01" * len(mines)
+        for r in range(rowLo, rowHi + 1):
+            mines[r * cols + colLo:r * cols + colHi + 1] = bytes(colHi - colLo + 1)
+        for i in _shuffledPrefix(rows, cols, available - mineCount, rowLo, rowHi, colLo, colHi, rng):
+            mines[i] = 0
+
+
+def _placeSparse(mines, cols, mineCount, rowLo, rowHi, colLo, colHi, rng):
+    """Rejection sampling: draw cells until enough free ones were hit."""
+    randrange = rng.randrange
+    size = len(mines)
+    placed = 0
+    while placed < mineCount:
+        i = randrange(size)
+        if mines[i]:
+            continue
+        r, c = divmod(i, cols)
+        if rowLo <= r <= rowHi and colLo <= c <= colHi:
+            continue
+        mines[i] = 1
+        placed += 1
+
+
+def _shuffledPrefix(rows, cols, count, rowLo, rowHi, colLo, colHi, rng):
+    """Return `count` distinct free cells via a partial Fisher-Yates shuffle."""
+    pool = array("i", range(rowLo * cols))
+    for r in range(rowLo, rowHi + 1):
+        base = r * cols
+        pool.extend(range(base, base + colLo))
+        pool.extend(range(base + colHi + 1, base + cols))
+    pool.extend(range((rowHi + 1) * cols, rows * cols))
+
+    randrange = rng.randrange
+    size = len(pool)
+    for k in range(count):
+        j = randrange(k, size)
+        pool[k], pool[j] = pool[j], pool[k]
+    return pool[:count]
+
+
+def computeNeighborCounts(mines, rows, cols, out):
+    """Fill `out` with the adjacent mine count of every cell in one pass.
+
+    Both inputs are flat row-major byte buffers of `rows * cols` cells.
+    Mine cells get a count of 0, matching what the per-cell loop produced.
+
+    Args:
+        mines: Mine mask, 1 byte per cell.
+        rows: Number of board rows.
+        cols: Number of board columns.
+        out: Writable buffer receiving the counts.
+    """
+    if not rows or not cols:
+        return
+    if np is not None and rows * cols >= NUMPY_MIN_CELLS:
+        _neighborCountsNumpy(mines, rows, cols, out)
+    else:
+        _neighborCountsShifted(mines, rows, cols, out)
+
+
+def _neighborCountsNumpy(mines, rows, cols, out):
+    """3x3 box sum over a zero-padded copy of the mine mask."""
+    grid = np.frombuffer(mines, dtype=np.uint8).reshape(rows, cols)
+    np.frombuffer(out, dtype=np.uint8).reshape(rows, cols)[...] = boxNeighborCounts(grid)
+
+
+def boxNeighborCounts(grid):
+    """Return neighbor counts for a uint8 mine array of shape (..., rows, cols).
+
+    Leading axes are treated as independent boards, so a whole stack of
+    layouts is counted in one call. Requires NumPy.
+    """
+    rows, cols = grid.shape[-2:]
+    padded = np.zeros(grid.shape[:-2] + (rows + 2, cols + 2), dtype=np.uint8)
+    padded[..., 1:-1, 1:-1] = grid
+
+    total = np.zeros(grid.shape, dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            total += padded[..., dr:dr + rows, dc:dc + cols]
+    total -= grid
+    total[grid != 0] = 0
+    return total
+
+
+def _neighborCountsShifted(mines, rows, cols, out):
+    """Shifted-row adds on the mask packed into one big integer.
+
+    Every cell becomes an 8-bit lane of a Python int, with a zero guard
+    byte closing each row. Shifting by one lane moves cells sideways and
+    shifting by a full padded row moves them vertically, so eight shifted
+    adds give every neighbor count. A lane never exceeds 9, so lanes
+    never carry into each other.
+    """
+    stride = cols + 1
+    padded = bytearray(rows * stride)
+    for r in range(rows):
+        padded[r * stride:r * stride + cols] = mines[r * cols:(r + 1) * cols]
+
+    mask = int.from_bytes(padded, "little")
+    rowShift = 8 * stride
+    horizontal = mask + (mask << 8) + (mask >> 8)
+    total = horizontal + (horizontal << rowShift) + (horizontal >> rowShift) - mask
+    # Clear mine lanes: mask * 0xFF turns every mine lane into 0xFF
+    total &= ~(mask * 0xFF)
+
+    totals = (total & ((1 << (8 * len(padded))) - 1)).to_bytes(len(padded), "little")
+    for r in range(rows):
+        out[r * cols:(r + 1) * cols] = totals[r * stride:r * stride + cols]
+
+
+class BoardBase:
+    """State and rules shared by the board backends (`Board`, `BitBoard`).
+
+    Holds the dimensions, game state, seed and RNG, and the win checks that
+    only read the running counters. Subclasses store the cells and provide
+    `initTiles`, which allocates the cell state and zeroes the counters
+    `safeRevealed`, `revealedCount`, `minesFlagged` and `wrongFlags`.
+    """
+
+    def __init__(self, rows, cols, mineCount, seed=None, rng=None):
+        """Initialize an empty board.
+
+        Args:
+            rows: Number of grid rows.
+            cols: Number of grid columns.
+            mineCount: Number of mines placed on the first click.
+            seed: Optional integer seed; a random one is drawn and stored in
+                  `seed` when neither `seed` nor `rng` is given.
+            rng: Optional `random.Random` instance to draw layouts from. It
+                 is reseeded with `seed` when both are given.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.mineCount = mineCount
+        self.gameState = GameState.PLAYING
+        self.firstClick = True
+        self.initRandom(seed, rng)
+        self.initTiles()
+        self.flagCount = 0
+
+    def initRandom(self, seed=None, rng=None):
+        """Set up the RNG used for mine placement and record its seed."""
+        if rng is None:
+            if seed is None:
+                seed = _seedSource.getrandbits(32)
+            rng = random.Random(seed)
+        elif seed is not None:
+            rng.seed(seed)
+        self.seed = seed
+        self.rng = rng
 
+    def initTiles(self):
+        """Allocate empty cell state and zero the bookkeeping counters."""
+        raise NotImplementedError
+
+    def checkWinCondition(self):
+        """Check if player has revealed all non-mine tiles."""
+        if self.safeRevealed == self.rows * self.cols - self.mineCount:
+            self.gameState = GameState.WIN
 
-class Board:
-    """Game board managing grid state, mine operations, and win/loss conditions."""
+    def getRemainingCells(self):
+        """Return unrevealed non-mine cells remaining."""
+        return self.rows * self.cols - self.mineCount - self.safeRevealed
 
-    def __init__(self, rows, cols, mineCount):
+    def getRemainingMines(self):
+        """Count mines that are not currently flagged.
+
+        This supports a 'minefishing' win condition where the player wins
+        when all mines have been flagged (remaining mines == 0).
+        """
+        return self.mineCount - self.minesFlagged
+
+    def checkFlagWin(self):
+        """Set game state to WIN when every mine, and nothing else, is flagged.
+
+        Requiring zero wrong flags stops the win from triggering by simply
+        flagging every tile on the board.
+        """
+        if (self.gameState == GameState.PLAYING and not self.firstClick
+                and self.getRemainingMines() == 0 and self.wrongFlags == 0):
+            self.gameState = GameState.WIN
+
+    def reset(self, rows, cols, mineCount, seed=None, rng=None):
+        """Reset board with new dimensions and a fresh (or given) seed."""
         self.rows = rows
         self.cols = cols
         self.mineCount = mineCount
-        self.tiles = []
         self.gameState = GameState.PLAYING
         self.firstClick = True
-        self.initTiles()
         self.flagCount = 0
+        self.initRandom(seed, rng)
+        self.initTiles()
+
+
+class Board(BoardBase):
+    """Game board managing grid state, mine operations, and win/loss conditions.
+
+    Mine layouts come from a private RNG. Given the same `seed` and the same
+    first click, a board always produces the same layout.
+    """
+
+    @classmethod
+    def fromLayout(cls, rows, cols, mineCount, mines, neighborCounts=None, seed=None):
+        """Build a board around an existing mine layout.
+
+        The board starts as if its first click had already placed the
+        mines, so the next `revealTile` plays directly on this layout.
+
+        Args:
+            rows, cols, mineCount: Board dimensions and mine count.
+            mines: Row-major mine mask (any bytes-like object of rows * cols).
+            neighborCounts: Matching counts; computed when omitted.
+            seed: Seed to record for this layout, if known.
+        """
+        board = cls(rows, cols, mineCount, rng=random.Random(seed), seed=seed)
+        board.mines[:] = mines
+        if neighborCounts is None:
+            board.calculateAllNeighbors()
+        else:
+            board.neighborCounts[:] = neighborCounts
+        board.firstClick = False
+        return board
 
     def initTiles(self):
-        """Create empty grid of Tile objects."""
-        for r in range(self.rows):
-            row = []
-            for c in range(self.cols):
-                row.append(Tile(r, c))
-            self.tiles.append(row)
+        """Allocate zeroed cell buffers and bookkeeping counters."""
+        size = self.rows * self.cols
+        self.mines = bytearray(size)
+        self.revealed = bytearray(size)
+        self.flagged = bytearray(size)
+        self.neighborCounts = bytearray(size)
+        self.tiles = TileGrid(self)
+        # Cell of the mine that ended the game, if any
+        self.explodedIndex = None
+        # Running totals kept in step by revealTile/floodFill/toggleFlag so
+        # win checks never rescan the grid
+        self.safeRevealed = 0
+        self.revealedCount = 0
+        self.minesFlagged = 0
+        self.wrongFlags = 0
+
+    def index(self, row, col):
+        """Return the flat buffer index of a cell."""
+        return row * self.cols + col
 
     def placeMines(self, excludeRow, excludeCol):
         """Randomly place mines avoiding the first clicked tile and its neighbors."""
-        # Create a set of safe positions (first click + all 8 neighbors)
-        safePositions = set()
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                r, c = excludeRow + dr, excludeCol + dc
-                if self.isValid(r, c):
-                    safePositions.add((r, c))
-
-        # Get all available positions excluding safe zone
-        availablePositions = []
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if (r, c) not in safePositions:
-                    availablePositions.append((r, c))
-
-        # Validate that we have enough space for all mines
-        if len(availablePositions) < self.mineCount:
-            raise ValueError(f"Cannot place {self.mineCount} mines on {self.rows}x{self.cols} board with safe zone")
-
-        # Randomly sample positions for mines
-        minePositions = random.sample(availablePositions, self.mineCount)
-        for r, c in minePositions:
-            self.tiles[r][c].isMine = True
+        mines = self.mines
+        placeMineMask(mines, self.rows, self.cols, self.mineCount, excludeRow, excludeCol, self.rng)
+
+        # Flags placed before the first click were counted against an empty
+        # minefield; re-split them now that the mines exist
+        self.minesFlagged = sum(m & f for m, f in zip(mines, self.flagged))
+        self.wrongFlags = self.flagCount - self.minesFlagged
 
         self.calculateAllNeighbors()
 
     def calculateAllNeighbors(self):
-        """Pre-calculate neighbor counts for all tiles."""
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if not self.tiles[r][c].isMine:
-                    self.tiles[r][c].neighborCount = self.countNeighbors(r, c)
+        """Pre-calculate neighbor counts for all tiles in a single pass."""
+        computeNeighborCounts(self.mines, self.rows, self.cols, self.neighborCounts)
+
+    def neighborIndices(self, index):
+        """Return the flat indices of the up to 8 cells around `index`.
+
+        Served from the shared per-shape table when the board has one.
+        """
+        table = getNeighborTable(self.rows, self.cols)
+        if table is not None:
+            return table.of(index)
+        row, col = divmod(index, self.cols)
+        return [
+            r * self.cols + c
+            for r in range(max(0, row - 1), min(self.rows, row + 2))
+            for c in range(max(0, col - 1), min(self.cols, col + 2))
+            if r != row or c != col
+        ]
 
     def countNeighbors(self, row, col):
         """Count mines in 8 adjacent cells."""
+        mines = self.mines
+        cols = self.cols
+        table = getNeighborTable(self.rows, cols)
+        if table is not None:
+            return sum(mines[j] for j in table.of(row * cols + col))
+        rowStart = max(0, row - 1)
+        rowEnd = min(self.rows, row + 2)
+        colStart = max(0, col - 1)
+        colEnd = min(cols, col + 2)
         count = 0
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                if dr == 0 and dc == 0:
-                    continue
-                nr, nc = row + dr, col + dc
-                if self.isValid(nr, nc) and self.tiles[nr][nc].isMine:
-                    count += 1
-        return count
+        for r in range(rowStart, rowEnd):
+            base = r * cols
+            count += sum(mines[base + colStart:base + colEnd])
+        return count - mines[row * cols + col]
 
     def isValid(self, row, col):
         """Check if coordinates are within board boundaries."""
         return 0 <= row < self.rows and 0 <= col < self.cols
 
     def revealTile(self, row, col):
-        """Reveal a tile and handle flood fill for empty cells."""
+        """Reveal a tile and handle flood fill for empty cells.
+
+        Returns:
+            List of `(start, stop)` flat index ranges that were revealed,
+            including mines shown on a loss. Empty if nothing changed.
+        """
         if not self.isValid(row, col):
-            return
+            return []
 
-        tile = self.tiles[row][col]
-        if tile.isRevealed or tile.isFlagged or self.gameState != GameState.PLAYING:
-            return
+        i = row * self.cols + col
+        if self.revealed[i] or self.flagged[i] or self.gameState != GameState.PLAYING:
+            return []
 
         if self.firstClick:
             self.placeMines(row, col)
             self.firstClick = False
 
-        if tile.reveal():
+        self.revealed[i] = 1
+        self.revealedCount += 1
+        changes = [(i, i + 1)]
+        if self.mines[i]:
             self.gameState = GameState.GAME_OVER
-            self.revealAllMines()
-            return
+            self.explodedIndex = i
+            changes.extend(self.revealAllMines())
+            return changes
+        self.safeRevealed += 1
 
-        if tile.neighborCount == 0:
-            self.floodFill(row, col)
+        if self.neighborCounts[i] == 0:
+            changes.extend(self.floodFill(row, col))
 
         self.checkWinCondition()
+        return changes
 
     def floodFill(self, row, col):
-        """Recursively reveal adjacent empty tiles."""
-        stack = [(row, col)]
+        """Reveal the neighbors of a cell and spread through connected empty cells.
+
+        Works on horizontal runs of empty cells rather than single cells. A
+        first pass collects the connected runs, using a set of visited run
+        starts so each run is expanded once. Runs are found lazily, one row
+        at a time, only in rows the fill reaches. A second pass reveals, row
+        by row, the merged segments around those runs with slice writes.
+        Nothing is done per board cell, so a small opening on a huge board
+        stays cheap.
+
+        Returns:
+            List of `(start, stop)` flat index ranges newly revealed.
+        """
+        rows, cols = self.rows, self.cols
+        seed = row * cols + col
+        buffers = [memoryview(buffer) for buffer in
+                   (self.neighborCounts, self.mines, self.flagged, self.revealed)]
+        rowRuns = {}
+        visited = set()
+
+        def runsOf(r):
+            runs = rowRuns.get(r)
+            if runs is None:
+                # Zero bytes mark cells a fill spreads through: safe,
+                # unflagged, count 0 and not revealed before this fill
+                # (apart from the seed)
+                base = r * cols
+                blocked = 0
+                for buffer in buffers:
+                    blocked |= int.from_bytes(buffer[base:base + cols], "little")
+                if r == row:
+                    blocked &= ~(0xFF << (8 * col))
+                key = blocked.to_bytes(cols, "little")
+                found = [m.span() for m in _EMPTY_RUN.finditer(key)]
+                runs = rowRuns[r] = ([base + a for a, _ in found], [base + b for _, b in found])
+            return runs
+
+        starts, ends = runsOf(row)
+        k = bisect_right(starts, seed) - 1
+        if k >= 0 and seed < ends[k]:
+            stack = [(row, starts[k], ends[k])]
+            visited.add(starts[k])
+        else:
+            # Not an empty cell itself: still reveal around it, as before.
+            # Runs beside it in its own row are found through this pass only;
+            # a real run is maximal, so its own row never holds a neighbor.
+            stack = [(row, seed, seed + 1)]
+
+        # Pass 1: collect connected runs, as column spans widened by one
+        # cell on each side (the cells they reveal in their own row)
+        spans = {}
         while stack:
-            r, c = stack.pop()
-            for dr in (-1, 0, 1):
-                for dc in (-1, 0, 1):
-                    if dr == 0 and dc == 0:
-                        continue
-                    nr, nc = r + dr, c + dc
-                    if self.isValid(nr, nc):
-                        tile = self.tiles[nr][nc]
-                        if not tile.isRevealed and not tile.isFlagged:
-                            tile.reveal()
-                            if tile.neighborCount == 0:
-                                stack.append((nr, nc))
+            r, start, stop = stack.pop()
+            colLo = max(0, start - r * cols - 1)
+            colHi = min(cols, stop - r * cols + 1)
+            spans.setdefault(r, []).append((colLo, colHi))
+            for nr in (r - 1, r, r + 1):
+                if not 0 <= nr < rows or (nr == r and start in visited):
+                    continue
+                base = nr * cols
+                starts, ends = runsOf(nr)
+                k = bisect_right(ends, base + colLo)
+                while k < len(starts) and starts[k] < base + colHi:
+                    if starts[k] not in visited:
+                        visited.add(starts[k])
+                        stack.append((nr, starts[k], ends[k]))
+                    k += 1
+
+        # Pass 2: every row reveals the union of the spans in it and the
+        # rows directly above and below
+        changes = []
+        newlyRevealed = 0
+        touched = {nr for r in spans for nr in range(max(0, r - 1), min(rows, r + 2))}
+        for r in sorted(touched):
+            segments = sorted(spans.get(r - 1, []) + spans.get(r, []) + spans.get(r + 1, []))
+            base = r * cols
+            mergedLo, mergedHi = segments[0]
+            for lo, hi in segments:
+                if lo > mergedHi:
+                    newlyRevealed += self._revealSpan(base + mergedLo, base + mergedHi, changes)
+                    mergedLo = lo
+                mergedHi = max(mergedHi, hi)
+            newlyRevealed += self._revealSpan(base + mergedLo, base + mergedHi, changes)
+
+        # Cells next to a zero are never mines
+        self.safeRevealed += newlyRevealed
+        self.revealedCount += newlyRevealed
+        return changes
+
+    def _revealSpan(self, start, stop, changes):
+        """Reveal unflagged cells in `[start, stop)` and append new ranges to `changes`."""
+        revealed = self.revealed
+        flagged = self.flagged
+        count = 0
+        i = revealed.find(0, start, stop)
+        while i != -1:
+            end = revealed.find(1, i, stop)
+            if end == -1:
+                end = stop
+            # Flagged cells are unrevealed too; reveal around them
+            while i < end:
+                flag = flagged.find(1, i, end)
+                segmentEnd = end if flag == -1 else flag
+                if segmentEnd > i:
+                    revealed[i:segmentEnd] = b"\x01" * (segmentEnd - i)
+                    changes.append((i, segmentEnd))
+                    count += segmentEnd - i
+                i = segmentEnd + 1
+            i = revealed.find(0, end, stop) if end < stop else -1
+        return count
 
     def toggleFlag(self, row, col):
-        """Toggle flag state on a tile."""
-        if not self.isValid(row, col):
-            return
-
-        tile = self.tiles[row][col]
-        if tile.isRevealed:
-            return
+        """Toggle flag state on a tile.
 
-        wasFlagged = tile.isFlagged
-        tile.toggleFlag()
-        self.flagCount += 1 if not wasFlagged else -1
+        Returns:
+            `[(index, index + 1)]` for the toggled cell, or an empty list.
+        """
+        if not self.isValid(row, col):
+            return []
+
+        i = row * self.cols + col
+        if self.revealed[i]:
+            return []
+
+        delta = -1 if self.flagged[i] else 1
+        self.flagged[i] ^= 1
+        self.flagCount += delta
+        if self.mines[i]:
+            self.minesFlagged += delta
+        else:
+            self.wrongFlags += delta
         # After a flag change, check 'minefishing' win condition: all mines flagged
         self.checkFlagWin()
+        return [(i, i + 1)]
 
     def revealAllMines(self):
-        """Show all mine locations on game over."""
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.tiles[r][c].isMine:
-                    self.tiles[r][c].isRevealed = True
+        """Show all mine locations on game over.
 
-    def checkWinCondition(self):
-        """Check if player has revealed all non-mine tiles."""
-        for r in range(self.rows):
-            for c in range(self.cols):
-                tile = self.tiles[r][c]
-                if not tile.isMine and not tile.isRevealed:
-                    return
-        self.gameState = GameState.WIN
+        Returns:
+            List of `(index, index + 1)` ranges for the mines newly shown.
+        """
+        mines = self.mines
+        revealed = self.revealed
+        changes = []
+        i = mines.find(1)
+        while i != -1:
+            if not revealed[i]:
+                revealed[i] = 1
+                changes.append((i, i + 1))
+            i = mines.find(1, i + 1)
+        self.revealedCount += len(changes)
+        return changes
 
     def getTile(self, row, col):
-        """Return tile at specified coordinates."""
+        """Return a view of the tile at specified coordinates."""
         if self.isValid(row, col):
-            return self.tiles[row][col]
+            return TileView(self, row, col)
         return None
 
-    def getRemainingCells(self):
-        """Calculate unrevealed non-mine cells remaining."""
-        count = 0
-        for r in range(self.rows):
-            for c in range(self.cols):
-                tile = self.tiles[r][c]
-                if not tile.isMine and not tile.isRevealed:
-                    count += 1
-        return count
-
-    def getRemainingMines(self):
-        """Count mines that are not currently flagged.
-
-        This supports a 'minefishing' win condition where the player wins
-        when all mines have been flagged (remaining mines == 0).
-        """
-        remaining = 0
-        for r in range(self.rows):
-            for c in range(self.cols):
-                tile = self.tiles[r][c]
-                if tile.isMine and not tile.isFlagged:
-                    remaining += 1
-        return remaining
-
-    def checkFlagWin(self):
-        """Set game state to WIN when no unflagged mines remain."""
-        if self.getRemainingMines() == 0:
-            self.gameState = GameState.WIN
-
-    def reset(self, rows, cols, mineCount):
-        """Reset board with new dimensions."""
-        self.rows = rows
-        self.cols = cols
-        self.mineCount = mineCount
-        self.tiles = []
-        self.gameState = GameState.PLAYING
-        self.firstClick = True
-        self.flagCount = 0
-        self.initTiles()
+    def cellState(self, index):
+        """Return the `TileState` to draw for the cell at flat `index`."""
+        if self.revealed[index]:
+            if self.mines[index]:
+                return TileState.EXPLODED if index == self.explodedIndex else TileState.MINE
+            return self.neighborCounts[index]
+        return TileState.FLAGGED if self.flagged[index] else TileState.UNREVEALED
+
+
+# Board implementations selectable by name; see settings.BOARD_BACKEND
+BOARD_BACKENDS = ("array", "bitboard")
+
+
+def createBoard(rows, cols, mineCount, seed=None, rng=None, backend=None):
+    """Create a board with the requested storage backend.
+
+    Args:
+        rows, cols, mineCount, seed, rng: Passed on to the board class.
+        backend: "array" for `Board` (flat byte buffers) or "bitboard" for
+                 `BitBoard` (big-integer bitmasks). Defaults to
+                 `settings.BOARD_BACKEND`.
+
+    Raises:
+        ValueError: For an unknown backend name.
+    """
+    if backend is None:
+        backend = settings.BOARD_BACKEND
+    if backend == "array":
+        return Board(rows, cols, mineCount, seed=seed, rng=rng)
+    if backend == "bitboard":
+        from .bitboard import BitBoard
+        return BitBoard(rows, cols, mineCount, seed=seed, rng=rng)
+    raise ValueError(f"Unknown board backend {backend!r}; expected one of {BOARD_BACKENDS}")
@@ -3,20 +3,30 @@
 
 import pygame
 import sys
-import random
-from .state import GameState, Difficulty, Score
-from .board import Board
+from .state import GameState, Difficulty, Score, calculateScore
+from .board import createBoard
 from ui.hud import Hud
 from ui.menu import Menu
 from ui.leaderboard import LeaderboardUI
-from utils.leaderboard_storage import LeaderboardStorage
-from ui.pixel_utils import draw_pixel_text, draw_pixel_mine, draw_pixel_flag
+from utils.leaderboard_storage import createLeaderboardStorage
+from utils.score_writer import ScoreWriter
+from ui.tile_atlas import TileAtlas
+from ui.camera import Camera
+from ui.board_view import BoardView
+from ui.particles import ParticleSystem
+from ui.pixel_utils import draw_pixel_text, get_pixel_text_width, get_pixel_text_height
 import settings
 
+# Posted when the background writer has stored a score (attributes: rank, game)
+SCORE_SAVED = pygame.event.custom_type()
+
 
 class Game:
     """Main game controller handling the pygame event loop and state management."""
 
+    # Above this many dirty rectangles a frame presents their union instead
+    MAX_DIRTY_RECTS = 32
+
     def __init__(self):
         pygame.init()
         self.screen = None
@@ -30,29 +40,78 @@ class Game:
         # Track current game dimensions for dynamic sizing
         self.currentRows = 0
         self.currentCols = 0
-        self.currentTileSize = settings.TILE_SIZE
-        self.currentOffsetX = settings.BOARD_OFFSET_X
-        self.currentOffsetY = settings.BOARD_OFFSET_Y
+        # Board position and zoom; currentTileSize/currentOffsetX/Y are views of it
+        self.camera = Camera((0, settings.HUD_HEIGHT, settings.WIDTH, settings.HEIGHT - settings.HUD_HEIGHT),
+                             tileSize=settings.TILE_SIZE,
+                             offsetX=settings.BOARD_OFFSET_X, offsetY=settings.BOARD_OFFSET_Y)
+        # Last mouse position of a middle-button drag pan, None when not dragging
+        self._dragOrigin = None
+        # Tile sprites for currentTileSize, built on first draw
+        self.tileAtlas = None
+        # Offscreen copy of the visible board, patched as cells change
+        self.boardView = BoardView()
         # Scoring tracking
         self.score = 0
         self.currentScoreDisplay = 0
         self.revealedCount = 0
+        # Inputs of the last score calculation, so unchanged frames skip it
+        self._scoredReveals = -1
+        self._scoredSecond = -1
         self.leaderboardStorage = None
         self.lastScoreRank = None
+        # Counts started games, so a late SCORE_SAVED for an old game is ignored
+        self._gameNumber = 0
         self._endGameOverlay = False
         # Win effect particles and final time storage
-        self.winParticles = []
+        colors = [settings.COLORS.get(k, (255, 255, 255)) for k in ("accent", "win", "flag", "mine")]
+        self.winParticles = ParticleSystem(settings.PARTICLE_BUDGET, colors)
         self.finalElapsed = 0
+        # Dirty-region rendering (settings.DIRTY_RENDERING): screen areas to
+        # repaint next frame, or a full redraw when the layout changed
+        self._dirtyRects = []
+        self._fullRedraw = True
+        self._drawnState = None
+        self._scoreRect = None
+        self._drawnScore = None
+        # Window visibility, from window events; throttles the loop when off
+        self._windowFocused = True
+        self._windowMinimized = False
         self.initDisplay()
         self.running = True
         self.startTime = 0
 
+    @property
+    def currentTileSize(self):
+        return self.camera.tileSize
+
+    @currentTileSize.setter
+    def currentTileSize(self, value):
+        self.camera.tileSize = value
+
+    @property
+    def currentOffsetX(self):
+        return self.camera.offsetX
+
+    @currentOffsetX.setter
+    def currentOffsetX(self, value):
+        self.camera.offsetX = value
+
+    @property
+    def currentOffsetY(self):
+        return self.camera.offsetY
+
+    @currentOffsetY.setter
+    def currentOffsetY(self, value):
+        self.camera.offsetY = value
+
     def initDisplay(self):
         """Initialize pygame display and clock."""
         pygame.display.set_caption("Pysweeper")
         # Make window resizable
         self.screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT), pygame.RESIZABLE)
         self.clock = pygame.time.Clock()
+        # Held arrow keys keep panning the camera
+        pygame.key.set_repeat(250, 30)
 
         # Use pixel font for score display
         self.font = None  # Using draw_pixel_text instead
@@ -60,7 +119,9 @@ class Game:
         self.hud = Hud(0, 0, settings.WIDTH, settings.HUD_HEIGHT, onRestart=self.restartGame, onMenu=self.showMainMenu)
         self.menu = Menu(onStartGame=self.startGame, onShowLeaderboard=self.showLeaderboard)
         # Initialize leaderboard UI with storage
-        self.leaderboardStorage = LeaderboardStorage()
+        self.leaderboardStorage = createLeaderboardStorage()
+        # Scores are stored on a background thread (see _saveScore)
+        self.scoreWriter = ScoreWriter(self.leaderboardStorage)
         self.leaderboardUI = LeaderboardUI(self.leaderboardStorage, onBack=self.showMainMenu)
 
     def resizeWindow(self, rows, cols):
@@ -81,6 +142,9 @@ class Game:
         self.currentTileSize = tile_size
         self.currentOffsetX = offset_x
         self.currentOffsetY = offset_y
+        self.camera.setBoard(rows, cols)
+        self.camera.setViewport((0, settings.HUD_HEIGHT, width, height - settings.HUD_HEIGHT))
+        self.camera.clamp()
 
         # Update HUD with new width
         self.hud = Hud(0, 0, width, settings.HUD_HEIGHT, onRestart=self.restartGame, onMenu=self.showMainMenu)
@@ -88,23 +152,81 @@ class Game:
         # Update menu and leaderboard button positions
         self.menu.updateButtonPositions(width, height)
         self.leaderboardUI.updateButtonPositions(width, height)
+        self.markFullRedraw()
 
     def run(self):
-        """Main game loop running at specified FPS."""
+        """Main game loop.
+
+        Runs at up to `settings.FPS` while something is animating. Otherwise
+        it blocks on the event queue until input arrives or the HUD timer is
+        due to tick. With the window unfocused, animations are capped at
+        `settings.BACKGROUND_FPS`; while it is minimized nothing is drawn.
+        Scores still queued for saving are written before exiting.
+        """
         while self.running:
-            self.handleEvents()
+            self.handleEvents(self._nextEvents())
             self.update()
-            self.draw()
-            self.clock.tick(60)
+            if not self._windowMinimized:
+                self.draw()
+            # Only sleeps if the previous frame ended less than a frame ago
+            visible = self._windowFocused and not self._windowMinimized
+            self.clock.tick(settings.FPS if visible else settings.BACKGROUND_FPS)
+        self.scoreWriter.close()
         pygame.quit()
         sys.exit()
 
-    def handleEvents(self):
-        """Process all pygame events."""
-        for event in pygame.event.get():
+    def isAnimating(self):
+        """Return True while the screen changes without input (win confetti)."""
+        return self.state == GameState.WIN and bool(self.winParticles)
+
+    def _nextEvents(self):
+        """Return pending events, blocking while idle until there are some.
+
+        While idle, the wait ends by the next whole second of the game timer,
+        or after `settings.IDLE_MAX_WAIT_MS` when no timer is visible.
+        """
+        events = pygame.event.get()
+        if events or (self.isAnimating() and not self._windowMinimized):
+            return events
+
+        timeout = settings.IDLE_MAX_WAIT_MS
+        if self.state == GameState.PLAYING and not self._windowMinimized:
+            elapsedMs = pygame.time.get_ticks() - self.startTime
+            timeout = min(timeout, 1000 - elapsedMs % 1000)
+        event = pygame.event.wait(max(1, timeout))
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def handleEvents(self, events=None):
+        """Process pygame events.
+
+        Args:
+            events: Events to handle; defaults to draining the event queue.
+        """
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                self._windowFocused = False
+            elif event.type == pygame.WINDOWFOCUSGAINED:
+                self._windowFocused = True
+            elif event.type == pygame.WINDOWMINIMIZED:
+                self._windowMinimized = True
+            elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED, pygame.WINDOWSHOWN):
+                self._windowMinimized = False
+                self.markFullRedraw()
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.markFullRedraw()
+
+            elif event.type == SCORE_SAVED:
+                if event.game == self._gameNumber:
+                    self.lastScoreRank = event.rank
+                    self.markFullRedraw()
+
             elif event.type == pygame.VIDEORESIZE:
                 # Handle window resize event
                 self._handleWindowResize(event.w, event.h)
@@ -116,8 +238,10 @@ class Game:
                 self.menu.handleEvent(event)
                 self.handleMenuEvents(event)
             elif self.state == GameState.PLAYING:
+                self.handleCameraEvent(event)
                 self.handlePlayingEvents(event)
             elif self.state in (GameState.GAME_OVER, GameState.WIN):
+                self.handleCameraEvent(event)
                 self.handleEndGameEvents(event)
             elif self.state == GameState.LEADERBOARD:
                 self.handleLeaderboardEvents(event)
@@ -149,6 +273,9 @@ class Game:
             self.currentOffsetX = (new_width - board_width) // 2
             available_game_height = new_height - settings.HUD_HEIGHT - settings.BOARD_PADDING
             self.currentOffsetY = settings.HUD_HEIGHT + settings.BOARD_PADDING + (available_game_height - board_height) // 2
+
+        self.camera.setViewport((0, settings.HUD_HEIGHT, new_width, new_height - settings.HUD_HEIGHT))
+        self.camera.clamp()
         
         # Update HUD width
         if self.hud:
@@ -165,6 +292,8 @@ class Game:
         if self.leaderboardUI:
             self.leaderboardUI.updateButtonPositions(new_width, new_height)
 
+        self.markFullRedraw()
+
     def handleMenuEvents(self, event):
         """Handle events in menu state."""
         if event.type == pygame.KEYDOWN:
@@ -176,6 +305,36 @@ class Game:
         if event.type == pygame.MOUSEBUTTONDOWN:
             self.handleMouseClick(event)
 
+    def handleCameraEvent(self, event):
+        """Pan with a middle-button drag or the arrow keys, zoom with the wheel or +/-."""
+        camera = self.camera
+        moved = False
+        if event.type == pygame.MOUSEWHEEL:
+            moved = camera.zoomAt(event.y, pygame.mouse.get_pos())
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 2:
+            self._dragOrigin = event.pos
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 2:
+            self._dragOrigin = None
+        elif event.type == pygame.MOUSEMOTION and self._dragOrigin is not None:
+            moved = camera.pan(event.pos[0] - self._dragOrigin[0], event.pos[1] - self._dragOrigin[1])
+            self._dragOrigin = event.pos
+        elif event.type == pygame.KEYDOWN:
+            step = camera.PAN_STEP
+            pans = {
+                pygame.K_LEFT: (step, 0),
+                pygame.K_RIGHT: (-step, 0),
+                pygame.K_UP: (0, step),
+                pygame.K_DOWN: (0, -step),
+            }
+            if event.key in pans:
+                moved = camera.pan(*pans[event.key])
+            elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+                moved = camera.zoomAt(1, camera.viewport.center)
+            elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                moved = camera.zoomAt(-1, camera.viewport.center)
+        if moved:
+            self.markFullRedraw()
+
     def handleEndGameEvents(self, event):
         """Handle events after game ends."""
         if event.type == pygame.KEYDOWN:
@@ -206,44 +365,81 @@ class Game:
         if not self.board:
             return
 
-        boardStartX = self.currentOffsetX
-        boardStartY = self.currentOffsetY
-        tileSize = self.currentTileSize
-
-        col = (event.pos[0] - boardStartX) // tileSize
-        row = (event.pos[1] - boardStartY) // tileSize
-
-        if 0 <= row < self.board.rows and 0 <= col < self.board.cols:
+        cell = self.camera.cellAt(event.pos)
+        if cell is not None:
+            row, col = cell
             if event.button == 1:
-                self.board.revealTile(row, col)
+                self.markCells(self.board.revealTile(row, col))
             elif event.button == 3:
-                self.board.toggleFlag(row, col)
+                self.markCells(self.board.toggleFlag(row, col))
+
+    def markDirty(self, rect):
+        """Queue a screen rectangle to be repainted and presented next frame."""
+        self._dirtyRects.append(pygame.Rect(rect))
 
-    def startGame(self, rows, cols, mines):
-        """Initialize a new game with specified difficulty."""
+    def markFullRedraw(self):
+        """Make the next frame redraw and present the whole window."""
+        self._fullRedraw = True
+
+    def markCells(self, changes):
+        """Mark the tiles of `(start, stop)` flat index ranges from the board as dirty.
+
+        The ranges are queued for repainting in the offscreen board view.
+        A range within one row becomes one rectangle; a range spanning rows
+        is covered by the full-width band of those rows. Parts outside the
+        camera viewport are dropped.
+        """
+        self.boardView.markChanges(changes)
+        cols = self.board.cols
+        viewport = self.camera.viewport
+        for start, stop in changes:
+            firstRow, firstCol = divmod(start, cols)
+            lastRow, lastCol = divmod(stop - 1, cols)
+            if firstRow != lastRow:
+                firstCol, lastCol = 0, cols - 1
+            rect = self.camera.cellsRect(firstRow, firstCol, lastRow, lastCol).clip(viewport)
+            if rect.width and rect.height:
+                self.markDirty(rect)
+
+    def startGame(self, rows, cols, mines, seed=None, rng=None):
+        """Initialize a new game with specified difficulty.
+
+        Args:
+            rows, cols, mines: Board dimensions and mine count.
+            seed: Optional seed for a reproducible mine layout.
+            rng: Optional `random.Random` instance for mine placement.
+        """
         # Resize window for the selected difficulty
         self.resizeWindow(rows, cols)
 
-        self.board = Board(rows, cols, mines)
+        self.board = createBoard(rows, cols, mines, seed=seed, rng=rng)
         self.state = GameState.PLAYING
         self.startTime = pygame.time.get_ticks()
 
         # Reset win effect and final time
-        self.winParticles = []
+        self.winParticles.clear()
         self.finalElapsed = 0
 
         # Reset scoring
         self.score = 0
         self.currentScoreDisplay = 0
         self.revealedCount = 0
+        self._scoredReveals = -1
+        self._scoredSecond = -1
         self.lastScoreRank = None
+        self._gameNumber += 1
+        self.boardView.invalidate()
+        self.markFullRedraw()
+
+    def restartGame(self, seed=None, rng=None):
+        """Restart the current game with same settings.
 
-    def restartGame(self):
-        """Restart the current game with same settings."""
+        Pass the previous board's `seed` to replay the same layout.
+        """
         if self.board:
-            self.startGame(self.board.rows, self.board.cols, self.board.mineCount)
+            self.startGame(self.board.rows, self.board.cols, self.board.mineCount, seed=seed, rng=rng)
         else:
-            self.startGame(*Difficulty.MEDIUM)
+            self.startGame(*Difficulty.MEDIUM, seed=seed, rng=rng)
 
     def switchState(self, newState):
         """Change the current game state."""
@@ -283,18 +479,20 @@ class Game:
     def _updateScore(self, elapsed):
         """Update the current score based on tiles revealed.
 
+        The board keeps a running reveal count, so this only recalculates
+        when that count or the elapsed second has changed since last frame.
+
         Args:
             elapsed: Current elapsed time in seconds.
         """
         if not self.board:
             return
 
-        # Count revealed tiles
-        revealed = 0
-        for r in range(self.board.rows):
-            for c in range(self.board.cols):
-                if self.board.getTile(r, c).isRevealed:
-                    revealed += 1
+        revealed = self.board.revealedCount
+        if revealed == self._scoredReveals and elapsed == self._scoredSecond:
+            return
+        self._scoredReveals = revealed
+        self._scoredSecond = elapsed
 
         # Calculate score
         self._calculateScore(revealed, elapsed)
@@ -309,23 +507,8 @@ class Game:
         if revealed <= self.revealedCount:
             return
 
-        # Find difficulty tuple
         difficulty = (self.board.rows, self.board.cols, self.board.mineCount)
-        multiplier = Difficulty.MULTIPLIERS.get(difficulty, 1.0)
-
-        # Base points per tile
-        basePoints = revealed * settings.POINTS_BASE_PER_TILE
-
-        # Time bonus: max(0, 1000 - seconds_elapsed)
-        timeBonus = max(0, settings.POINTS_TIME_BONUS_MAX - elapsed)
-
-        # No flags bonus (if no flags used)
-        flagsUsed = self.board.flagCount
-        noFlagsBonus = settings.POINTS_NO_FLAGS_BONUS if flagsUsed == 0 else 0
-
-        # Calculate total: base * multiplier * noHintsMultiplier + time bonus + no flags bonus
-        self.score = int(basePoints * multiplier * settings.POINTS_NO_HINTS_MULTIPLIER)
-        self.score += timeBonus + noFlagsBonus
+        self.score = calculateScore(revealed, elapsed, difficulty, self.board.flagCount)
 
         self.revealedCount = revealed
 
@@ -365,13 +548,71 @@ class Game:
             timeElapsed=elapsed,
             hintsUsed=False,  # No hints system yet
             flagsUsed=flagsUsed,
+            seed=self.board.seed,
         )
 
-        # Save to leaderboard
-        self.lastScoreRank = self.leaderboardStorage.addScore(score.toDict())
+        # Save to leaderboard in the background; the rank arrives as SCORE_SAVED
+        future = self.scoreWriter.submit(score.toDict())
+        future.add_done_callback(lambda done, game=self._gameNumber: self._postScoreSaved(done, game))
+
+    @staticmethod
+    def _postScoreSaved(future, game):
+        """Writer-thread callback: hand the saved score's rank to the main loop."""
+        rank = -1 if future.exception() is not None else future.result()
+        pygame.event.post(pygame.event.Event(SCORE_SAVED, rank=rank, game=game))
 
     def draw(self):
-        """Render current game state to screen."""
+        """Render current game state to screen.
+
+        With `settings.DIRTY_RENDERING` on, frames during play repaint only
+        the regions marked dirty since the last frame (changed tiles, HUD and
+        score) and present them with `pygame.display.update`. A frame with
+        nothing marked draws nothing. Animated screens, state changes and
+        resizes still redraw and flip the whole window.
+        """
+        animated = self.state in (GameState.MENU, GameState.LEADERBOARD, GameState.WIN)
+        if (not settings.DIRTY_RENDERING or animated or self._fullRedraw
+                or self.state != self._drawnState):
+            self._drawScene()
+            pygame.display.flip()
+            self._finishFrame()
+            return
+
+        self._collectDirty()
+        if not self._dirtyRects:
+            return
+        screenRect = self.screen.get_rect()
+        rects = [rect.clip(screenRect) for rect in self._dirtyRects]
+        if len(rects) > self.MAX_DIRTY_RECTS:
+            rects = [rects[0].unionall(rects[1:])]
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self._drawScene()
+        self.screen.set_clip(None)
+        pygame.display.update(rects)
+        self._finishFrame()
+
+    def _collectDirty(self):
+        """Mark the HUD and score display when what they show has changed."""
+        if self.hud and self.hud.dirty:
+            self.markDirty(self.hud.rect)
+        if self.state == GameState.PLAYING and self.score != self._drawnScore:
+            if self._scoreRect:
+                self.markDirty(self._scoreRect)
+            self.markDirty(self._scoreDisplayRect())
+
+    def _finishFrame(self):
+        """Record what the frame just presented shows."""
+        self._dirtyRects = []
+        self._fullRedraw = False
+        self._drawnState = self.state
+        if self.hud:
+            self.hud.dirty = False
+        self._scoreRect = self._scoreDisplayRect() if self.state == GameState.PLAYING else None
+        self._drawnScore = self.score
+
+    def _drawScene(self):
+        """Draw every layer of the current screen, within the surface's clip."""
         self.screen.fill(settings.COLORS["background"])
 
         if self.hud:
@@ -394,56 +635,23 @@ class Game:
         # Optional: Draw scanline overlay for retro feel
         # self._draw_scanlines()
 
-        pygame.display.flip()
-
     def _start_win_effect(self):
-        """Initialize particle confetti effect on win."""
-        self.winParticles = []
+        """Launch the confetti over the visible part of the board."""
+        self.winParticles.clear()
         if not self.board:
             return
 
-        width = self.screen.get_width()
-        height = self.screen.get_height()
-
-        num_particles = max(30, (self.board.rows * self.board.cols) // 2)
-        colors = [settings.COLORS.get(k, (255, 255, 255)) for k in ("accent", "win", "flag", "mine")]
-
-        for _ in range(num_particles):
-            p = {
-                "x": random.randint(0, width),
-                "y": random.randint(self.currentOffsetY, self.currentOffsetY + self.board.rows * self.currentTileSize),
-                "vx": random.uniform(-2.5, 2.5),
-                "vy": random.uniform(-6.0, -1.5),
-                "size": random.randint(2, 6),
-                "color": random.choice(colors),
-                "life": random.randint(60, 140)
-            }
-            self.winParticles.append(p)
+        area = self.camera.viewport.clip(self.camera.boardRect())
+        wanted = max(30, (self.board.rows * self.board.cols) // 2)
+        self.winParticles.spawn(wanted, (0, area.top, self.screen.get_width(), area.height))
 
     def _update_win_effect(self):
         """Update particle positions and lifetimes."""
-        if not self.winParticles:
-            return
-
-        gravity = 0.22
-        new_particles = []
-        for p in self.winParticles:
-            p["x"] += p["vx"]
-            p["y"] += p["vy"]
-            p["vy"] += gravity
-            p["life"] -= 1
-            # keep particles on screen for lifetime
-            if p["life"] > 0 and 0 <= p["x"] <= self.screen.get_width() and p["y"] <= self.screen.get_height() + 50:
-                new_particles.append(p)
-        self.winParticles = new_particles
+        self.winParticles.update(self.screen.get_width(), self.screen.get_height())
 
     def _draw_win_effect(self):
         """Render confetti particles to the screen."""
-        if not self.winParticles:
-            return
-        for p in self.winParticles:
-            rect = (int(p["x"]), int(p["y"]), p["size"], p["size"])
-            pygame.draw.rect(self.screen, p["color"], rect)
+        self.winParticles.draw(self.screen)
 
     def _draw_scanlines(self):
         """Draw subtle scanline overlay for retro CRT effect."""
@@ -463,147 +671,30 @@ class Game:
         draw_pixel_text(self.screen, score_str, score_x, settings.HUD_HEIGHT + 10,
                        settings.COLORS["accent"], size='medium')
 
+    def _scoreDisplayRect(self):
+        """Return the screen area `drawScoreDisplay` covers for the current score."""
+        score_str = f"Score: {self.score:,}"
+        score_x = self.screen.get_width() - 20 - len(score_str) * 16
+        return pygame.Rect(score_x, settings.HUD_HEIGHT + 10,
+                           get_pixel_text_width(score_str, size='medium'),
+                           get_pixel_text_height(size='medium'))
+
     def drawGame(self):
-        """Render the game board."""
-        if self.board:
-            for r in range(self.board.rows):
-                for c in range(self.board.cols):
-                    self.drawTile(r, c)
-
-    def drawTile(self, row, col):
-        """Draw a single tile at grid position with pixel art style."""
-        tile = self.board.getTile(row, col)
-        x = self.currentOffsetX + col * self.currentTileSize
-        y = self.currentOffsetY + row * self.currentTileSize
-        size = self.currentTileSize - 2
-        bevel_size = 2
-
-        if tile.isRevealed:
-            # Draw revealed tile - flat with pixel border
-            pygame.draw.rect(
-                self.screen,
-                settings.COLORS["tile_revealed"],
-                (x, y, size, size)
-            )
-            # Sharp pixel border for revealed tiles
-            pygame.draw.rect(
-                self.screen,
-                settings.COLORS["tile_border_dark"],
-                (x, y, size, size),
-                1
-            )
-
-            if tile.isMine:
-                # Pixel art style mine - blocky representation
-                self._draw_pixel_mine(x, y, size)
-            elif tile.neighborCount > 0:
-                color = settings.NUMBER_COLORS.get(tile.neighborCount, settings.COLORS["text_primary"])
-                # Use true pixel art text for numbers
-                num_str = str(tile.neighborCount)
-                num_x = x + size // 2 - len(num_str) * 8
-                num_y = y + size // 2 - 7
-                draw_pixel_text(self.screen, num_str, num_x, num_y, color, size='medium')
-        else:
-            # Draw unrevealed tile with pixel-style 3D bevel effect
-            self._draw_bevel_tile(x, y, size, bevel_size, tile.isFlagged)
+        """Render the board inside both the camera viewport and the surface's clip.
 
-    def _draw_bevel_tile(self, x, y, size, bevel_size, is_flagged):
-        """Draw an unrevealed tile with pixel-style raised bevel effect."""
-        base_color = settings.COLORS["tile_unrevealed"]
-        
-        # Light color for top-left bevel
-        light_color = (
-            min(255, base_color[0] + 30),
-            min(255, base_color[1] + 30),
-            min(255, base_color[2] + 30)
-        )
-        
-        # Dark color for bottom-right bevel
-        dark_color = (
-            max(0, base_color[0] - 30),
-            max(0, base_color[1] - 30),
-            max(0, base_color[2] - 30)
-        )
-        
-        # Draw base tile
-        pygame.draw.rect(self.screen, base_color, (x + bevel_size, y + bevel_size, 
-                                                   size - bevel_size * 2, size - bevel_size * 2))
-        
-        # Draw top and left bevels (light)
-        for i in range(bevel_size):
-            pygame.draw.line(self.screen, light_color, 
-                           (x + i, y + i), (x + size - 1 - i, y + i))
-            pygame.draw.line(self.screen, light_color,
-                           (x + i, y + i), (x + i, y + size - 1 - i))
-        
-        # Draw bottom and right bevels (dark)
-        for i in range(bevel_size):
-            pygame.draw.line(self.screen, dark_color,
-                           (x + i, y + size - 1 - i), (x + size - 1 - i, y + size - 1 - i))
-            pygame.draw.line(self.screen, dark_color,
-                           (x + size - 1 - i, y + i), (x + size - 1 - i, y + size - 1 - i))
-        
-        # Draw flag if flagged
-        if is_flagged:
-            self._draw_pixel_flag(x, y, size)
-
-    def _draw_pixel_mine(self, x, y, size):
-        """Draw a pixel art style mine."""
-        center_x = x + size // 2
-        center_y = y + size // 2
-        pixel_size = max(3, size // 8)
-        
-        # Mine color
-        mine_color = settings.COLORS["mine"]
-        
-        # Draw center body
-        body_rect = pygame.Rect(center_x - pixel_size, center_y - pixel_size,
-                               pixel_size * 2, pixel_size * 2)
-        pygame.draw.rect(self.screen, mine_color, body_rect)
-        
-        # Draw spikes (cross pattern)
-        spike_length = pixel_size * 2
-        # Horizontal spike
-        pygame.draw.line(self.screen, mine_color,
-                        (center_x - spike_length, center_y),
-                        (center_x + spike_length, center_y), pixel_size)
-        # Vertical spike
-        pygame.draw.line(self.screen, mine_color,
-                        (center_x, center_y - spike_length),
-                        (center_x, center_y + spike_length), pixel_size)
-        
-        # Diagonal spikes
-        diag_offset = int(spike_length * 0.7)
-        pygame.draw.line(self.screen, mine_color,
-                        (center_x - diag_offset, center_y - diag_offset),
-                        (center_x + diag_offset, center_y + diag_offset), pixel_size // 2)
-        pygame.draw.line(self.screen, mine_color,
-                        (center_x - diag_offset, center_y + diag_offset),
-                        (center_x + diag_offset, center_y - diag_offset), pixel_size // 2)
-
-    def _draw_pixel_flag(self, x, y, size):
-        """Draw a pixel art style flag."""
-        center_x = x + size // 2
-        base_y = y + size - 6
-        flag_color = settings.COLORS["flag"]
-        pole_color = settings.COLORS["text_secondary"]
-        
-        # Flag pole
-        pole_height = size // 2
-        pole_width = max(2, size // 12)
-        pygame.draw.rect(self.screen, pole_color, 
-                        (center_x - pole_width // 2, base_y - pole_height, 
-                         pole_width, pole_height))
-        
-        # Flag triangle
-        flag_height = size // 3
-        flag_width = size // 3
-        points = [
-            (center_x, y + 4),
-            (center_x + flag_width, y + 4 + flag_height // 2),
-            (center_x, y + 4 + flag_height)
-        ]
-        pygame.draw.polygon(self.screen, flag_color, points)
+        The visible tiles live in the offscreen `boardView`, which only
+        repaints cells changed since the last frame, so drawing the board is
+        a single blit regardless of its size.
+        """
+        if self.board:
+            surface = self.boardView.render(self.board, self.camera, self._getTileAtlas())
+            self.screen.blit(surface, self.camera.viewport.topleft)
+
+    def _getTileAtlas(self):
+        """Return the tile atlas for the current tile size, rebuilding it on change."""
+        if self.tileAtlas is None or self.tileAtlas.tileSize != self.currentTileSize:
+            self.tileAtlas = TileAtlas(self.currentTileSize)
+        return self.tileAtlas
 
     def drawEndGameOverlay(self):
         """Draw game over or win message with pixel art style."""
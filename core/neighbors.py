@@ -0,0 +1,118 @@
+"""Precomputed neighbor adjacency shared by every board of the same shape.
+
+A table stores the 8-neighborhood of every cell in CSR form: the
+neighbors of flat index `i` are `indices[offsets[i]:offsets[i + 1]]`.
+Tables are built once per (rows, cols) and kept in a small LRU cache
+bounded by total size. Restarting a game, or playing many games of the
+same difficulty, reuses the same table.
+"""
+
+from array import array
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; tables are built in pure Python then
+    np = None
+
+# Boards larger than this are not given a table (it would be 32+ MB)
+MAX_TABLE_CELLS = 1_000_000
+
+# Total bytes of cached tables kept alive across board shapes
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class NeighborTable:
+    """CSR adjacency for one board shape."""
+
+    __slots__ = ("rows", "cols", "offsets", "indices")
+
+    def __init__(self, rows, cols, offsets, indices):
+        self.rows = rows
+        self.cols = cols
+        self.offsets = offsets
+        self.indices = indices
+
+    def of(self, index):
+        """Return the flat indices adjacent to cell `index`."""
+        return self.indices[self.offsets[index]:self.offsets[index + 1]]
+
+    @property
+    def nbytes(self):
+        return (len(self.offsets) * self.offsets.itemsize
+                + len(self.indices) * self.indices.itemsize)
+
+
+_cache = OrderedDict()
+_cacheBytes = 0
+
+
+def getNeighborTable(rows, cols):
+    """Return the (cached) neighbor table for a board shape.
+
+    Returns None for boards above `MAX_TABLE_CELLS`; callers fall back to
+    computing neighbors arithmetically there.
+    """
+    global _cacheBytes
+    key = (rows, cols)
+    table = _cache.get(key)
+    if table is not None:
+        _cache.move_to_end(key)
+        return table
+    if rows * cols > MAX_TABLE_CELLS:
+        return None
+
+    table = _buildNumpy(rows, cols) if np is not None else _buildPython(rows, cols)
+    _cache[key] = table
+    _cacheBytes += table.nbytes
+    # Evict least recently used shapes, but always keep the one just built
+    while _cacheBytes > CACHE_MAX_BYTES and len(_cache) > 1:
+        _, evicted = _cache.popitem(last=False)
+        _cacheBytes -= evicted.nbytes
+    return table
+
+
+def clearNeighborCache():
+    """Drop every cached table."""
+    global _cacheBytes
+    _cache.clear()
+    _cacheBytes = 0
+
+
+def _buildPython(rows, cols):
+    offsets = array("i", [0])
+    indices = array("i")
+    for r in range(rows):
+        rowLo, rowHi = max(0, r - 1), min(rows, r + 2)
+        for c in range(cols):
+            colLo, colHi = max(0, c - 1), min(cols, c + 2)
+            for nr in range(rowLo, rowHi):
+                base = nr * cols
+                if nr == r:
+                    indices.extend(range(base + colLo, base + c))
+                    indices.extend(range(base + c + 1, base + colHi))
+                else:
+                    indices.extend(range(base + colLo, base + colHi))
+            offsets.append(len(indices))
+    return NeighborTable(rows, cols, offsets, indices)
+
+
+def _buildNumpy(rows, cols):
+    r, c = np.divmod(np.arange(rows * cols, dtype=np.int64), cols)
+    candidates = []
+    valid = []
+    for dr in (-1, 0, 1):
+        for dc in (-1, 0, 1):
+            if dr == 0 and dc == 0:
+                continue
+            nr, nc = r + dr, c + dc
+            candidates.append(nr * cols + nc)
+            valid.append((nr >= 0) & (nr < rows) & (nc >= 0) & (nc < cols))
+    # Row-major (cell, direction) order keeps each cell's neighbors together
+    candidates = np.stack(candidates, axis=1)
+    valid = np.stack(valid, axis=1)
+
+    offsets = np.zeros(rows * cols + 1, dtype=np.int32)
+    np.cumsum(valid.sum(axis=1), out=offsets[1:])
+    indices = candidates[valid].astype(np.int32)
+    return NeighborTable(rows, cols, array("i", offsets.tobytes()), array("i", indices.tobytes()))
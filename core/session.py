@@ -0,0 +1,104 @@
+"""Headless game session: board, timer and scoring without pygame.
+
+`GameSession` reproduces what `Game` does during play (timer, live score,
+end-of-game detection and the final score entry) using only `Board` and
+the shared scoring rules, so games can run in worker processes or on
+machines without a display.
+"""
+
+import time
+
+from .board import createBoard
+from .state import GameState, Score, calculateScore
+
+
+class GameSession:
+    """A single game driven by method calls instead of pygame events."""
+
+    def __init__(self, rows, cols, mines, seed=None, rng=None, clock=time.monotonic, board=None,
+                 backend=None):
+        """Start a new session.
+
+        Args:
+            rows, cols, mines: Board dimensions and mine count.
+            seed: Optional seed for a reproducible layout.
+            rng: Optional `random.Random` instance for mine placement.
+            clock: Callable returning the current time in seconds. Inject a
+                   fake clock to simulate play time deterministically.
+            board: Optional prepared board (e.g. from `LayoutBatch.toBoard`);
+                   the dimension, seed and rng arguments are ignored then.
+            backend: Board storage backend for `createBoard`; defaults to
+                     `settings.BOARD_BACKEND`.
+        """
+        if board is None:
+            board = createBoard(rows, cols, mines, seed=seed, rng=rng, backend=backend)
+        self.board = board
+        self.clock = clock
+        self.startTime = clock()
+        self.state = GameState.PLAYING
+        self.score = 0
+        self.revealedCount = 0
+        self.finalElapsed = 0
+        self.moves = 0
+
+    @property
+    def difficulty(self):
+        """Tuple (rows, cols, mines) identifying the difficulty."""
+        return (self.board.rows, self.board.cols, self.board.mineCount)
+
+    @property
+    def isOver(self):
+        return self.state != GameState.PLAYING
+
+    def elapsed(self):
+        """Whole seconds played, frozen once the game has ended."""
+        if self.isOver:
+            return self.finalElapsed
+        return int(self.clock() - self.startTime)
+
+    def reveal(self, row, col):
+        """Reveal a tile, as a left click would."""
+        if self.isOver:
+            return
+        self.board.revealTile(row, col)
+        self._afterMove()
+
+    def toggleFlag(self, row, col):
+        """Flag or unflag a tile, as a right click would."""
+        if self.isOver:
+            return
+        self.board.toggleFlag(row, col)
+        self._afterMove()
+
+    def _afterMove(self):
+        """Update the score and detect the end of the game, like `Game.update`."""
+        self.moves += 1
+        elapsed = self.elapsed()
+        self._calculateScore(self.board.revealedCount, elapsed)
+
+        if self.board.gameState == GameState.GAME_OVER:
+            self.finalElapsed = elapsed
+            self.state = GameState.GAME_OVER
+        elif self.board.gameState == GameState.WIN:
+            self.finalElapsed = elapsed
+            self.state = GameState.WIN
+            # Recalculate score with final revealed count
+            rows, cols, mines = self.difficulty
+            self._calculateScore(rows * cols - mines, elapsed)
+
+    def _calculateScore(self, revealed, elapsed):
+        if revealed <= self.revealedCount:
+            return
+        self.score = calculateScore(revealed, elapsed, self.difficulty, self.board.flagCount)
+        self.revealedCount = revealed
+
+    def toScore(self):
+        """Return the `Score` entry `Game._saveScore` would record for this game."""
+        return Score(
+            score=self.score,
+            difficulty=self.difficulty,
+            timeElapsed=self.elapsed(),
+            hintsUsed=False,
+            flagsUsed=self.board.flagCount,
+            seed=self.board.seed,
+        )
@@ -0,0 +1,149 @@
+"""Bulk game simulation on top of `GameSession`, spread over worker processes.
+
+A simple rule-based bot plays each game. It flags a number's hidden
+neighbors when they must all be mines, reveals them when the number's
+flags are already complete, and otherwise guesses. Game `i` of a run uses
+board seed `seed + i`, so every simulated game can be replayed on its own.
+"""
+
+import os
+import time
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from .neighbors import getNeighborTable
+from .session import GameSession
+from .state import GameState
+
+
+class SimulatedClock:
+    """Fake clock that advances a fixed amount of time per move."""
+
+    def __init__(self, secondsPerMove=1.0):
+        self.now = 0.0
+        self.secondsPerMove = secondsPerMove
+
+    def __call__(self):
+        return self.now
+
+    def tick(self):
+        self.now += self.secondsPerMove
+
+
+def playGame(rows, cols, mines, seed, secondsPerMove=1.0):
+    """Play one game with the bot and return its `GameSession`."""
+    clock = SimulatedClock(secondsPerMove)
+    # The bot reads the flat cell buffers directly, so it needs the array backend
+    session = GameSession(rows, cols, mines, seed=seed, clock=clock, backend="array")
+    board = session.board
+    table = getNeighborTable(rows, cols)
+    neighborsOf = table.of if table is not None else board.neighborIndices
+    guessRng = random.Random(seed)
+
+    clock.tick()
+    session.reveal(rows // 2, cols // 2)
+
+    revealed, flagged, counts = board.revealed, board.flagged, board.neighborCounts
+    while not session.isOver:
+        acted = False
+        for i in range(rows * cols):
+            if not revealed[i] or not counts[i]:
+                continue
+            neighbors = neighborsOf(i)
+            hidden = [j for j in neighbors if not revealed[j] and not flagged[j]]
+            if not hidden:
+                continue
+            flags = sum(flagged[j] for j in neighbors)
+            if counts[i] - flags == len(hidden):
+                for j in hidden:
+                    clock.tick()
+                    session.toggleFlag(*divmod(j, cols))
+                acted = True
+            elif counts[i] == flags:
+                for j in hidden:
+                    clock.tick()
+                    session.reveal(*divmod(j, cols))
+                acted = True
+            if session.isOver:
+                break
+
+        if not acted and not session.isOver:
+            hidden = [i for i in range(rows * cols) if not revealed[i] and not flagged[i]]
+            clock.tick()
+            session.reveal(*divmod(guessRng.choice(hidden), cols))
+    return session
+
+
+def _emptyTotals():
+    return {"games": 0, "wins": 0, "scoreSum": 0, "bestScore": 0, "timeSum": 0, "moves": 0}
+
+
+def _mergeTotals(total, part):
+    for key in ("games", "wins", "scoreSum", "timeSum", "moves"):
+        total[key] += part[key]
+    total["bestScore"] = max(total["bestScore"], part["bestScore"])
+    return total
+
+
+def runChunk(rows, cols, mines, firstSeed, count, secondsPerMove=1.0):
+    """Play `count` games with consecutive seeds and return summed results."""
+    totals = _emptyTotals()
+    for seed in range(firstSeed, firstSeed + count):
+        session = playGame(rows, cols, mines, seed, secondsPerMove)
+        totals["games"] += 1
+        totals["wins"] += session.state == GameState.WIN
+        totals["scoreSum"] += session.score
+        totals["bestScore"] = max(totals["bestScore"], session.score)
+        totals["timeSum"] += session.elapsed()
+        totals["moves"] += session.moves
+    return totals
+
+
+def _runChunkArgs(args):
+    return runChunk(*args)
+
+
+def runSimulation(rows, cols, mines, games, seed=0, workers=None, chunkSize=1000, secondsPerMove=1.0):
+    """Play `games` games across a process pool and aggregate the results.
+
+    Args:
+        rows, cols, mines: Board dimensions and mine count.
+        games: Total number of games to play.
+        seed: Seed of the first game; game i uses `seed + i`.
+        workers: Worker processes (defaults to the CPU count); 1 runs inline.
+        chunkSize: Games per task sent to a worker.
+        secondsPerMove: Simulated time each bot action takes.
+
+    Returns:
+        dict with game/win counts, win rate, mean and best score, mean time,
+        total moves, wall time and throughput.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = [
+        (rows, cols, mines, seed + start, min(chunkSize, games - start), secondsPerMove)
+        for start in range(0, games, chunkSize)
+    ]
+
+    started = time.perf_counter()
+    totals = _emptyTotals()
+    if workers == 1:
+        for chunk in chunks:
+            _mergeTotals(totals, runChunk(*chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_runChunkArgs, chunks):
+                _mergeTotals(totals, part)
+    wall = time.perf_counter() - started
+
+    played = max(1, totals["games"])
+    return {
+        "games": totals["games"],
+        "wins": totals["wins"],
+        "winRate": totals["wins"] / played,
+        "meanScore": totals["scoreSum"] / played,
+        "bestScore": totals["bestScore"],
+        "meanTime": totals["timeSum"] / played,
+        "moves": totals["moves"],
+        "wallTime": wall,
+        "gamesPerSecond": totals["games"] / wall if wall else 0.0,
+    }
@@ -1,5 +1,7 @@
 """Game state constants and score tracking for clean state machine transitions."""
 
+import settings
+
 
 class GameState:
     """Enumeration of possible game states."""
@@ -11,6 +13,19 @@ class GameState:
     LEADERBOARD = 4  # New state for leaderboard view
 
 
+class TileState:
+    """Visual states of a board cell, as returned by `Board.cellState`.
+
+    A revealed safe cell's state is its neighbor count (0-8).
+    """
+
+    UNREVEALED = 9
+    FLAGGED = 10
+    MINE = 11
+    EXPLODED = 12  # The mine that was clicked
+    COUNT = 13
+
+
 class Difficulty:
     """Difficulty presets for game configuration."""
 
@@ -36,7 +51,7 @@ class Difficulty:
 class Score:
     """Represents a completed game score with all relevant metadata."""
 
-    def __init__(self, score, difficulty, timeElapsed, date=None, hintsUsed=True, flagsUsed=0):
+    def __init__(self, score, difficulty, timeElapsed, date=None, hintsUsed=True, flagsUsed=0, seed=None):
         """Initialize a score entry.
 
         Args:
@@ -46,6 +61,7 @@ class Score:
             date: ISO format date string (defaults to current time)
             hintsUsed: Whether hints were used during gameplay
             flagsUsed: Number of flags placed during the game
+            seed: Board seed, so the layout can be regenerated (None if unknown)
         """
         self.score = score
         self.difficulty = difficulty
@@ -53,6 +69,7 @@ class Score:
         self.date = date or self._getCurrentDate()
         self.hintsUsed = hintsUsed
         self.flagsUsed = flagsUsed
+        self.seed = seed
 
     def _getCurrentDate(self):
         """Get current date in ISO format."""
@@ -68,6 +85,7 @@ class Score:
             "time_elapsed": self.timeElapsed,
             "hints_used": self.hintsUsed,
             "flags_used": self.flagsUsed,
+            "seed": self.seed,
         }
 
     @classmethod
@@ -87,6 +105,7 @@ class Score:
             date=data.get("date"),
             hintsUsed=data.get("hints_used", True),
             flagsUsed=data.get("flags_used", 0),
+            seed=data.get("seed"),
         )
 
     def getDifficultyName(self):
@@ -96,3 +115,30 @@ class Score:
     def getMultiplier(self):
         """Get the score multiplier for this difficulty."""
         return Difficulty.MULTIPLIERS.get(self.difficulty, 1.0)
+
+
+def calculateScore(revealed, elapsed, difficulty, flagsUsed):
+    """Compute the score for a game in progress or just finished.
+
+    Args:
+        revealed: Number of tiles revealed.
+        elapsed: Time elapsed in seconds.
+        difficulty: Tuple (rows, cols, mines) identifying difficulty.
+        flagsUsed: Number of flags currently placed.
+
+    Returns:
+        int: base * multiplier * noHintsMultiplier + time bonus + no flags bonus
+    """
+    multiplier = Difficulty.MULTIPLIERS.get(difficulty, 1.0)
+
+    # Base points per tile
+    basePoints = revealed * settings.POINTS_BASE_PER_TILE
+
+    # Time bonus: max(0, 1000 - seconds_elapsed)
+    timeBonus = max(0, settings.POINTS_TIME_BONUS_MAX - elapsed)
+
+    # No flags bonus (if no flags used)
+    noFlagsBonus = settings.POINTS_NO_FLAGS_BONUS if flagsUsed == 0 else 0
+
+    score = int(basePoints * multiplier * settings.POINTS_NO_HINTS_MULTIPLIER)
+    return score + timeBonus + noFlagsBonus
@@ -4,6 +4,9 @@ Provides a minimal API used by `Board` and `Game`:
 - `isMine`, `isRevealed`, `isFlagged`, `neighborCount`
 - `reveal()` -> returns True if revealing this tile detonates a mine
 - `toggleFlag()` -> toggles flag state
+
+`TileView` offers the same API over a `Board`'s flat cell buffers, and
+`TileGrid` keeps `board.tiles[row][col]` indexing working on top of it.
 """
 
 class Tile:
@@ -38,3 +41,135 @@ class Tile:
 			f"Tile(r={self.row},c={self.col},mine={self.isMine},"
 			f"rev={self.isRevealed},flag={self.isFlagged},n={self.neighborCount})"
 		)
+
+
+class TileView:
+	"""Lightweight view of one cell stored in a `Board`'s flat buffers.
+
+	Exposes the same attributes and methods as `Tile` but holds no state of
+	its own, so boards can hand out views on demand instead of keeping one
+	object per cell alive.
+	"""
+
+	__slots__ = ("board", "index", "row", "col")
+
+	def __init__(self, board, row: int, col: int):
+		self.board = board
+		self.row = row
+		self.col = col
+		self.index = row * board.cols + col
+
+	@property
+	def isMine(self) -> bool:
+		return bool(self.board.mines[self.index])
+
+	@isMine.setter
+	def isMine(self, value: bool):
+		self.board.mines[self.index] = 1 if value else 0
+
+	@property
+	def isRevealed(self) -> bool:
+		return bool(self.board.revealed[self.index])
+
+	@isRevealed.setter
+	def isRevealed(self, value: bool):
+		self.board.revealed[self.index] = 1 if value else 0
+
+	@property
+	def isFlagged(self) -> bool:
+		return bool(self.board.flagged[self.index])
+
+	@isFlagged.setter
+	def isFlagged(self, value: bool):
+		self.board.flagged[self.index] = 1 if value else 0
+
+	@property
+	def neighborCount(self) -> int:
+		return self.board.neighborCounts[self.index]
+
+	@neighborCount.setter
+	def neighborCount(self, value: int):
+		self.board.neighborCounts[self.index] = value
+
+	def reveal(self) -> bool:
+		"""Reveal the tile.
+
+		Returns True if the tile was a mine (exploded), False otherwise.
+		"""
+		board = self.board
+		index = self.index
+		if board.revealed[index] or board.flagged[index]:
+			return False
+
+		board.revealed[index] = 1
+		return bool(board.mines[index])
+
+	def toggleFlag(self) -> bool:
+		"""Toggle flag state and return the new flag value."""
+		board = self.board
+		index = self.index
+		if board.revealed[index]:
+			return bool(board.flagged[index])
+		board.flagged[index] ^= 1
+		return bool(board.flagged[index])
+
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, TileView):
+			return NotImplemented
+		return self.board is other.board and self.index == other.index
+
+	def __hash__(self) -> int:
+		return hash((id(self.board), self.index))
+
+	def __repr__(self) -> str:
+		return (
+			f"Tile(r={self.row},c={self.col},mine={self.isMine},"
+			f"rev={self.isRevealed},flag={self.isFlagged},n={self.neighborCount})"
+		)
+
+
+class TileGrid:
+	"""Read-only `grid[row][col]` access to a board's cells via `getTile`."""
+
+	__slots__ = ("board",)
+
+	def __init__(self, board):
+		self.board = board
+
+	def __len__(self) -> int:
+		return self.board.rows
+
+	def __getitem__(self, row: int) -> "TileRow":
+		if row < 0:
+			row += self.board.rows
+		if not 0 <= row < self.board.rows:
+			raise IndexError("row index out of range")
+		return TileRow(self.board, row)
+
+	def __iter__(self):
+		for row in range(self.board.rows):
+			yield TileRow(self.board, row)
+
+
+class TileRow:
+	"""One row of a `TileGrid`."""
+
+	__slots__ = ("board", "row")
+
+	def __init__(self, board, row: int):
+		self.board = board
+		self.row = row
+
+	def __len__(self) -> int:
+		return self.board.cols
+
+	def __getitem__(self, col: int):
+		if col < 0:
+			col += self.board.cols
+		if not 0 <= col < self.board.cols:
+			raise IndexError("column index out of range")
+		return self.board.getTile(self.row, col)
+
+	def __iter__(self):
+		for col in range(self.board.cols):
+			yield self.board.getTile(self.row, col)
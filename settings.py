@@ -1,6 +1,15 @@
 WIDTH = 800
 HEIGHT = 800
 FPS = 60
+# Frame cap while the window is unfocused or minimized
+BACKGROUND_FPS = 10
+# Longest the idle loop blocks waiting for events (ms)
+IDLE_MAX_WAIT_MS = 1000
+# Most confetti particles alive at once in the win effect
+PARTICLE_BUDGET = 2000
+
+# Repaint only changed screen regions during play instead of the whole window
+DIRTY_RENDERING = True
 
 ROWS = 16
 COLS = 16
@@ -10,6 +19,9 @@ TILE_SIZE = 36
 HUD_HEIGHT = 60
 BOARD_PADDING = 20
 
+# Board storage backend: "array" (flat byte buffers) or "bitboard" (big-int bitmasks)
+BOARD_BACKEND = "array"
+
 # Dynamic window dimensions by difficulty (width, height)
 DIFFICULTY_WINDOWS = {
     "easy": (450, 450),      # 9x9 board
@@ -146,3 +158,9 @@ POINTS_NO_HINTS_MULTIPLIER = 2.0
 POINTS_TIME_BONUS_MAX = 1000
 POINTS_NO_FLAGS_BONUS = 500
 LEADERBOARD_MAX_ENTRIES = 10
+# Leaderboard storage: "json" (top scores only) or "sqlite" (every game)
+LEADERBOARD_BACKEND = "json"
+# Journaled scores that trigger a rewrite of the JSON leaderboard snapshot
+LEADERBOARD_COMPACT_EVERY = 50
+# How often the leaderboard file is checked for outside changes (ms)
+LEADERBOARD_STAT_INTERVAL_MS = 1000
@@ -0,0 +1,50 @@
+"""Run headless Pysweeper games with a bot and print aggregate results.
+
+Usage:
+    python simulate.py --games 1000000 --difficulty easy --workers 8
+    python simulate.py --games 5000 --rows 50 --cols 50 --mines 400
+"""
+
+import argparse
+
+from core.simulation import runSimulation
+from core.state import Difficulty
+
+
+DIFFICULTIES = {name.lower(): diff for diff, name in Difficulty.NAMES.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate Pysweeper games without a display.")
+    parser.add_argument("--games", type=int, default=10_000, help="number of games to play")
+    parser.add_argument("--difficulty", choices=sorted(DIFFICULTIES), default="easy")
+    parser.add_argument("--rows", type=int, help="custom board rows (overrides --difficulty)")
+    parser.add_argument("--cols", type=int, help="custom board columns")
+    parser.add_argument("--mines", type=int, help="custom mine count")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="games per worker task")
+    parser.add_argument("--seconds-per-move", type=float, default=1.0, help="simulated time per bot action")
+    args = parser.parse_args()
+
+    rows, cols, mines = DIFFICULTIES[args.difficulty]
+    if args.rows or args.cols or args.mines:
+        if not (args.rows and args.cols and args.mines is not None):
+            parser.error("--rows, --cols and --mines must be given together")
+        rows, cols, mines = args.rows, args.cols, args.mines
+
+    stats = runSimulation(rows, cols, mines, args.games, seed=args.seed, workers=args.workers,
+                          chunkSize=args.chunk_size, secondsPerMove=args.seconds_per_move)
+
+    print(f"Board:        {rows}x{cols}, {mines} mines")
+    print(f"Games:        {stats['games']:,}")
+    print(f"Wins:         {stats['wins']:,} ({stats['winRate']:.1%})")
+    print(f"Mean score:   {stats['meanScore']:,.1f}")
+    print(f"Best score:   {stats['bestScore']:,}")
+    print(f"Mean time:    {stats['meanTime']:.1f} s")
+    print(f"Moves:        {stats['moves']:,}")
+    print(f"Wall time:    {stats['wallTime']:.2f} s ({stats['gamesPerSecond']:,.0f} games/s)")
+
+
+if __name__ == "__main__":
+    main()
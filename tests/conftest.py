@@ -0,0 +1,8 @@
+"""Shared pytest setup: puts the repository root on `sys.path`."""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
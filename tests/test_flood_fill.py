@@ -0,0 +1,162 @@
+"""Flood fill of both board backends against a cell-by-cell reference.
+
+The reference replays the original stack-based flood fill on plain sets,
+so any board move can be checked for the cells it reveals, the counters
+it leaves and the change ranges it returns.
+"""
+
+import random
+
+import pytest
+
+from core.bitboard import BitBoard
+from core.board import BOARD_BACKENDS, Board
+from core.state import GameState, TileState
+
+BOARD_CLASSES = {"array": Board, "bitboard": BitBoard}
+NEIGHBOR_OFFSETS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+
+
+class ReferenceBoard:
+    """Minimal board that reveals one cell at a time, as the game first did."""
+
+    def __init__(self, rows, cols, mines):
+        self.rows, self.cols = rows, cols
+        self.mines = {i for i, mine in enumerate(mines) if mine}
+        self.counts = [
+            sum((r + dr) * cols + c + dc in self.mines
+                for dr, dc in NEIGHBOR_OFFSETS
+                if 0 <= r + dr < rows and 0 <= c + dc < cols)
+            for r in range(rows) for c in range(cols)
+        ]
+        self.revealed = set()
+        self.flagged = set()
+
+    @property
+    def safeRevealed(self):
+        return len(self.revealed - self.mines)
+
+    @property
+    def wrongFlags(self):
+        return len(self.flagged - self.mines)
+
+    def revealTile(self, row, col):
+        i = row * self.cols + col
+        if i in self.revealed or i in self.flagged:
+            return
+        self.revealed.add(i)
+        if i in self.mines:
+            self.revealed |= self.mines
+        elif self.counts[i] == 0:
+            self.floodFill(row, col)
+
+    def floodFill(self, row, col):
+        stack = [(row, col)]
+        while stack:
+            r, c = stack.pop()
+            for dr, dc in NEIGHBOR_OFFSETS:
+                nr, nc = r + dr, c + dc
+                if not (0 <= nr < self.rows and 0 <= nc < self.cols):
+                    continue
+                i = nr * self.cols + nc
+                if i not in self.revealed and i not in self.flagged:
+                    self.revealed.add(i)
+                    if self.counts[i] == 0:
+                        stack.append((nr, nc))
+
+    def toggleFlag(self, row, col):
+        i = row * self.cols + col
+        if i not in self.revealed:
+            self.flagged ^= {i}
+
+
+def makeBoards(backend, rows, cols, mines):
+    """Return a board of `backend` and a reference, both with the given mine mask."""
+    layout = bytes(mines)
+    board = BOARD_CLASSES[backend].fromLayout(rows, cols, sum(layout), layout)
+    return board, ReferenceBoard(rows, cols, layout)
+
+
+def revealedCells(board):
+    """Set of flat indices `board` shows as revealed."""
+    hidden = (TileState.UNREVEALED, TileState.FLAGGED)
+    return {i for i in range(board.rows * board.cols) if board.cellState(i) not in hidden}
+
+
+def checkMove(board, reference, before, changes):
+    """Compare `board` with `reference` after a move that returned `changes`."""
+    revealed = revealedCells(board)
+    assert revealed == reference.revealed
+    assert board.revealedCount == len(reference.revealed)
+    assert board.safeRevealed == reference.safeRevealed
+    assert board.wrongFlags == reference.wrongFlags
+    assert board.flagCount == len(reference.flagged)
+
+    covered = [i for start, stop in changes for i in range(start, stop)]
+    assert len(covered) == len(set(covered)), "change ranges overlap"
+    assert set(covered) == revealed - before
+
+
+@pytest.mark.parametrize("backend", BOARD_BACKENDS)
+def test_flags_inside_an_opening_stop_the_fill(backend):
+    rows, cols = 8, 10
+    mines = [0] * (rows * cols)
+    mines[7 * cols + 9] = 1
+    board, reference = makeBoards(backend, rows, cols, mines)
+
+    # A flagged empty cell and a flagged numbered cell inside the opening,
+    # and a wall of flags cutting off the left columns
+    for row, col in [(3, 5), (6, 8)] + [(r, 2) for r in range(rows)]:
+        board.toggleFlag(row, col)
+        reference.toggleFlag(row, col)
+
+    before = revealedCells(board)
+    changes = board.revealTile(0, 9)
+    reference.revealTile(0, 9)
+    checkMove(board, reference, before, changes)
+    assert 3 * cols + 5 not in reference.revealed
+    assert 0 * cols + 0 not in reference.revealed
+    assert board.gameState == GameState.PLAYING
+
+    # Unflag a cell inside the opening, then open the cut-off columns. The
+    # new fill reaches the old opening but does not spread through it.
+    for row, col in [(3, 5), (0, 2)]:
+        board.toggleFlag(row, col)
+        reference.toggleFlag(row, col)
+    before = revealedCells(board)
+    changes = board.revealTile(0, 2)
+    reference.revealTile(0, 2)
+    checkMove(board, reference, before, changes)
+    assert 0 * cols + 0 in reference.revealed
+    assert 3 * cols + 5 not in reference.revealed
+
+
+@pytest.mark.parametrize("backend", BOARD_BACKENDS)
+@pytest.mark.parametrize("seed", range(40))
+def test_random_games_match_reference(backend, seed):
+    rng = random.Random(seed)
+    rows, cols = rng.randint(1, 24), rng.randint(1, 24)
+    density = rng.choice((0.0, 0.05, 0.1, 0.2))
+    mines = [1 if rng.random() < density else 0 for _ in range(rows * cols)]
+    board, reference = makeBoards(backend, rows, cols, mines)
+
+    # Sprinkle flags first, so openings run into them
+    for _ in range(rng.randint(0, rows * cols // 4)):
+        row, col = rng.randrange(rows), rng.randrange(cols)
+        board.toggleFlag(row, col)
+        reference.toggleFlag(row, col)
+
+    for _ in range(30):
+        if board.gameState != GameState.PLAYING:
+            break
+        row, col = rng.randrange(rows), rng.randrange(cols)
+        if rng.random() < 0.25:
+            # Flag changes reveal nothing; unflagged cells can be filled later
+            board.toggleFlag(row, col)
+            reference.toggleFlag(row, col)
+            checkMove(board, reference, revealedCells(board), [])
+            continue
+        before = revealedCells(board)
+        changes = board.revealTile(row, col)
+        reference.revealTile(row, col)
+        checkMove(board, reference, before, changes)
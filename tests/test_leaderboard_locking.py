@@ -0,0 +1,106 @@
+"""Leaderboard storage shared between processes."""
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from utils import leaderboard_storage
+from utils.leaderboard_sqlite import SQLiteLeaderboardStorage
+from utils.leaderboard_storage import LeaderboardStorage
+
+needsFcntl = pytest.mark.skipif(leaderboard_storage.fcntl is None, reason="needs fcntl")
+
+
+def makeEntry(score, entryId):
+    return {"score": score, "difficulty": "Easy", "time_elapsed": score, "entry_id": entryId}
+
+
+def test_writer_notices_compaction_with_unchanged_mtime_and_size(tmp_path):
+    path = tmp_path / "leaderboard.json"
+    LeaderboardStorage(path).save([makeEntry(1, "aaaa")])
+    writer = LeaderboardStorage(path, compactEvery=1)
+    writer.load()
+
+    # Another process compacts to a snapshot of the same size, within the
+    # same timestamp tick of a coarse filesystem
+    before = {file: os.stat(file) for file in (path, writer.journalPath)}
+    LeaderboardStorage(path).save([makeEntry(2, "bbbb")])
+    for file, stat in before.items():
+        assert os.stat(file).st_size == stat.st_size
+        os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    writer.addScore(makeEntry(3, "cccc"))
+    assert [entry["entry_id"] for entry in LeaderboardStorage(path).load()] == ["cccc", "bbbb"]
+
+
+HOLD_LOCK = """
+import fcntl, sys, time
+with open(sys.argv[1], "a") as lockFile:
+    fcntl.lockf(lockFile.fileno(), fcntl.LOCK_EX)
+    print("locked", flush=True)
+    time.sleep(float(sys.argv[2]))
+"""
+
+
+@needsFcntl
+def test_reads_do_not_wait_for_a_writer_blocked_on_another_process(tmp_path):
+    storage = LeaderboardStorage(tmp_path / "leaderboard.json", statIntervalMs=0)
+    storage.addScore(makeEntry(1, "first"))
+    holder = subprocess.Popen([sys.executable, "-c", HOLD_LOCK, str(storage.lockPath), "1.0"],
+                              stdout=subprocess.PIPE, text=True)
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        writer = threading.Thread(target=storage.addScore, args=(makeEntry(2, "second"),))
+        writer.start()
+        time.sleep(0.1)
+        started = time.perf_counter()
+        assert [entry["score"] for entry in storage.getTopScores()] == [1]
+        storage.version
+        assert time.perf_counter() - started < 0.5
+        writer.join()
+    finally:
+        holder.wait()
+    assert [entry["score"] for entry in storage.load()] == [2, 1]
+
+
+def addScores(path, worker, count):
+    storage = LeaderboardStorage(path, statIntervalMs=0, maxEntries=1000, compactEvery=3)
+    for i in range(count):
+        storage.addScore(makeEntry(i, f"{worker}-{i}"))
+
+
+@needsFcntl
+def test_concurrent_writer_processes_lose_nothing(tmp_path):
+    path = tmp_path / "leaderboard.json"
+    processes = [multiprocessing.Process(target=addScores, args=(path, worker, 40)) for worker in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    entryIds = [entry["entry_id"] for entry in LeaderboardStorage(path, maxEntries=1000).load()]
+    assert sorted(entryIds) == sorted(f"{worker}-{i}" for worker in range(4) for i in range(40))
+
+
+def openDatabase(directory):
+    SQLiteLeaderboardStorage(directory / "leaderboard.db", jsonPath=directory / "leaderboard.json").close()
+
+
+def test_concurrent_first_opens_import_json_once(tmp_path):
+    json = LeaderboardStorage(tmp_path / "leaderboard.json")
+    for i in range(3):
+        json.addScore(makeEntry(i, f"json-{i}"))
+    processes = [multiprocessing.Process(target=openDatabase, args=(tmp_path,)) for _ in range(6)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert [process.exitcode for process in processes] == [0] * 6
+
+    database = SQLiteLeaderboardStorage(tmp_path / "leaderboard.db", jsonPath=tmp_path / "leaderboard.json")
+    assert database.countScores() == 3
+    database.close()
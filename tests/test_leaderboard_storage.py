@@ -0,0 +1,88 @@
+"""Journal replay, compaction and corrupt snapshots of the JSON leaderboard."""
+
+import json
+
+from utils.leaderboard_sqlite import SQLiteLeaderboardStorage
+from utils.leaderboard_storage import LeaderboardStorage
+
+
+def makeEntry(score, entryId=None):
+    entry = {"score": score, "difficulty": "Easy", "time_elapsed": score}
+    if entryId is not None:
+        entry["entry_id"] = entryId
+    return entry
+
+
+def scores(entries):
+    return [entry["score"] for entry in entries]
+
+
+def test_journal_replays_over_snapshot_and_skips_torn_line(tmp_path):
+    path = tmp_path / "leaderboard.json"
+    storage = LeaderboardStorage(path, compactEvery=3)
+    for score in (10, 20, 30, 40):
+        storage.addScore(makeEntry(score))
+    # Three scores compacted into the snapshot, the fourth is in the journal
+    assert scores(json.loads(path.read_text(encoding="utf-8"))) == [30, 20, 10]
+    assert len(storage.journalPath.read_text(encoding="utf-8").splitlines()) == 1
+
+    # A crash after the snapshot swap but before the journal was emptied,
+    # then another crash mid-append
+    snapshot = json.loads(path.read_text(encoding="utf-8"))
+    with open(storage.journalPath, "a", encoding="utf-8") as f:
+        for entry in snapshot:
+            f.write(json.dumps(entry) + "\n")
+        f.write('{"score": 99, "diffic')
+    assert scores(LeaderboardStorage(path).load()) == [40, 30, 20, 10]
+
+
+def test_adding_a_stored_entry_id_changes_nothing(tmp_path):
+    storage = LeaderboardStorage(tmp_path / "leaderboard.json")
+    assert storage.addScore(makeEntry(5, "a")) == 1
+    assert storage.addScore(makeEntry(9, "b")) == 1
+    assert storage.addScore(makeEntry(5, "a")) == 2
+    assert scores(LeaderboardStorage(storage.filePath).load()) == [9, 5]
+
+
+def test_corrupt_snapshot_is_moved_aside_only_by_a_writer(tmp_path):
+    path = tmp_path / "leaderboard.json"
+    storage = LeaderboardStorage(path, compactEvery=100)
+    storage.addScore(makeEntry(7))
+    path.write_text("[{not json", encoding="utf-8")
+    corruptPath = tmp_path / "leaderboard.json.corrupt"
+
+    reader = LeaderboardStorage(path, statIntervalMs=0)
+    assert scores(reader.load()) == [7]
+    assert path.exists() and not corruptPath.exists()
+
+    reader.addScore(makeEntry(8))
+    assert corruptPath.read_text(encoding="utf-8") == "[{not json"
+    assert scores(LeaderboardStorage(path).load()) == [8, 7]
+
+
+def test_reader_sees_compaction_by_another_instance(tmp_path):
+    path = tmp_path / "leaderboard.json"
+    writer = LeaderboardStorage(path, compactEvery=2)
+    reader = LeaderboardStorage(path, statIntervalMs=0)
+    for score in range(1, 6):
+        writer.addScore(makeEntry(score))
+        assert scores(reader.load()) == list(range(score, 0, -1))
+    version = reader.version
+    writer.save([])
+    assert reader.load() == [] and reader.version > version
+
+
+def test_sqlite_imports_json_scores_still_in_the_journal(tmp_path):
+    jsonPath = tmp_path / "leaderboard.json"
+    storage = LeaderboardStorage(jsonPath, compactEvery=100)
+    for score in (3, 1, 2):
+        storage.addScore(makeEntry(score))
+    assert not jsonPath.exists()
+
+    database = SQLiteLeaderboardStorage(tmp_path / "leaderboard.db", jsonPath=jsonPath)
+    assert scores(database.load()) == [3, 2, 1]
+    database.close()
+    # The import happens once per database
+    database = SQLiteLeaderboardStorage(tmp_path / "leaderboard.db", jsonPath=jsonPath)
+    assert database.countScores() == 3
+    database.close()
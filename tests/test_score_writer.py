@@ -0,0 +1,121 @@
+"""Spool replay of `ScoreWriter` after failed writes and killed processes."""
+
+import json
+import subprocess
+import sys
+
+from conftest import REPO_ROOT
+from utils.leaderboard_storage import LeaderboardStorage
+from utils.score_writer import ScoreWriter
+
+
+class FlakyStorage(LeaderboardStorage):
+    """Storage whose `addScore` raises for scores listed in `failing`."""
+
+    def __init__(self, filePath, failing=()):
+        super().__init__(filePath, statIntervalMs=0)
+        self.failing = set(failing)
+
+    def addScore(self, scoreEntry):
+        if scoreEntry["score"] in self.failing:
+            raise OSError("disk full")
+        return super().addScore(scoreEntry)
+
+
+def spools(directory):
+    return sorted(directory.glob("leaderboard.*.spool"))
+
+
+def storedScores(path):
+    return sorted(entry["score"] for entry in LeaderboardStorage(path).load())
+
+
+def test_failed_write_after_a_saved_one_is_replayed(tmp_path):
+    path = tmp_path / "leaderboard.json"
+    writer = ScoreWriter(FlakyStorage(path, failing={2}))
+    assert writer.submit({"score": 1, "difficulty": "Easy"}).result(timeout=5) == 1
+    failed = writer.submit({"score": 2, "difficulty": "Easy"})
+    assert isinstance(failed.exception(timeout=5), OSError)
+    writer.flush()
+
+    # Every spool line must still parse after the spool was emptied
+    with open(writer.spoolPath, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [record["entry"]["score"] for record in records] == [2]
+
+    # A fresh writer (as after a kill) stores the entry the failed one left
+    writer.close()
+    assert spools(tmp_path) == [writer.spoolPath]
+    replay = ScoreWriter(LeaderboardStorage(path))
+    replay.close()
+    assert storedScores(path) == [1, 2]
+    assert spools(tmp_path) == []
+
+
+KILLED_WRITER = """
+import os, sys, threading
+sys.path.insert(0, sys.argv[1])
+from utils.leaderboard_storage import LeaderboardStorage
+from utils.score_writer import ScoreWriter
+
+class StuckStorage(LeaderboardStorage):
+    def addScore(self, scoreEntry):
+        if scoreEntry["score"] == 2:
+            threading.Event().wait()  # Never finishes, like a hung disk
+        return super().addScore(scoreEntry)
+
+writer = ScoreWriter(StuckStorage(sys.argv[2]))
+writer.submit({"score": 1, "difficulty": "Easy"}).result()
+writer.submit({"score": 2, "difficulty": "Easy"})
+writer.submit({"score": 3, "difficulty": "Easy"})
+os._exit(9)
+"""
+
+
+def test_killed_process_entries_are_replayed(tmp_path):
+    path = tmp_path / "leaderboard.json"
+    subprocess.run([sys.executable, "-c", KILLED_WRITER, str(REPO_ROOT), str(path)], check=False, timeout=30)
+    assert storedScores(path) == [1]
+
+    ScoreWriter(LeaderboardStorage(path)).close()
+    assert storedScores(path) == [1, 2, 3]
+    assert spools(tmp_path) == []
+
+
+def test_unfinished_entries_of_a_killed_writer_are_replayed_once(tmp_path):
+    path = tmp_path / "leaderboard.json"
+    storage = LeaderboardStorage(path)
+    stored = {"score": 5, "difficulty": "Easy", "entry_id": "stored"}
+    storage.addScore(stored)
+    # A killed writer's spool: one entry stored but not marked done, one
+    # never stored, one done, and a line cut short by the kill
+    lines = [
+        json.dumps({"entry": stored}),
+        json.dumps({"entry": {"score": 7, "difficulty": "Easy", "entry_id": "lost"}}),
+        json.dumps({"entry": {"score": 9, "difficulty": "Easy", "entry_id": "done"}}),
+        json.dumps({"done": "done"}),
+        '{"entry": {"score": 11',
+    ]
+    (tmp_path / "leaderboard.dead.spool").write_text("\n".join(lines), encoding="utf-8")
+
+    writer = ScoreWriter(storage)
+    writer.close()
+    assert storedScores(path) == [5, 7]
+    assert spools(tmp_path) == []
+
+
+def test_running_writers_keep_their_own_spools(tmp_path):
+    path = tmp_path / "leaderboard.json"
+    first = ScoreWriter(FlakyStorage(path, failing={3}))
+    first.submit({"score": 3, "difficulty": "Easy"}).exception(timeout=5)
+
+    # A second writer leaves the live spool alone, even in the same process,
+    # and emptying its own spool doesn't touch the first one's entries
+    second = ScoreWriter(LeaderboardStorage(path))
+    second.submit({"score": 4, "difficulty": "Easy"}).result(timeout=5)
+    second.close()
+    assert storedScores(path) == [4]
+    first.close()
+
+    ScoreWriter(LeaderboardStorage(path)).close()
+    assert storedScores(path) == [3, 4]
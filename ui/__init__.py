@@ -4,6 +4,7 @@ from .button import Button
 from .hud import Hud
 from .menu import Menu
 from .leaderboard import LeaderboardUI
+from .tile_atlas import TileAtlas
 from .pixel_utils import (
     PixelArtist, pixel_artist,
     draw_pixel_button, draw_pixel_text, 
@@ -15,6 +16,7 @@ __all__ = [
     'Hud', 
     'Menu',
     'LeaderboardUI',
+    'TileAtlas',
     'PixelArtist',
     'pixel_artist',
     'draw_pixel_button',
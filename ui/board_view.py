@@ -0,0 +1,92 @@
+"""Offscreen copy of the visible board, repainted only where cells change."""
+
+import pygame
+import settings
+
+
+class BoardView:
+    """Keeps the tiles inside the camera viewport in a persistent surface.
+
+    The surface covers the camera viewport. Drawing the board is then a
+    single blit of it, whatever the board size. Board moves hand their
+    `(start, stop)` flat index change ranges to `markChanges`, and only
+    those cells are repainted on the next `render`. The whole visible area
+    is repainted in one pass when the board, tile atlas, camera position
+    or viewport changes, or when a change set covers at least as many
+    cells as are visible (a big flood fill, or `revealAllMines`).
+    """
+
+    def __init__(self):
+        self.surface = None
+        self._key = None
+        self._changes = []
+        self._changedCells = 0
+
+    def invalidate(self):
+        """Force a full repaint on the next render."""
+        self._key = None
+
+    def markChanges(self, changes):
+        """Queue `(start, stop)` flat index ranges whose tiles must be repainted."""
+        for start, stop in changes:
+            self._changes.append((start, stop))
+            self._changedCells += stop - start
+
+    def render(self, board, camera, atlas):
+        """Bring the surface up to date and return it.
+
+        Args:
+            board: Board being shown.
+            camera: Camera giving the viewport, offsets and tile size.
+            atlas: `TileAtlas` for the camera's tile size.
+
+        Returns:
+            A surface the size of `camera.viewport`, to blit at its top-left.
+        """
+        viewport = camera.viewport
+        key = (board, atlas, camera.tileSize, camera.offsetX, camera.offsetY,
+               viewport.topleft, viewport.size)
+        rowRange, colRange = camera.visibleCells()
+
+        if key != self._key or self._changedCells >= len(rowRange) * len(colRange):
+            if self.surface is None or self.surface.get_size() != viewport.size:
+                self.surface = pygame.Surface(viewport.size)
+                if pygame.display.get_surface() is not None:
+                    self.surface = self.surface.convert()
+            self.surface.fill(settings.COLORS["background"])
+            self._paint(board, camera, atlas, rowRange, colRange)
+            self._key = key
+        elif self._changes:
+            cols = board.cols
+            for start, stop in self._changes:
+                firstRow, firstCol = divmod(start, cols)
+                lastRow, lastCol = divmod(stop - 1, cols)
+                for row in range(max(firstRow, rowRange.start), min(lastRow + 1, rowRange.stop)):
+                    low = firstCol if row == firstRow else 0
+                    high = lastCol + 1 if row == lastRow else cols
+                    self._paint(board, camera, atlas, range(row, row + 1),
+                                range(max(low, colRange.start), min(high, colRange.stop)))
+
+        self._changes = []
+        self._changedCells = 0
+        return self.surface
+
+    def _paint(self, board, camera, atlas, rowRange, colRange):
+        """Blit the atlas sprites for a block of cells into the surface."""
+        tileSize = camera.tileSize
+        originX = camera.offsetX - camera.viewport.left
+        originY = camera.offsetY - camera.viewport.top
+        sprites = atlas.surfaces
+        cellState = board.cellState
+        cols = board.cols
+        batch = [
+            (sprites[cellState(r * cols + c)], (originX + c * tileSize, originY + r * tileSize))
+            for r in rowRange
+            for c in colRange
+        ]
+        # pygame-ce's fblits skips building the list of dirty rects
+        fblits = getattr(self.surface, "fblits", None)
+        if fblits is not None:
+            fblits(batch)
+        else:
+            self.surface.blits(batch, doreturn=False)
@@ -0,0 +1,130 @@
+"""Camera mapping board cells to screen pixels, with pan and zoom."""
+
+import pygame
+
+
+class Camera:
+    """Viewport onto the board: where cell (0, 0) sits and how big tiles are.
+
+    `offsetX`/`offsetY` are the screen position of the board's top-left
+    corner and `tileSize` the pixel size of a cell. Only the part of the
+    board inside `viewport` (the screen area below the HUD) is visible.
+    """
+
+    MIN_TILE_SIZE = 8
+    MAX_TILE_SIZE = 96
+    ZOOM_STEP = 1.25
+    # Pixels moved per arrow key press
+    PAN_STEP = 48
+    # Board pixels kept inside the viewport when panning past an edge
+    EDGE_MARGIN = 20
+
+    def __init__(self, viewport, rows=0, cols=0, tileSize=36, offsetX=0, offsetY=0):
+        self.viewport = pygame.Rect(viewport)
+        self.rows = rows
+        self.cols = cols
+        self.tileSize = tileSize
+        self.offsetX = offsetX
+        self.offsetY = offsetY
+
+    def setBoard(self, rows, cols):
+        """Track a new board shape."""
+        self.rows = rows
+        self.cols = cols
+
+    def setViewport(self, viewport):
+        """Change the screen area the board is shown in."""
+        self.viewport = pygame.Rect(viewport)
+
+    def boardRect(self):
+        """Return the screen rectangle covered by the whole board."""
+        return pygame.Rect(self.offsetX, self.offsetY, self.cols * self.tileSize, self.rows * self.tileSize)
+
+    def clamp(self):
+        """Keep a board larger than the viewport from being panned out of view.
+
+        Along an axis where the board is larger than the viewport, it can
+        only be panned until its edge (plus `EDGE_MARGIN`) reaches the
+        viewport edge. Axes where the board fits keep their layout.
+        """
+        self.offsetX = self._clampAxis(self.offsetX, self.cols * self.tileSize,
+                                       self.viewport.left, self.viewport.right)
+        self.offsetY = self._clampAxis(self.offsetY, self.rows * self.tileSize,
+                                       self.viewport.top, self.viewport.bottom)
+
+    def _clampAxis(self, offset, length, low, high):
+        if length <= high - low:
+            return offset
+        return min(max(offset, high - length - self.EDGE_MARGIN), low + self.EDGE_MARGIN)
+
+    def pan(self, dx, dy):
+        """Move the board by (dx, dy) screen pixels along the axes it overflows.
+
+        Returns:
+            True if the view changed.
+        """
+        before = (self.offsetX, self.offsetY)
+        if self.cols * self.tileSize > self.viewport.width:
+            self.offsetX += dx
+        if self.rows * self.tileSize > self.viewport.height:
+            self.offsetY += dy
+        self.clamp()
+        return (self.offsetX, self.offsetY) != before
+
+    def zoomAt(self, steps, pos):
+        """Zoom by `steps` wheel notches, keeping the board point under `pos` fixed.
+
+        Returns:
+            True if the view changed.
+        """
+        newSize = round(self.tileSize * self.ZOOM_STEP ** steps)
+        if newSize == self.tileSize and steps:
+            newSize += 1 if steps > 0 else -1
+        newSize = max(self.MIN_TILE_SIZE, min(self.MAX_TILE_SIZE, newSize))
+        if newSize == self.tileSize:
+            return False
+
+        x, y = pos
+        # Board-space position under the cursor, in tiles
+        boardX = (x - self.offsetX) / self.tileSize
+        boardY = (y - self.offsetY) / self.tileSize
+        self.tileSize = newSize
+        self.offsetX = round(x - boardX * newSize)
+        self.offsetY = round(y - boardY * newSize)
+        # Axes the board now fits along are centered instead
+        viewport = self.viewport
+        if self.cols * newSize <= viewport.width:
+            self.offsetX = viewport.left + (viewport.width - self.cols * newSize) // 2
+        if self.rows * newSize <= viewport.height:
+            self.offsetY = viewport.top + (viewport.height - self.rows * newSize) // 2
+        self.clamp()
+        return True
+
+    def cellAt(self, pos):
+        """Return the (row, col) under a screen position, or None outside the board."""
+        if not self.viewport.collidepoint(pos):
+            return None
+        col = (pos[0] - self.offsetX) // self.tileSize
+        row = (pos[1] - self.offsetY) // self.tileSize
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    def visibleCells(self, clip=None):
+        """Return the row and column ranges of cells inside the viewport (and `clip`)."""
+        area = self.viewport.clip(clip) if clip is not None else self.viewport
+        if not area.width or not area.height:
+            return range(0), range(0)
+        tileSize = self.tileSize
+        firstRow = max(0, (area.top - self.offsetY) // tileSize)
+        lastRow = min(self.rows, (area.bottom - 1 - self.offsetY) // tileSize + 1)
+        firstCol = max(0, (area.left - self.offsetX) // tileSize)
+        lastCol = min(self.cols, (area.right - 1 - self.offsetX) // tileSize + 1)
+        return range(firstRow, max(firstRow, lastRow)), range(firstCol, max(firstCol, lastCol))
+
+    def cellsRect(self, firstRow, firstCol, lastRow, lastCol):
+        """Return the screen rectangle of an inclusive block of cells."""
+        return pygame.Rect(self.offsetX + firstCol * self.tileSize,
+                           self.offsetY + firstRow * self.tileSize,
+                           (lastCol - firstCol + 1) * self.tileSize,
+                           (lastRow - firstRow + 1) * self.tileSize)
@@ -33,16 +33,29 @@ class Hud:
         self.menuButtonHovered = False
         self.menuButtonPressed = False
 
+        # Set whenever what the HUD shows changes; cleared by whoever redraws it
+        self.dirty = True
+
     def setMineCount(self, count):
         """Update displayed mine count."""
-        self.mineCount = count
+        if count != self.mineCount:
+            self.mineCount = count
+            self.dirty = True
 
     def setTimer(self, seconds):
         """Update displayed timer value."""
-        self.timer = seconds
+        if seconds != self.timer:
+            self.timer = seconds
+            self.dirty = True
 
     def handleEvent(self, event):
         """Process events for HUD components."""
+        before = (self.buttonHovered, self.isPressed, self.menuButtonHovered, self.menuButtonPressed)
+        self._handleButtons(event)
+        if before != (self.buttonHovered, self.isPressed, self.menuButtonHovered, self.menuButtonPressed):
+            self.dirty = True
+
+    def _handleButtons(self, event):
         if event.type == pygame.MOUSEMOTION:
             self.buttonHovered = self.restartButton.collidepoint(event.pos)
             self.menuButtonHovered = self.menuButton.collidepoint(event.pos)
@@ -175,3 +188,4 @@ class Hud:
         self.isPressed = False
         self.menuButtonHovered = False
         self.menuButtonPressed = False
+        self.dirty = True
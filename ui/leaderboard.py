@@ -20,6 +20,10 @@ class LeaderboardUI:
         self.storage = storage
         self.onBack = onBack
         self.buttons = []
+        # Title and score table, rendered once per size and score change
+        self._layer = None
+        # Storage version the layer was rendered from
+        self._layerVersion = None
         self.initButtons()
 
     def initButtons(self):
@@ -55,38 +59,46 @@ class LeaderboardUI:
     def draw(self, surface):
         """Render leaderboard to screen with pixel art style.
 
+        The title and score table are rendered into a cached layer that is
+        only rebuilt when the screen size or the storage `version` changes,
+        or after `refresh()`. The buttons are composited on top each frame.
+
         Args:
             surface: Pygame surface to draw on.
         """
-        from ui.pixel_utils import get_pixel_text_width
+        size = surface.get_size()
+        version = self.storage.version
+        if self._layer is None or self._layer.get_size() != size or version != self._layerVersion:
+            self._layer = self._renderLayer(*size)
+            self._layerVersion = version
+            self.updateButtonPositions(*size)
+
+        surface.blit(self._layer, (0, 0))
 
-        # Get current dimensions
-        screen_width = surface.get_width()
-        screen_height = surface.get_height()
+        # Draw buttons
+        for button in self.buttons:
+            button.draw(surface)
 
-        # Recreate buttons if needed
-        if not self.buttons:
-            self._createButtons(screen_width, screen_height)
+    def _renderLayer(self, screen_width, screen_height):
+        """Render the title and score table into a new screen-sized surface."""
+        from ui.pixel_utils import get_pixel_text_width
 
-        surface.fill(settings.COLORS["background"])
+        layer = pygame.Surface((screen_width, screen_height))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        layer.fill(settings.COLORS["background"])
 
         # Title with pixel art text - centered
         title_text = "LEADERBOARD"
         title_width = get_pixel_text_width(title_text, size='large')
         title_x = (screen_width - title_width) // 2
         title_y = min(80, screen_height // 10)
-        draw_pixel_text(surface, title_text, title_x, title_y, settings.COLORS["accent"], size='large')
-
-        # Update button positions
-        self.updateButtonPositions(screen_width, screen_height)
+        draw_pixel_text(layer, title_text, title_x, title_y, settings.COLORS["accent"], size='large')
 
         # Load and display scores
         scores = self.storage.getTopScores()
-        self._drawScoreList(surface, scores, screen_width, screen_height)
-
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(surface)
+        self._drawScoreList(layer, scores, screen_width, screen_height)
+        return layer
 
     def _drawScoreList(self, surface, scores, screen_width=None, screen_height=None):
         """Draw the list of top scores with pixel art styling.
@@ -235,8 +247,8 @@ class LeaderboardUI:
         draw_pixel_text(surface, date_text, int(dateX), y, settings.COLORS["text_secondary"], size='small')
 
     def refresh(self):
-        """Reload scores from storage."""
-        pass  # Scores are loaded fresh each draw
+        """Reload scores from storage on the next draw."""
+        self._layer = None
 
     def updateButtonPositions(self, screenWidth, screenHeight):
         """Recalculate button positions for new screen size."""
@@ -3,7 +3,7 @@
 import pygame
 from .button import Button
 from core.state import Difficulty
-from ui.pixel_utils import draw_pixel_text
+from ui.pixel_utils import draw_pixel_text, get_pixel_text_width
 import settings
 
 
@@ -20,6 +20,8 @@ class Menu:
         self.onStartGame = onStartGame
         self.onShowLeaderboard = onShowLeaderboard
         self.buttons = []
+        # Static part of the screen (everything but the buttons), see draw()
+        self._layer = None
         self.initButtons()
 
     def initButtons(self):
@@ -82,17 +84,32 @@ class Menu:
             button.handleEvent(event)
 
     def draw(self, surface):
-        """Render menu to screen with pixel art style."""
-        # Get current screen dimensions
-        screen_width = surface.get_width()
-        screen_height = surface.get_height()
+        """Render menu to screen with pixel art style.
 
-        # Recreate buttons on first draw or if screen size changed significantly
-        if not self.buttons:
-            self._createButtons(screen_width, screen_height)
+        The background, card, title and instructions are rendered once into
+        a cached layer, re-rendered only when the screen size changes. Each
+        frame blits that layer and composites the buttons on top.
+        """
+        size = surface.get_size()
+        if self._layer is None or self._layer.get_size() != size:
+            self._layer = self._renderLayer(*size)
+            # Buttons only move when the layout does
+            self.updateButtonPositions(*size)
+
+        surface.blit(self._layer, (0, 0))
+
+        # Draw buttons
+        for button in self.buttons:
+            button.draw(surface)
+
+    def _renderLayer(self, screen_width, screen_height):
+        """Render everything on the menu except the buttons into a new surface."""
+        layer = pygame.Surface((screen_width, screen_height))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
 
         # Fill background
-        surface.fill(settings.COLORS["background"])
+        layer.fill(settings.COLORS["background"])
 
         # Calculate card dimensions based on screen size
         card_width = min(400, screen_width - 40)
@@ -102,32 +119,25 @@ class Menu:
 
         # Draw simple card background
         cardRect = pygame.Rect(card_x, card_y, card_width, card_height)
-        pygame.draw.rect(surface, settings.COLORS["background_alt"], cardRect)
+        pygame.draw.rect(layer, settings.COLORS["background_alt"], cardRect)
 
         # Single border for card
-        pygame.draw.rect(surface, settings.COLORS["accent"], cardRect, 2)
+        pygame.draw.rect(layer, settings.COLORS["accent"], cardRect, 2)
 
         # Title with pixel art text
         titleText = "PYSWEEPER"
-        from ui.pixel_utils import get_pixel_text_width
         title_width = get_pixel_text_width(titleText, size='large')
         title_x = (screen_width - title_width) // 2
         title_y = card_y + 50
 
-        draw_pixel_text(surface, titleText, title_x, title_y, settings.COLORS["accent"], size='large')
+        draw_pixel_text(layer, titleText, title_x, title_y, settings.COLORS["accent"], size='large')
 
         # Instructions
         instr_text = "Select Difficulty"
         instr_width = get_pixel_text_width(instr_text, size='medium')
-        draw_pixel_text(surface, instr_text, (screen_width - instr_width) // 2,
+        draw_pixel_text(layer, instr_text, (screen_width - instr_width) // 2,
                        card_y + 110, settings.COLORS["text_secondary"], size='medium')
-
-        # Update button positions before drawing
-        self.updateButtonPositions(screen_width, screen_height)
-
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(surface)
+        return layer
 
     def updateButtonPositions(self, screenWidth, screenHeight):
         """Recalculate button positions for new screen size."""
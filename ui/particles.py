@@ -0,0 +1,175 @@
+"""Confetti particles stored as parallel arrays."""
+
+import random
+from array import array
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+class ParticleSystem:
+    """A fixed-capacity pool of square particles falling under gravity.
+
+    Particles live in parallel arrays (position, velocity, remaining life
+    and sprite kind) sized for `budget` entries, so spawning never grows
+    them and the live particles always occupy the first `count` slots.
+    Each update moves every particle at once and compacts the survivors
+    to the front. With NumPy the update is vectorized; without it the
+    same arrays are plain `array.array` buffers updated in one loop.
+
+    Particles are drawn as blits of pre-colored square sprites, one per
+    (color, size) pair.
+    """
+
+    GRAVITY = 0.22
+    # How far below the bottom edge particles may fall before being dropped
+    FALL_MARGIN = 50
+
+    def __init__(self, budget, colors, sizes=(2, 3, 4, 5, 6)):
+        """Allocate the particle arrays and render the sprites.
+
+        Args:
+            budget: Maximum number of live particles.
+            colors: RGB colors particles are drawn in.
+            sizes: Square sizes in pixels.
+        """
+        self.budget = max(0, budget)
+        self.count = 0
+        self._sprites = [self._renderSquare(color, size) for color in colors for size in sizes]
+
+        if np is not None:
+            self.x = np.zeros(self.budget, dtype=np.float32)
+            self.y = np.zeros(self.budget, dtype=np.float32)
+            self.vx = np.zeros(self.budget, dtype=np.float32)
+            self.vy = np.zeros(self.budget, dtype=np.float32)
+            self.life = np.zeros(self.budget, dtype=np.int32)
+            self.kind = np.zeros(self.budget, dtype=np.int32)
+        else:
+            self.x = array("f", bytes(4 * self.budget))
+            self.y = array("f", bytes(4 * self.budget))
+            self.vx = array("f", bytes(4 * self.budget))
+            self.vy = array("f", bytes(4 * self.budget))
+            self.life = array("i", bytes(4 * self.budget))
+            self.kind = array("i", bytes(4 * self.budget))
+
+    def __len__(self):
+        return self.count
+
+    @staticmethod
+    def _renderSquare(color, size):
+        surface = pygame.Surface((size, size))
+        surface.fill(color)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def clear(self):
+        """Drop every live particle."""
+        self.count = 0
+
+    def spawn(self, count, area):
+        """Launch up to `count` particles from random points in `area`.
+
+        Args:
+            count: Number of particles wanted.
+            area: (left, top, width, height) rectangle to start particles in.
+
+        Returns:
+            Number of particles actually spawned, limited by the budget.
+        """
+        count = min(count, self.budget - self.count)
+        if count <= 0:
+            return 0
+
+        left, top, width, height = area
+        start, end = self.count, self.count + count
+        kinds = len(self._sprites)
+        if np is not None:
+            rng = np.random.default_rng()
+            self.x[start:end] = rng.integers(left, left + width, count, endpoint=True)
+            self.y[start:end] = rng.integers(top, top + height, count, endpoint=True)
+            self.vx[start:end] = rng.uniform(-2.5, 2.5, count)
+            self.vy[start:end] = rng.uniform(-6.0, -1.5, count)
+            self.life[start:end] = rng.integers(60, 140, count, endpoint=True)
+            self.kind[start:end] = rng.integers(0, kinds, count)
+        else:
+            for i in range(start, end):
+                self.x[i] = random.randint(left, left + width)
+                self.y[i] = random.randint(top, top + height)
+                self.vx[i] = random.uniform(-2.5, 2.5)
+                self.vy[i] = random.uniform(-6.0, -1.5)
+                self.life[i] = random.randint(60, 140)
+                self.kind[i] = random.randrange(kinds)
+        self.count = end
+        return count
+
+    def update(self, width, height):
+        """Advance every particle one frame and drop the dead ones.
+
+        A particle dies when its life runs out, it leaves the sides of the
+        `width` x `height` screen, or it falls past the bottom margin.
+        """
+        n = self.count
+        if not n:
+            return
+
+        if np is not None:
+            x, y, vy, life = self.x[:n], self.y[:n], self.vy[:n], self.life[:n]
+            x += self.vx[:n]
+            y += vy
+            vy += self.GRAVITY
+            life -= 1
+            alive = (life > 0) & (x >= 0) & (x <= width) & (y <= height + self.FALL_MARGIN)
+            if alive.all():
+                return
+            keep = np.flatnonzero(alive)
+            for values in (self.x, self.y, self.vx, self.vy, self.life, self.kind):
+                values[:len(keep)] = values[keep]
+            self.count = len(keep)
+            return
+
+        xs, ys, vxs, vys, lives, kinds = self.x, self.y, self.vx, self.vy, self.life, self.kind
+        gravity = self.GRAVITY
+        bottom = height + self.FALL_MARGIN
+        write = 0
+        for i in range(n):
+            x = xs[i] + vxs[i]
+            y = ys[i] + vys[i]
+            life = lives[i] - 1
+            if life > 0 and 0 <= x <= width and y <= bottom:
+                xs[write] = x
+                ys[write] = y
+                vxs[write] = vxs[i]
+                vys[write] = vys[i] + gravity
+                lives[write] = life
+                kinds[write] = kinds[i]
+                write += 1
+        self.count = write
+
+    def draw(self, surface):
+        """Blit every live particle onto `surface` in one batch."""
+        n = self.count
+        if not n:
+            return
+
+        if np is not None:
+            xs = self.x[:n].astype(np.int32).tolist()
+            ys = self.y[:n].astype(np.int32).tolist()
+            kinds = self.kind[:n].tolist()
+        else:
+            xs = [int(x) for x in self.x[:n]]
+            ys = [int(y) for y in self.y[:n]]
+            kinds = self.kind[:n]
+        sprites = self._sprites
+        batch = [(sprites[kind], (x, y)) for kind, x, y in zip(kinds, xs, ys)]
+
+        # pygame-ce's fblits skips building the list of dirty rects
+        fblits = getattr(surface, "fblits", None)
+        if fblits is not None:
+            fblits(batch)
+        else:
+            surface.blits(batch, doreturn=False)
@@ -1,8 +1,482 @@
 """True pixel art utilities for crisp pixel-perfect graphics."""
 
+from collections import OrderedDict
+
 import pygame
 import settings
 
+# Pixel scale of each text size
+TEXT_SIZES = {'small': 1, 'medium': 2, 'large': 3}
+
+# Rendered strings kept for reuse by draw_pixel_text
+TEXT_CACHE_SIZE = 256
+
+# Rendered buttons and smileys kept for reuse (every size, color and state)
+SHAPE_CACHE_SIZE = 128
+
+# Simple 5x7 pixel font definitions (7 columns including side padding)
+FONT_5X7 = {
+    'A': [
+        "  XXX  ",
+        " X   X ",
+        " X   X ",
+        " XXXXX ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+    ],
+    'B': [
+        " XXXX  ",
+        " X   X ",
+        " X   X ",
+        " XXXX  ",
+        " X   X ",
+        " X   X ",
+        " XXXX  ",
+    ],
+    'C': [
+        "  XXXX ",
+        " X     ",
+        " X     ",
+        " X     ",
+        " X     ",
+        " X     ",
+        "  XXXX ",
+    ],
+    'D': [
+        " XXXX  ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " XXXX  ",
+    ],
+    'E': [
+        " XXXXX ",
+        " X     ",
+        " X     ",
+        " XXXX  ",
+        " X     ",
+        " X     ",
+        " XXXXX ",
+    ],
+    'F': [
+        " XXXXX ",
+        " X     ",
+        " X     ",
+        " XXXX  ",
+        " X     ",
+        " X     ",
+        " X     ",
+    ],
+    'G': [
+        "  XXXX ",
+        " X     ",
+        " X     ",
+        " X  XX ",
+        " X   X ",
+        " X   X ",
+        "  XXXX ",
+    ],
+    'H': [
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " XXXXX ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+    ],
+    'I': [
+        " XXXXX ",
+        "   X   ",
+        "   X   ",
+        "   X   ",
+        "   X   ",
+        "   X   ",
+        " XXXXX ",
+    ],
+    'J': [
+        " XXXXX ",
+        "    X  ",
+        "    X  ",
+        "    X  ",
+        " X  X  ",
+        " X  X  ",
+        "  XX   ",
+    ],
+    'K': [
+        " X   X ",
+        " X  X  ",
+        " X X   ",
+        " XX    ",
+        " X X   ",
+        " X  X  ",
+        " X   X ",
+    ],
+    'L': [
+        " X     ",
+        " X     ",
+        " X     ",
+        " X     ",
+        " X     ",
+        " X     ",
+        " XXXXX ",
+    ],
+    'M': [
+        " X   X ",
+        " XX XX ",
+        " X X X ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+    ],
+    'N': [
+        " X   X ",
+        " XX  X ",
+        " X X X ",
+        " X  XX ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+    ],
+    'O': [
+        "  XXX  ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        "  XXX  ",
+    ],
+    'P': [
+        " XXXX  ",
+        " X   X ",
+        " X   X ",
+        " XXXX  ",
+        " X     ",
+        " X     ",
+        " X     ",
+    ],
+    'Q': [
+        "  XXX  ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " X X X ",
+        " X  X  ",
+        "  XX X ",
+    ],
+    'R': [
+        " XXXX  ",
+        " X   X ",
+        " X   X ",
+        " XXXX  ",
+        " X X   ",
+        " X  X  ",
+        " X   X ",
+    ],
+    'S': [
+        "  XXXX ",
+        " X     ",
+        " X     ",
+        "  XXX  ",
+        "     X ",
+        "     X ",
+        " XXXX  ",
+    ],
+    'T': [
+        " XXXXX ",
+        "   X   ",
+        "   X   ",
+        "   X   ",
+        "   X   ",
+        "   X   ",
+        "   X   ",
+    ],
+    'U': [
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        "  XXX  ",
+    ],
+    'V': [
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        "  X X  ",
+        "   X   ",
+    ],
+    'W': [
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        " X X X ",
+        " X X X ",
+        " XX XX ",
+        " X   X ",
+    ],
+    'X': [
+        " X   X ",
+        " X   X ",
+        "  X X  ",
+        "   X   ",
+        "  X X  ",
+        " X   X ",
+        " X   X ",
+    ],
+    'Y': [
+        " X   X ",
+        " X   X ",
+        " X   X ",
+        "  X X  ",
+        "   X   ",
+        "   X   ",
+        "   X   ",
+    ],
+    'Z': [
+        " XXXXX ",
+        "    X  ",
+        "   X   ",
+        "  X    ",
+        " X     ",
+        " X     ",
+        " XXXXX ",
+    ],
+    '0': [
+        "  XXX  ",
+        " X  XX ",
+        " X X X ",
+        " X X X ",
+        " X X X ",
+        " XX  X ",
+        "  XXX  ",
+    ],
+    '1': [
+        "   X   ",
+        "  XX   ",
+        "   X   ",
+        "   X   ",
+        "   X   ",
+        "   X   ",
+        " XXXXX ",
+    ],
+    '2': [
+        "  XXX  ",
+        " X   X ",
+        "     X ",
+        "    X  ",
+        "   X   ",
+        "  X    ",
+        " XXXXX ",
+    ],
+    '3': [
+        "  XXX  ",
+        " X   X ",
+        "     X ",
+        "   XX  ",
+        "     X ",
+        " X   X ",
+        "  XXX  ",
+    ],
+    '4': [
+        "    X  ",
+        "   XX  ",
+        "  X X  ",
+        " X  X  ",
+        " XXXXX ",
+        "    X  ",
+        "    X  ",
+    ],
+    '5': [
+        " XXXXX ",
+        " X     ",
+        " XXXX  ",
+        "     X ",
+        "     X ",
+        " X   X ",
+        "  XXX  ",
+    ],
+    '6': [
+        "  XXX  ",
+        " X     ",
+        " X     ",
+        " XXXX  ",
+        " X   X ",
+        " X   X ",
+        "  XXX  ",
+    ],
+    '7': [
+        " XXXXX ",
+        "     X ",
+        "    X  ",
+        "   X   ",
+        "   X   ",
+        "   X   ",
+        "   X   ",
+    ],
+    '8': [
+        "  XXX  ",
+        " X   X ",
+        " X   X ",
+        "  XXX  ",
+        " X   X ",
+        " X   X ",
+        "  XXX  ",
+    ],
+    '9': [
+        "  XXX  ",
+        " X   X ",
+        " X   X ",
+        "  XXXX ",
+        "     X ",
+        "    X  ",
+        "  XX   ",
+    ],
+    ':': [
+        "       ",
+        "       ",
+        "   X   ",
+        "       ",
+        "       ",
+        "   X   ",
+        "       ",
+    ],
+    ' ': [
+        "       ",
+        "       ",
+        "       ",
+        "       ",
+        "       ",
+        "       ",
+        "       ",
+    ],
+    '-': [
+        "       ",
+        "       ",
+        "       ",
+        " XXXXX ",
+        "       ",
+        "       ",
+        "       ",
+    ],
+    '(': [
+        "   X   ",
+        "  X    ",
+        " X     ",
+        " X     ",
+        " X     ",
+        "  X    ",
+        "   X   ",
+    ],
+    ')': [
+        "   X   ",
+        "    X  ",
+        "     X ",
+        "     X ",
+        "     X ",
+        "    X  ",
+        "   X   ",
+    ],
+    'x': [
+        "       ",
+        "       ",
+        " X   X ",
+        "  X X  ",
+        "   X   ",
+        "  X X  ",
+        " X   X ",
+    ],
+}
+
+
+class SurfaceCache:
+    """Bounded least-recently-used cache of rendered surfaces."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """Return the cached surface for `key`, or None."""
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+        return surface
+
+    def put(self, key, surface):
+        """Store `surface`, evicting the least recently used entries if full."""
+        self._entries[key] = surface
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# One surface per (char, scale, color); the font and palette keep this small
+_glyph_cache = {}
+_text_cache = SurfaceCache(TEXT_CACHE_SIZE)
+_shape_cache = SurfaceCache(SHAPE_CACHE_SIZE)
+
+
+def clear_surface_caches():
+    """Drop every cached glyph, string, button and smiley surface.
+
+    Cache keys include the colors used, so a changed palette never shows
+    stale surfaces; call this after a theme switch to free the old ones.
+    """
+    _glyph_cache.clear()
+    _text_cache.clear()
+    _shape_cache.clear()
+
+
+def _finish_surface(surface):
+    """Convert a rendered surface to the display format when there is one."""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+
+def _render_glyph(char, scale, color):
+    """Return the cached transparent surface of one character."""
+    key = (char, scale, color)
+    glyph = _glyph_cache.get(key)
+    if glyph is None:
+        glyph = pygame.Surface((7 * scale, 7 * scale), pygame.SRCALPHA)
+        for row_idx, row in enumerate(FONT_5X7[char]):
+            for col_idx, pixel in enumerate(row):
+                if pixel == 'X':
+                    glyph.fill(color, (col_idx * scale, row_idx * scale, scale, scale))
+        glyph = _glyph_cache[key] = _finish_surface(glyph)
+    return glyph
+
+
+def _render_text(text, scale, color):
+    """Return the cached transparent surface of a whole (upper-case) string."""
+    key = (text, scale, color)
+    rendered = _text_cache.get(key)
+    if rendered is None:
+        advance = 9 * scale
+        rendered = pygame.Surface((len(text) * advance - 2 * scale, 7 * scale), pygame.SRCALPHA)
+        for i, char in enumerate(text):
+            if char in FONT_5X7:
+                rendered.blit(_render_glyph(char, scale, color), (i * advance, 0))
+        rendered = _finish_surface(rendered)
+        _text_cache.put(key, rendered)
+    return rendered
+
 
 class PixelArtist:
     """Creates true pixel art graphics drawn pixel by pixel."""
@@ -11,6 +485,9 @@ class PixelArtist:
     def draw_pixel_button(surface, rect, base_color, border_color, pressed=False, hovered=False):
         """Draw a pixel art button with slight rounding at corners.
         
+        The button is rendered once per look and then blitted from the
+        shared shape cache.
+        
         Args:
             surface: Pygame surface to draw on
             rect: Button rectangle (x, y, width, height)
@@ -20,6 +497,19 @@ class PixelArtist:
             hovered: Whether button is hovered
         """
         x, y, w, h = rect
+        key = ('button', w, h, tuple(base_color), tuple(border_color), pressed, hovered)
+        button = _shape_cache.get(key)
+        if button is None:
+            button = pygame.Surface((w, h), pygame.SRCALPHA)
+            PixelArtist._paint_button(button, w, h, base_color, border_color, pressed, hovered)
+            button = _finish_surface(button)
+            _shape_cache.put(key, button)
+        surface.blit(button, (x, y))
+
+    @staticmethod
+    def _paint_button(surface, w, h, base_color, border_color, pressed, hovered):
+        """Paint a button pixel by pixel onto a `w` x `h` surface."""
+        x = y = 0
         
         # Slightly adjust colors for hover effect
         if hovered and not pressed:
@@ -93,410 +583,10 @@ class PixelArtist:
             color: RGB color tuple
             size: 'small', 'medium', 'large'
         """
-        sizes = {'small': 1, 'medium': 2, 'large': 3}
-        scale = sizes.get(size, 2)
-        
-        # Simple 5x7 pixel font definitions
-        font_5x7 = {
-            'A': [
-                "  XXX  ",
-                " X   X ",
-                " X   X ",
-                " XXXXX ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-            ],
-            'B': [
-                " XXXX  ",
-                " X   X ",
-                " X   X ",
-                " XXXX  ",
-                " X   X ",
-                " X   X ",
-                " XXXX  ",
-            ],
-            'C': [
-                "  XXXX ",
-                " X     ",
-                " X     ",
-                " X     ",
-                " X     ",
-                " X     ",
-                "  XXXX ",
-            ],
-            'D': [
-                " XXXX  ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " XXXX  ",
-            ],
-            'E': [
-                " XXXXX ",
-                " X     ",
-                " X     ",
-                " XXXX  ",
-                " X     ",
-                " X     ",
-                " XXXXX ",
-            ],
-            'F': [
-                " XXXXX ",
-                " X     ",
-                " X     ",
-                " XXXX  ",
-                " X     ",
-                " X     ",
-                " X     ",
-            ],
-            'G': [
-                "  XXXX ",
-                " X     ",
-                " X     ",
-                " X  XX ",
-                " X   X ",
-                " X   X ",
-                "  XXXX ",
-            ],
-            'H': [
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " XXXXX ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-            ],
-            'I': [
-                " XXXXX ",
-                "   X   ",
-                "   X   ",
-                "   X   ",
-                "   X   ",
-                "   X   ",
-                " XXXXX ",
-            ],
-            'J': [
-                " XXXXX ",
-                "    X  ",
-                "    X  ",
-                "    X  ",
-                " X  X  ",
-                " X  X  ",
-                "  XX   ",
-            ],
-            'K': [
-                " X   X ",
-                " X  X  ",
-                " X X   ",
-                " XX    ",
-                " X X   ",
-                " X  X  ",
-                " X   X ",
-            ],
-            'L': [
-                " X     ",
-                " X     ",
-                " X     ",
-                " X     ",
-                " X     ",
-                " X     ",
-                " XXXXX ",
-            ],
-            'M': [
-                " X   X ",
-                " XX XX ",
-                " X X X ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-            ],
-            'N': [
-                " X   X ",
-                " XX  X ",
-                " X X X ",
-                " X  XX ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-            ],
-            'O': [
-                "  XXX  ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                "  XXX  ",
-            ],
-            'P': [
-                " XXXX  ",
-                " X   X ",
-                " X   X ",
-                " XXXX  ",
-                " X     ",
-                " X     ",
-                " X     ",
-            ],
-            'Q': [
-                "  XXX  ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " X X X ",
-                " X  X  ",
-                "  XX X ",
-            ],
-            'R': [
-                " XXXX  ",
-                " X   X ",
-                " X   X ",
-                " XXXX  ",
-                " X X   ",
-                " X  X  ",
-                " X   X ",
-            ],
-            'S': [
-                "  XXXX ",
-                " X     ",
-                " X     ",
-                "  XXX  ",
-                "     X ",
-                "     X ",
-                " XXXX  ",
-            ],
-            'T': [
-                " XXXXX ",
-                "   X   ",
-                "   X   ",
-                "   X   ",
-                "   X   ",
-                "   X   ",
-                "   X   ",
-            ],
-            'U': [
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                "  XXX  ",
-            ],
-            'V': [
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                "  X X  ",
-                "   X   ",
-            ],
-            'W': [
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                " X X X ",
-                " X X X ",
-                " XX XX ",
-                " X   X ",
-            ],
-            'X': [
-                " X   X ",
-                " X   X ",
-                "  X X  ",
-                "   X   ",
-                "  X X  ",
-                " X   X ",
-                " X   X ",
-            ],
-            'Y': [
-                " X   X ",
-                " X   X ",
-                " X   X ",
-                "  X X  ",
-                "   X   ",
-                "   X   ",
-                "   X   ",
-            ],
-            'Z': [
-                " XXXXX ",
-                "    X  ",
-                "   X   ",
-                "  X    ",
-                " X     ",
-                " X     ",
-                " XXXXX ",
-            ],
-            '0': [
-                "  XXX  ",
-                " X  XX ",
-                " X X X ",
-                " X X X ",
-                " X X X ",
-                " XX  X ",
-                "  XXX  ",
-            ],
-            '1': [
-                "   X   ",
-                "  XX   ",
-                "   X   ",
-                "   X   ",
-                "   X   ",
-                "   X   ",
-                " XXXXX ",
-            ],
-            '2': [
-                "  XXX  ",
-                " X   X ",
-                "     X ",
-                "    X  ",
-                "   X   ",
-                "  X    ",
-                " XXXXX ",
-            ],
-            '3': [
-                "  XXX  ",
-                " X   X ",
-                "     X ",
-                "   XX  ",
-                "     X ",
-                " X   X ",
-                "  XXX  ",
-            ],
-            '4': [
-                "    X  ",
-                "   XX  ",
-                "  X X  ",
-                " X  X  ",
-                " XXXXX ",
-                "    X  ",
-                "    X  ",
-            ],
-            '5': [
-                " XXXXX ",
-                " X     ",
-                " XXXX  ",
-                "     X ",
-                "     X ",
-                " X   X ",
-                "  XXX  ",
-            ],
-            '6': [
-                "  XXX  ",
-                " X     ",
-                " X     ",
-                " XXXX  ",
-                " X   X ",
-                " X   X ",
-                "  XXX  ",
-            ],
-            '7': [
-                " XXXXX ",
-                "     X ",
-                "    X  ",
-                "   X   ",
-                "   X   ",
-                "   X   ",
-                "   X   ",
-            ],
-            '8': [
-                "  XXX  ",
-                " X   X ",
-                " X   X ",
-                "  XXX  ",
-                " X   X ",
-                " X   X ",
-                "  XXX  ",
-            ],
-            '9': [
-                "  XXX  ",
-                " X   X ",
-                " X   X ",
-                "  XXXX ",
-                "     X ",
-                "    X  ",
-                "  XX   ",
-            ],
-            ':': [
-                "       ",
-                "       ",
-                "   X   ",
-                "       ",
-                "       ",
-                "   X   ",
-                "       ",
-            ],
-            ' ': [
-                "       ",
-                "       ",
-                "       ",
-                "       ",
-                "       ",
-                "       ",
-                "       ",
-            ],
-            '-': [
-                "       ",
-                "       ",
-                "       ",
-                " XXXXX ",
-                "       ",
-                "       ",
-                "       ",
-            ],
-            '(': [
-                "   X   ",
-                "  X    ",
-                " X     ",
-                " X     ",
-                " X     ",
-                "  X    ",
-                "   X   ",
-            ],
-            ')': [
-                "   X   ",
-                "    X  ",
-                "     X ",
-                "     X ",
-                "     X ",
-                "    X  ",
-                "   X   ",
-            ],
-            'x': [
-                "       ",
-                "       ",
-                " X   X ",
-                "  X X  ",
-                "   X   ",
-                "  X X  ",
-                " X   X ",
-            ],
-        }
-        
-        char_width = 7 * scale
-        char_height = 7 * scale
-        spacing = 2 * scale
-        
-        current_x = x
-        for char in text.upper():
-            if char in font_5x7:
-                pattern = font_5x7[char]
-                for row_idx, row in enumerate(pattern):
-                    for col_idx, pixel in enumerate(row):
-                        if pixel == 'X':
-                            # Draw scaled pixel
-                            for dy in range(scale):
-                                for dx in range(scale):
-                                    surface.set_at((
-                                        current_x + col_idx * scale + dx,
-                                        y + row_idx * scale + dy
-                                    ), color)
-            current_x += char_width + spacing
+        if not text:
+            return
+        scale = TEXT_SIZES.get(size, 2)
+        surface.blit(_render_text(text.upper(), scale, tuple(color)), (x, y))
     
     @staticmethod
     def draw_pixel_mine(surface, x, y, size):
@@ -563,13 +653,29 @@ class PixelArtist:
     def draw_smiley(surface, x, y, size, expression='happy'):
         """Draw a pixel art smiley face.
         
+        The face is rendered once per look and then blitted from the
+        shared shape cache.
+        
         Args:
             surface: Pygame surface
             x, y: Top-left position
             size: Size of smiley
             expression: 'happy', 'sad', 'neutral'
         """
-        color = settings.COLORS["accent"]
+        color = tuple(settings.COLORS["accent"])
+        key = ('smiley', size, expression, color)
+        smiley = _shape_cache.get(key)
+        if smiley is None:
+            smiley = pygame.Surface((size, size), pygame.SRCALPHA)
+            PixelArtist._paint_smiley(smiley, size, expression, color)
+            smiley = _finish_surface(smiley)
+            _shape_cache.put(key, smiley)
+        surface.blit(smiley, (x, y))
+
+    @staticmethod
+    def _paint_smiley(surface, size, expression, color):
+        """Paint a smiley pixel by pixel onto a `size` x `size` surface."""
+        x = y = 0
         
         # Face outline (square with slight rounding)
         face_pixels = []
@@ -667,8 +773,7 @@ def get_pixel_text_width(text, size='medium'):
     Returns:
         Width in pixels
     """
-    sizes = {'small': 1, 'medium': 2, 'large': 3}
-    scale = sizes.get(size, 2)
+    scale = TEXT_SIZES.get(size, 2)
     char_width = 7 * scale
     spacing = 2 * scale
     return len(text) * char_width + (len(text) - 1) * spacing
@@ -683,6 +788,5 @@ def get_pixel_text_height(size='medium'):
     Returns:
         Height in pixels
     """
-    sizes = {'small': 1, 'medium': 2, 'large': 3}
-    scale = sizes.get(size, 2)
+    scale = TEXT_SIZES.get(size, 2)
     return 7 * scale
@@ -0,0 +1,144 @@
+"""Pre-rendered tile sprites for drawing the board with one blit per tile."""
+
+import pygame
+import settings
+from core.state import TileState
+from ui.pixel_utils import draw_pixel_text
+
+
+class TileAtlas:
+    """Every tile state rendered once at a given tile size.
+
+    `surfaces[state]` is a `tileSize` x `tileSize` sprite for a
+    `TileState` value, including the background gap between tiles, so
+    drawing a tile is a single opaque blit.
+    """
+
+    # Pixels of background left between neighboring tiles
+    GAP = 2
+    BEVEL_SIZE = 2
+
+    def __init__(self, tileSize):
+        self.tileSize = tileSize
+        self.surfaces = [self._render(state) for state in range(TileState.COUNT)]
+
+    def _render(self, state):
+        """Draw one tile state in the game's pixel-art style."""
+        surface = pygame.Surface((self.tileSize, self.tileSize))
+        surface.fill(settings.COLORS["background"])
+        size = self.tileSize - self.GAP
+
+        if state == TileState.UNREVEALED:
+            self._drawBevelTile(surface, size)
+        elif state == TileState.FLAGGED:
+            self._drawBevelTile(surface, size)
+            self._drawPixelFlag(surface, size)
+        else:
+            exploded = state == TileState.EXPLODED
+            background = settings.COLORS["explosion"] if exploded else settings.COLORS["tile_revealed"]
+            # Revealed tile - flat with a sharp pixel border
+            pygame.draw.rect(surface, background, (0, 0, size, size))
+            pygame.draw.rect(surface, settings.COLORS["tile_border_dark"], (0, 0, size, size), 1)
+
+            if state in (TileState.MINE, TileState.EXPLODED):
+                color = settings.COLORS["text_inverse"] if exploded else settings.COLORS["mine"]
+                self._drawPixelMine(surface, size, color)
+            elif state > 0:
+                color = settings.NUMBER_COLORS.get(state, settings.COLORS["text_primary"])
+                num_str = str(state)
+                num_x = size // 2 - len(num_str) * 8
+                num_y = size // 2 - 7
+                draw_pixel_text(surface, num_str, num_x, num_y, color, size='medium')
+
+        # Match the display format so blits need no conversion
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def _drawBevelTile(self, surface, size):
+        """Draw an unrevealed tile with pixel-style raised bevel effect."""
+        bevel_size = self.BEVEL_SIZE
+        base_color = settings.COLORS["tile_unrevealed"]
+
+        # Light color for top-left bevel
+        light_color = (
+            min(255, base_color[0] + 30),
+            min(255, base_color[1] + 30),
+            min(255, base_color[2] + 30)
+        )
+
+        # Dark color for bottom-right bevel
+        dark_color = (
+            max(0, base_color[0] - 30),
+            max(0, base_color[1] - 30),
+            max(0, base_color[2] - 30)
+        )
+
+        # Draw base tile
+        pygame.draw.rect(surface, base_color, (bevel_size, bevel_size,
+                                               size - bevel_size * 2, size - bevel_size * 2))
+
+        # Draw top and left bevels (light)
+        for i in range(bevel_size):
+            pygame.draw.line(surface, light_color, (i, i), (size - 1 - i, i))
+            pygame.draw.line(surface, light_color, (i, i), (i, size - 1 - i))
+
+        # Draw bottom and right bevels (dark)
+        for i in range(bevel_size):
+            pygame.draw.line(surface, dark_color, (i, size - 1 - i), (size - 1 - i, size - 1 - i))
+            pygame.draw.line(surface, dark_color, (size - 1 - i, i), (size - 1 - i, size - 1 - i))
+
+    def _drawPixelMine(self, surface, size, mine_color):
+        """Draw a pixel art style mine."""
+        center_x = size // 2
+        center_y = size // 2
+        pixel_size = max(3, size // 8)
+
+        # Draw center body
+        body_rect = pygame.Rect(center_x - pixel_size, center_y - pixel_size,
+                                pixel_size * 2, pixel_size * 2)
+        pygame.draw.rect(surface, mine_color, body_rect)
+
+        # Draw spikes (cross pattern)
+        spike_length = pixel_size * 2
+        # Horizontal spike
+        pygame.draw.line(surface, mine_color,
+                         (center_x - spike_length, center_y),
+                         (center_x + spike_length, center_y), pixel_size)
+        # Vertical spike
+        pygame.draw.line(surface, mine_color,
+                         (center_x, center_y - spike_length),
+                         (center_x, center_y + spike_length), pixel_size)
+
+        # Diagonal spikes
+        diag_offset = int(spike_length * 0.7)
+        pygame.draw.line(surface, mine_color,
+                         (center_x - diag_offset, center_y - diag_offset),
+                         (center_x + diag_offset, center_y + diag_offset), pixel_size // 2)
+        pygame.draw.line(surface, mine_color,
+                         (center_x - diag_offset, center_y + diag_offset),
+                         (center_x + diag_offset, center_y - diag_offset), pixel_size // 2)
+
+    def _drawPixelFlag(self, surface, size):
+        """Draw a pixel art style flag."""
+        center_x = size // 2
+        base_y = size - 6
+        flag_color = settings.COLORS["flag"]
+        pole_color = settings.COLORS["text_secondary"]
+
+        # Flag pole
+        pole_height = size // 2
+        pole_width = max(2, size // 12)
+        pygame.draw.rect(surface, pole_color,
+                         (center_x - pole_width // 2, base_y - pole_height,
+                          pole_width, pole_height))
+
+        # Flag triangle
+        flag_height = size // 3
+        flag_width = size // 3
+        points = [
+            (center_x, 4),
+            (center_x + flag_width, 4 + flag_height // 2),
+            (center_x, 4 + flag_height)
+        ]
+        pygame.draw.polygon(surface, flag_color, points)
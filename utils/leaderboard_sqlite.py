@@ -0,0 +1,289 @@
+"""SQLite persistence for the leaderboard, keeping every game played."""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import settings
+from utils.leaderboard_storage import DEFAULT_LEADERBOARD_PATH, LeaderboardStorage
+
+
+# Default database location, next to the JSON leaderboard
+DEFAULT_DATABASE_PATH = DEFAULT_LEADERBOARD_PATH.with_suffix(".db")
+
+# Entry keys stored in their own columns; any others go in `extra` as JSON
+_COLUMNS = ("score", "difficulty", "date", "time_elapsed", "hints_used", "flags_used", "seed", "entry_id")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    difficulty TEXT NOT NULL,
+    date TEXT,
+    time_elapsed INTEGER,
+    hints_used INTEGER,
+    flags_used INTEGER,
+    seed INTEGER,
+    entry_id TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_difficulty_score ON scores (difficulty, score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_date ON scores (date);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SQLiteLeaderboardStorage:
+    """Leaderboard stored in an SQLite database with the full score history.
+
+    Has the same interface as `LeaderboardStorage`, plus per-difficulty,
+    rank and date-range queries. Every game is kept. Scores are indexed by
+    score, by (difficulty, score) and by date. Top-K queries therefore walk
+    an index instead of sorting, and saving a score is a single insert.
+
+    On first use, entries from an existing JSON leaderboard are imported
+    once. The connection is shared between threads (see `ScoreWriter`)
+    behind a lock. Steps that read before they write (the import, and
+    ranking a new score) run in `BEGIN IMMEDIATE` transactions, so other
+    processes using the same database can't write in between.
+    """
+
+    def __init__(self, filePath=None, jsonPath=None):
+        """Open (creating if needed) the database.
+
+        Args:
+            filePath: Database path. Defaults to ~/.pysweeper/leaderboard.db
+            jsonPath: JSON leaderboard to import on first use. Defaults to
+                      ~/.pysweeper/leaderboard.json
+        """
+        self.filePath = Path(filePath) if filePath else DEFAULT_DATABASE_PATH
+        self.filePath.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.filePath), check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        # Write-ahead logging: readers never wait for a writer
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        with self._transaction():
+            # Databases created before entry ids were stored lack the column
+            columns = {row["name"] for row in self._connection.execute("PRAGMA table_info(scores)")}
+            if "entry_id" not in columns:
+                self._connection.execute("ALTER TABLE scores ADD COLUMN entry_id TEXT")
+            self._connection.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS scores_by_entry_id ON scores (entry_id)")
+        self._version = 0
+        self._dataVersion = None
+        self._migrateJson(Path(jsonPath) if jsonPath else DEFAULT_LEADERBOARD_PATH)
+
+    @property
+    def version(self):
+        """Counter that increases whenever the stored scores change.
+
+        Writes made through other connections are detected with SQLite's
+        `PRAGMA data_version`, so this never reads the scores themselves.
+        """
+        with self._lock:
+            dataVersion = self._connection.execute("PRAGMA data_version").fetchone()[0]
+            if dataVersion != self._dataVersion:
+                self._dataVersion = dataVersion
+                self._version += 1
+            return self._version
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Hold the connection lock in a transaction that takes the write lock at once.
+
+        Commits on success and rolls back on an exception.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            yield
+
+    def _query(self, sql, params=()):
+        """Run a read query under the connection lock and return all rows."""
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def _migrateJson(self, jsonPath):
+        """Import the entries of a JSON leaderboard, once per database."""
+        with self._transaction():
+            if self._query("SELECT value FROM meta WHERE key = 'json_migrated'"):
+                return
+            # Also replays the journal; recent scores may only be there
+            entries = LeaderboardStorage(jsonPath).load()
+            self._insert(entries)
+            self._connection.execute(
+                "INSERT INTO meta (key, value) VALUES ('json_migrated', ?)", (str(jsonPath),))
+            self._version += 1
+
+    def _insert(self, entries):
+        """Insert score dictionaries; the caller commits."""
+        rows = []
+        for entry in entries:
+            extra = {key: value for key, value in entry.items() if key not in _COLUMNS}
+            rows.append((
+                entry.get("score", 0),
+                entry.get("difficulty", "Unknown"),
+                entry.get("date"),
+                entry.get("time_elapsed", 0),
+                entry.get("hints_used"),
+                entry.get("flags_used", 0),
+                entry.get("seed"),
+                entry.get("entry_id"),
+                json.dumps(extra, ensure_ascii=False) if extra else None,
+            ))
+        self._connection.executemany(
+            "INSERT INTO scores (score, difficulty, date, time_elapsed, hints_used, flags_used, seed, entry_id, extra)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    @staticmethod
+    def _toEntry(row):
+        """Turn a `scores` row back into a score dictionary."""
+        entry = {
+            "score": row["score"],
+            "difficulty": row["difficulty"],
+            "date": row["date"],
+            "time_elapsed": row["time_elapsed"],
+            "hints_used": None if row["hints_used"] is None else bool(row["hints_used"]),
+            "flags_used": row["flags_used"],
+            "seed": row["seed"],
+        }
+        if row["entry_id"] is not None:
+            entry["entry_id"] = row["entry_id"]
+        if row["extra"]:
+            entry.update(json.loads(row["extra"]))
+        return entry
+
+    def load(self):
+        """Load every stored entry.
+
+        Returns:
+            List of score dictionaries sorted by score (highest first).
+        """
+        rows = self._query("SELECT * FROM scores ORDER BY score DESC, id")
+        return [self._toEntry(row) for row in rows]
+
+    def save(self, entries):
+        """Replace all stored entries.
+
+        Args:
+            entries: List of score dictionaries to save.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM scores")
+            self._insert(entries)
+            self._version += 1
+
+    def addScore(self, scoreEntry):
+        """Store a new score entry.
+
+        Args:
+            scoreEntry: Dictionary containing score data (see
+                        `LeaderboardStorage.addScore`). An entry whose
+                        `entry_id` is already stored is not added again.
+
+        Returns:
+            int: The rank of the new score among all games (1-indexed), or
+                 -1 if outside the top `settings.LEADERBOARD_MAX_ENTRIES`.
+        """
+        maxEntries = settings.LEADERBOARD_MAX_ENTRIES
+        score = scoreEntry.get("score", 0)
+        with self._transaction():
+            entryId = scoreEntry.get("entry_id")
+            if entryId is not None and self._query("SELECT 1 FROM scores WHERE entry_id = ?", (entryId,)):
+                rank = self.getRank(score, limit=maxEntries)
+                return rank if rank <= maxEntries else -1
+            # Earlier games with an equal score keep the better rank
+            rank = self.getRank(score, inclusive=True, limit=maxEntries)
+            self._insert([scoreEntry])
+            self._version += 1
+        return rank if rank <= maxEntries else -1
+
+    def getTopScores(self, limit=10, difficulty=None):
+        """Retrieve top scores from the leaderboard.
+
+        Args:
+            limit: Maximum number of entries to return.
+            difficulty: Optional difficulty name ("Easy", ...) to filter by.
+
+        Returns:
+            List of score dictionaries sorted by score (highest first).
+        """
+        if difficulty is None:
+            rows = self._query(
+                "SELECT * FROM scores ORDER BY score DESC, id LIMIT ?", (limit,))
+        else:
+            rows = self._query(
+                "SELECT * FROM scores WHERE difficulty = ? ORDER BY score DESC, id LIMIT ?",
+                (difficulty, limit))
+        return [self._toEntry(row) for row in rows]
+
+    def getRank(self, score, difficulty=None, inclusive=False, limit=None):
+        """Return the rank a score has (or would have) on the leaderboard.
+
+        Counts stored scores above `score` along the score index. With a
+        `limit`, the count stops after `limit` scores, so checking for a
+        place in the top K costs O(log n + K) however long the history is.
+
+        Args:
+            score: Score value to rank.
+            difficulty: Optional difficulty name to rank within.
+            inclusive: Also count stored scores equal to `score`, as for a
+                       score that is about to be added after them.
+            limit: Optional cap on the scores counted.
+
+        Returns:
+            int: 1-indexed rank, or `limit + 1` if the rank is past `limit`.
+        """
+        comparison = ">=" if inclusive else ">"
+        if difficulty is None:
+            query, params = f"SELECT 1 FROM scores WHERE score {comparison} ?", [score]
+        else:
+            query = f"SELECT 1 FROM scores WHERE difficulty = ? AND score {comparison} ?"
+            params = [difficulty, score]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return self._query(f"SELECT COUNT(*) FROM ({query})", params)[0][0] + 1
+
+    def getScoresBetween(self, start=None, end=None):
+        """Return games played in a date range, oldest first.
+
+        Args:
+            start: Optional first date to include ("YYYY-MM-DD..." string).
+            end: Optional date to stop before, in the same format.
+
+        Returns:
+            List of score dictionaries ordered by date.
+        """
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("date >= ?")
+            params.append(start)
+        if end is not None:
+            conditions.append("date < ?")
+            params.append(end)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        rows = self._query(f"SELECT * FROM scores {where}ORDER BY date, id", params)
+        return [self._toEntry(row) for row in rows]
+
+    def countScores(self, difficulty=None):
+        """Return how many games are stored, optionally for one difficulty."""
+        if difficulty is None:
+            return self._query("SELECT COUNT(*) FROM scores")[0][0]
+        return self._query("SELECT COUNT(*) FROM scores WHERE difficulty = ?", (difficulty,))[0][0]
+
+    def clear(self):
+        """Clear all leaderboard entries."""
+        self.save([])
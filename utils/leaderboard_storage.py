@@ -2,99 +2,387 @@
 
 import json
 import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
 
+import settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
 
 # Default leaderboard file location
 DEFAULT_LEADERBOARD_PATH = Path.home() / ".pysweeper" / "leaderboard.json"
 
+# Reads of the files a reader tries before settling for one that raced a write
+_READ_ATTEMPTS = 3
+
+
+def _sortByScore(entries):
+    """Return entries sorted by score, highest first (stable for ties)."""
+    return sorted(entries, key=lambda x: x.get('score', 0), reverse=True)
+
+
+def _fsyncDirectory(path):
+    """Flush a directory entry change (a rename) to disk where supported."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return  # e.g. Windows, where directories can't be opened
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 
 class LeaderboardStorage:
-    """Handles loading and saving leaderboard data to JSON file."""
+    """Handles loading and saving leaderboard data to JSON file.
+
+    The leaderboard is a snapshot file (a JSON list) plus an append-only
+    journal next to it (one JSON entry per line). `addScore` only appends
+    the new entry to the journal and fsyncs it. After `compactEvery` journal
+    entries, the snapshot is rewritten: it goes to a temporary file, is
+    fsynced, replaces the old snapshot with `os.replace`, and then the
+    journal is emptied. Loading replays the journal on top of the snapshot.
+    A crash therefore leaves either the old or the new snapshot, never a
+    half-written one, and at worst a torn last journal line, which is
+    skipped. Entries carry an `entry_id`, so replaying a journal that was
+    already compacted adds nothing twice. A snapshot that still fails to
+    parse is moved aside to "<name>.corrupt" by the next writer instead of
+    being overwritten.
 
-    def __init__(self, filePath=None):
+    The parsed entries are kept in memory. The files are only read again
+    after another process changed them, which is detected by comparing
+    their inodes, modification times and sizes. The inode catches a
+    compaction even where timestamps are coarse, since `os.replace` always
+    swaps in a new file. That `stat()` check runs at most
+    once every `statIntervalMs`. Writes made through this object update the
+    cache directly. `version` increases whenever the cached entries change.
+
+    Methods are safe to call from several threads (see `ScoreWriter`) and
+    several processes. Writers hold an exclusive `fcntl` lock on a
+    ".lock" file next to the snapshot (where `fcntl` exists) while they
+    re-read the files, append and compact. No other process can then
+    compact away an entry it hasn't seen. Readers never take that lock. The
+    in-memory cache has its own lock, held only to swap entries in or out,
+    never during file I/O, so reading never waits for a writer. Readers
+    stamp the files before reading them and read again if the stamp
+    changed meanwhile, so a compaction between reading the snapshot and
+    the journal is never cached as the current leaderboard.
+    """
+
+    def __init__(self, filePath=None, statIntervalMs=None, maxEntries=None, compactEvery=None):
         """Initialize storage with optional custom file path.
 
         Args:
             filePath: Optional custom path for the leaderboard JSON file.
-                      Defaults to ~/.pysweeper/leaderboard.json
+                      Defaults to ~/.pysweeper/leaderboard.json. The journal
+                      is the same path with a ".journal" suffix.
+            statIntervalMs: Minimum time between checks of the files for
+                      outside changes. Defaults to
+                      settings.LEADERBOARD_STAT_INTERVAL_MS.
+            maxEntries: Number of top scores kept. Defaults to
+                      settings.LEADERBOARD_MAX_ENTRIES.
+            compactEvery: Journal entries that trigger a snapshot rewrite.
+                      Defaults to settings.LEADERBOARD_COMPACT_EVERY.
         """
         self.filePath = Path(filePath) if filePath else DEFAULT_LEADERBOARD_PATH
+        self.journalPath = self.filePath.with_suffix(".journal")
+        self.lockPath = self.filePath.with_suffix(".lock")
+        if statIntervalMs is None:
+            statIntervalMs = settings.LEADERBOARD_STAT_INTERVAL_MS
+        self.statInterval = statIntervalMs / 1000
+        self.maxEntries = settings.LEADERBOARD_MAX_ENTRIES if maxEntries is None else maxEntries
+        self.compactEvery = settings.LEADERBOARD_COMPACT_EVERY if compactEvery is None else compactEvery
+        self._entries = None
+        # (inode, mtime_ns, size) of the files the cache was read from
+        self._fileStamp = None
+        self._lastCheck = 0.0
+        # Entries in the journal, counted towards the next compaction
+        self._journalCount = 0
+        # False while the snapshot exists but can't be read, so it isn't overwritten
+        self._snapshotReadable = True
+        self._version = 0
+        # Guards the cache above; never held while waiting for a file lock
+        self._lock = threading.Lock()
+        # Keeps this process's writers apart (see `_writeLock`)
+        self._writerLock = threading.Lock()
         self._ensureDirectory()
 
+    @property
+    def version(self):
+        """Counter that increases whenever the stored entries change."""
+        self._refreshIfStale()
+        return self._version
+
     def _ensureDirectory(self):
         """Create parent directory if it doesn't exist."""
         self.filePath.parent.mkdir(parents=True, exist_ok=True)
 
-    def load(self):
-        """Load leaderboard entries from JSON file.
+    def _stampFiles(self):
+        """Return the (inode, mtime_ns, size) of the snapshot and journal (None if missing)."""
+        stamps = []
+        for path in (self.filePath, self.journalPath):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stamps.append(None)
+            else:
+                stamps.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        return tuple(stamps)
 
-        Returns:
-            List of score dictionaries sorted by score (highest first).
-            Returns empty list if file doesn't exist or is corrupted.
+    @contextmanager
+    def _writeLock(self):
+        """Hold the cross-process writer lock.
+
+        `lockf` locks belong to the whole process, so a thread lock first
+        keeps this process's writers apart. Neither is the cache lock, so
+        readers never wait for a writer blocked on another process.
+        """
+        with self._writerLock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.lockPath, 'a') as lockFile:
+                fcntl.lockf(lockFile.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.lockf(lockFile.fileno(), fcntl.LOCK_UN)
+
+    def _publish(self, entries, stamp, journalCount, snapshotReadable):
+        """Make entries read from, or just written to, the files the cached ones.
+
+        The caller holds the cache lock.
+        """
+        entries = tuple(entries)
+        if entries != self._entries:
+            self._version += 1
+        self._entries = entries
+        self._fileStamp = stamp
+        self._journalCount = journalCount
+        self._snapshotReadable = snapshotReadable
+        self._lastCheck = time.monotonic()
+
+    def _refreshIfStale(self, locked=False):
+        """Re-read the files if the cache is empty or they changed on disk.
+
+        The cache keeps the stamp taken before the read it came from. If a
+        write lands during the read, the stamps differ and the files are
+        read again, here and on later checks. The files are read without
+        the cache lock; a result is dropped if another thread published a
+        newer one meanwhile.
+
+        Args:
+            locked: The caller holds the writer lock. Check the files now
+                    instead of waiting for `statInterval`, and move a
+                    corrupt snapshot aside.
         """
-        if not self.filePath.exists():
-            return []
+        with self._lock:
+            now = time.monotonic()
+            if self._entries is not None and not locked and now - self._lastCheck < self.statInterval:
+                return
+            self._lastCheck = now
+            cached, knownStamp, snapshotReadable = self._entries, self._fileStamp, self._snapshotReadable
+
+        stamp = self._stampFiles()
+        if cached is not None and stamp == knownStamp and (snapshotReadable or not locked):
+            return
 
+        for _ in range(_READ_ATTEMPTS):
+            readStamp = stamp
+            entries, journalCount, snapshotReadable = self._readFiles(quarantine=locked)
+            stamp = self._stampFiles()
+            if stamp == readStamp:
+                break
+
+        with self._lock:
+            # Under the writer lock the files can't have changed since; a
+            # reader's result may be older than what was published meanwhile
+            if locked or self._fileStamp == knownStamp:
+                self._publish(entries, readStamp, journalCount, snapshotReadable)
+
+    def _readSnapshot(self, quarantine=False):
+        """Parse the snapshot file.
+
+        Args:
+            quarantine: Move a corrupt snapshot aside. Only done under the
+                        writer lock, so a new snapshot a writer has just
+                        swapped in is never the one moved.
+
+        Returns:
+            (entries, readable): `readable` is False when the snapshot
+            exists but was not parsed, so it must not be overwritten yet.
+        """
         try:
             with open(self.filePath, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                if isinstance(data, list):
-                    return sorted(data, key=lambda x: x.get('score', 0), reverse=True)
-                return []
-        except (json.JSONDecodeError, IOError, OSError):
-            return []
+        except FileNotFoundError:
+            return [], True
+        except OSError:
+            return [], False
+        except ValueError:
+            data = None
+
+        if not isinstance(data, list):
+            if not quarantine:
+                return [], False
+            # Keep the damaged file for recovery; the journal still replays
+            try:
+                os.replace(self.filePath, self.filePath.with_name(self.filePath.name + ".corrupt"))
+            except OSError:
+                return [], False
+            data = []
+        return data, True
+
+    def _readFiles(self, quarantine=False):
+        """Replay the journal over the snapshot.
+
+        Returns:
+            (entries, journalCount, snapshotReadable): the top entries, the
+            number of journal entries and whether the snapshot was read.
+        """
+        entries, snapshotReadable = self._readSnapshot(quarantine)
+        seen = {entry.get('entry_id') for entry in entries if entry.get('entry_id')}
+
+        journalCount = 0
+        try:
+            with open(self.journalPath, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Torn line from a crash mid-append
+                    if not isinstance(entry, dict):
+                        continue
+                    journalCount += 1
+                    entryId = entry.get('entry_id')
+                    if entryId is not None:
+                        if entryId in seen:
+                            continue
+                        seen.add(entryId)
+                    entries.append(entry)
+        except OSError:
+            pass
+        return _sortByScore(entries)[:self.maxEntries], journalCount, snapshotReadable
+
+    def load(self):
+        """Load leaderboard entries, from memory unless the files changed.
+
+        Returns:
+            List of score dictionaries sorted by score (highest first).
+            Returns empty list if there are no scores yet.
+        """
+        self._refreshIfStale()
+        return list(self._entries)
+
+    def _appendJournal(self, entry):
+        """Durably append one entry to the journal."""
+        with open(self.journalPath, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _writeSnapshot(self, entries):
+        """Atomically replace the snapshot with `entries` and empty the journal."""
+        tempPath = self.filePath.with_name(self.filePath.name + ".tmp")
+        with open(tempPath, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tempPath, self.filePath)
+        _fsyncDirectory(self.filePath.parent)
+        # A crash before this leaves journal entries the snapshot already has;
+        # their entry ids make the replay skip them
+        open(self.journalPath, 'w').close()
 
     def save(self, entries):
-        """Save leaderboard entries to JSON file.
+        """Replace all leaderboard entries.
+
+        Writes a new snapshot atomically and empties the journal.
 
         Args:
             entries: List of score dictionaries to save.
-                     Only top entries will be kept (based on config).
+                     Only the top `maxEntries` are kept.
+
+        Raises:
+            OSError: If the snapshot could not be written; the previous
+                     snapshot and journal are left intact.
         """
         self._ensureDirectory()
-
-        try:
-            with open(self.filePath, 'w', encoding='utf-8') as f:
-                json.dump(entries, f, indent=2, ensure_ascii=False)
-        except (IOError, OSError):
-            pass  # Silently fail on write errors
+        with self._writeLock():
+            entries = _sortByScore(entries)[:self.maxEntries]
+            self._writeSnapshot(entries)
+            stamp = self._stampFiles()
+            with self._lock:
+                self._publish(entries, stamp, 0, True)
 
     def addScore(self, scoreEntry):
         """Add a new score entry and maintain top entries limit.
 
+        Appends the entry to the journal; every `compactEvery` entries the
+        journal is compacted into the snapshot.
+
         Args:
             scoreEntry: Dictionary containing score data with keys:
                         - score: int (required)
                         - difficulty: str (required)
                         - date: str in ISO format (required)
                         - time_elapsed: int seconds (required)
+                        - entry_id: str (optional) unique id, generated if
+                          missing; adding an entry whose id is already
+                          stored changes nothing
 
         Returns:
-            int: The rank of the new score (1-indexed), or -1 if not in top 10.
+            int: The rank of the new score (1-indexed), or -1 if not in
+                 the top `maxEntries`.
+
+        Raises:
+            OSError: If the entry could not be written to the journal.
         """
-        entries = self.load()
+        self._ensureDirectory()
+        with self._writeLock():
+            # Pick up entries other processes added since the last check
+            self._refreshIfStale(locked=True)
+            with self._lock:
+                entries = list(self._entries)
+                journalCount, snapshotReadable = self._journalCount, self._snapshotReadable
 
-        # Add new entry
-        entries.append(scoreEntry)
+            entryId = scoreEntry.get('entry_id')
+            if entryId is not None:
+                for i, entry in enumerate(entries):
+                    if entry.get('entry_id') == entryId:
+                        return i + 1
 
-        # Sort by score descending
-        entries = sorted(entries, key=lambda x: x.get('score', 0), reverse=True)
+            newEntry = dict(scoreEntry)
+            newEntry.setdefault('entry_id', uuid.uuid4().hex)
+            self._appendJournal(newEntry)
+            journalCount += 1
 
-        # Find rank of new entry
-        rank = -1
-        for i, entry in enumerate(entries):
-            if entry == scoreEntry and rank == -1:
-                rank = i + 1
-                break
+            # Sort by score descending; equal scores keep their earlier rank
+            entries = _sortByScore(entries + [newEntry])
+            rank = next(i for i, entry in enumerate(entries) if entry is newEntry) + 1
+            entries = entries[:self.maxEntries]
 
-        # Keep only top entries
-        maxEntries = 10
-        entries = entries[:maxEntries]
+            if journalCount >= self.compactEvery and snapshotReadable:
+                try:
+                    self._writeSnapshot(entries)
+                except OSError:
+                    pass  # The entry is safe in the journal; compact next time
+                else:
+                    journalCount = 0
+            stamp = self._stampFiles()
+            with self._lock:
+                self._publish(entries, stamp, journalCount, snapshotReadable)
 
-        self.save(entries)
-
-        return rank if rank <= maxEntries else -1
+            return rank if rank <= self.maxEntries else -1
 
     def getTopScores(self, limit=10):
         """Retrieve top scores from the leaderboard.
@@ -112,3 +400,28 @@ class LeaderboardStorage:
         """Clear all leaderboard entries."""
         self._ensureDirectory()
         self.save([])
+
+
+LEADERBOARD_BACKENDS = ("json", "sqlite")
+
+
+def createLeaderboardStorage(backend=None, filePath=None):
+    """Create leaderboard storage with the requested backend.
+
+    Args:
+        backend: "json" for `LeaderboardStorage` (top scores in a JSON file)
+                 or "sqlite" for `SQLiteLeaderboardStorage` (every game, in
+                 an SQLite database). Defaults to `settings.LEADERBOARD_BACKEND`.
+        filePath: Optional storage path, passed on to the storage class.
+
+    Raises:
+        ValueError: For an unknown backend name.
+    """
+    if backend is None:
+        backend = settings.LEADERBOARD_BACKEND
+    if backend == "json":
+        return LeaderboardStorage(filePath)
+    if backend == "sqlite":
+        from utils.leaderboard_sqlite import SQLiteLeaderboardStorage
+        return SQLiteLeaderboardStorage(filePath)
+    raise ValueError(f"Unknown leaderboard backend {backend!r}; expected one of {LEADERBOARD_BACKENDS}")
@@ -0,0 +1,184 @@
+"""Background thread that persists scores without blocking the game loop."""
+
+import json
+import os
+import queue
+import threading
+import uuid
+from concurrent.futures import Future
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+def _readSpool(spool):
+    """Return the entries in an open spool that were never marked done, in order."""
+    entries = {}
+    for line in spool:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue  # Line cut short by a kill mid-write
+        if "entry" in record:
+            entries[record["entry"]["entry_id"]] = record["entry"]
+        elif "done" in record:
+            entries.pop(record["done"], None)
+    return list(entries.values())
+
+
+class ScoreWriter:
+    """Saves score entries to leaderboard storage on a background thread.
+
+    `submit` returns at once with a `Future` that resolves to the rank
+    `storage.addScore` returns. Entries wait in a bounded queue, so a slow
+    disk delays only the writer thread.
+
+    Every submitted entry gets a unique `entry_id` and is first appended to
+    this writer's own spool file next to the storage. Once stored, it is
+    marked done there. Each running writer holds an `fcntl` lock on its
+    spool (where `fcntl` exists). A new `ScoreWriter` takes over the spools
+    nobody holds, i.e. those left by a killed process, and submits their
+    unfinished entries again. The storage ignores an `entry_id` it already
+    has, so replaying is safe. A writer never touches another's spool while
+    that one is running.
+    """
+
+    def __init__(self, storage, spoolPath=None, maxPending=64):
+        """Take over unfinished entries from abandoned spools and start the writer thread.
+
+        Args:
+            storage: Leaderboard storage the scores are added to.
+            spoolPath: Base spool path. Defaults to the storage path with a
+                       ".spool" suffix. Each writer spools to this name
+                       with a unique id added, e.g. "leaderboard.<id>.spool".
+            maxPending: Most entries queued before `submit` waits for the writer.
+        """
+        self.storage = storage
+        basePath = Path(spoolPath) if spoolPath else Path(storage.filePath).with_suffix(".spool")
+        self.spoolPath = basePath.with_name(f"{basePath.stem}.{uuid.uuid4().hex}{basePath.suffix}")
+        self._queue = queue.Queue(maxsize=maxPending)
+        self._spoolLock = threading.Lock()
+
+        # Lock the spool before it appears under a name other writers look for
+        newPath = self.spoolPath.with_name(self.spoolPath.name + ".new")
+        self._spool = open(newPath, "w", encoding="utf-8")
+        if fcntl is not None:
+            # flock, unlike lockf, also keeps out writers in this process
+            fcntl.flock(self._spool.fileno(), fcntl.LOCK_EX)
+        os.replace(newPath, self.spoolPath)
+        unfinished = self._adoptSpools(basePath)
+        for entry in unfinished:
+            self._appendSpool({"entry": entry})
+        # Entries in the spool that are not marked done yet
+        self._pending = len(unfinished)
+
+        self._thread = threading.Thread(target=self._run, name="ScoreWriter", daemon=True)
+        self._thread.start()
+        for entry in unfinished:
+            self._queue.put((entry, Future()))
+
+    def _adoptSpools(self, basePath):
+        """Collect unfinished entries from spools no running writer holds, deleting them.
+
+        Returns:
+            List of the entries, to be spooled again and stored.
+        """
+        entries = []
+        candidates = [basePath] + sorted(basePath.parent.glob(f"{basePath.stem}.*{basePath.suffix}"))
+        for path in candidates:
+            if path == self.spoolPath:
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as spool:
+                    if fcntl is not None:
+                        try:
+                            fcntl.flock(spool.fileno(), fcntl.LOCK_SH | fcntl.LOCK_NB)
+                        except OSError:
+                            continue  # Its writer is still running
+                    # Another new writer may have taken it over meanwhile
+                    if not os.path.samestat(os.fstat(spool.fileno()), os.stat(path)):
+                        continue
+                    unfinished = _readSpool(spool)
+                    # Without fcntl this fails while the file is open elsewhere
+                    os.remove(path)
+            except OSError:
+                continue
+            entries.extend(unfinished)
+        return entries
+
+    def _appendSpool(self, record):
+        self._spool.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._spool.flush()
+
+    def submit(self, scoreEntry):
+        """Queue a score entry to be stored in the background.
+
+        Args:
+            scoreEntry: Score dictionary for `storage.addScore`. A copy with
+                        an `entry_id` added is what gets stored.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the entry's rank, or to the
+            exception `addScore` raised. Callbacks run on the writer thread.
+        """
+        entry = dict(scoreEntry)
+        entry.setdefault("entry_id", uuid.uuid4().hex)
+        future = Future()
+        with self._spoolLock:
+            self._appendSpool({"entry": entry})
+            self._pending += 1
+        self._queue.put((entry, future))
+        return future
+
+    def _run(self):
+        """Writer thread: store queued entries until `close` sends None."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                entry, future = item
+                try:
+                    rank = self.storage.addScore(entry)
+                except Exception as error:
+                    # Left unfinished in the spool, so the next start retries it
+                    future.set_exception(error)
+                else:
+                    self._markDone(entry["entry_id"])
+                    future.set_result(rank)
+            finally:
+                self._queue.task_done()
+
+    def _markDone(self, entryId):
+        """Record a stored entry in the spool, emptying it once nothing is pending."""
+        with self._spoolLock:
+            self._pending -= 1
+            if self._pending:
+                self._appendSpool({"done": entryId})
+            else:
+                # Rewind too: a "w" file keeps writing at the old offset
+                self._spool.seek(0)
+                self._spool.truncate()
+
+    def flush(self):
+        """Block until every submitted entry has been processed."""
+        self._queue.join()
+
+    def close(self):
+        """Store everything still queued, then stop the writer thread.
+
+        The spool is deleted unless entries failed to store; those are
+        retried by the next `ScoreWriter`.
+        """
+        self._queue.put(None)
+        self._thread.join()
+        with self._spoolLock:
+            if not self._pending:
+                try:
+                    os.remove(self.spoolPath)
+                except OSError:
+                    pass
+            self._spool.close()